@@ -0,0 +1,45 @@
+"""
+기존 Place 문서에 GeoJSON location 필드 채우기
+
+latitude/longitude는 있지만 location이 없는 문서를 한 번의 update_many로 갱신합니다.
+2dsphere 인덱스는 app_init(init_beanie) 시 생성됩니다.
+"""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.database import app_init
+from src.model.place import Place
+
+
+async def main():
+    await app_init()
+
+    result = await Place.get_pymongo_collection().update_many(
+        {
+            "location": None,
+            "latitude": {"$type": "number"},
+            "longitude": {"$type": "number"},
+        },
+        [
+            # updated_at: 실행 중인 서버의 PlaceIndex가 다음 갱신 때 다시 읽도록
+            {"$set": {
+                "location": {"type": "Point", "coordinates": ["$longitude", "$latitude"]},
+                "updated_at": datetime.now(),
+            }},
+        ],
+    )
+    total = await Place.find_all().count()
+    with_location = await Place.find(Place.location != None).count()
+
+    print(f"✅ location 갱신: {result.modified_count}개")
+    print(f"📍 좌표 보유 장소: {with_location} / {total}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,240 @@
+"""
+전체 엔드포인트 E2E 지연 시간 벤치마크
+
+src.main:app을 프로세스 안에서(httpx ASGITransport) 실행하고, 가짜 LLM과 메모리 MongoDB로
+실제 사용자 흐름을 동시에 재현합니다.
+
+    /traits -> /perpose -> /recommend -> /people -> /day -> /options(2회) -> /planner
+
+엔드포인트별 p50/p95/p99와 처리량을 출력하며, --output으로 결과를 저장하고
+--baseline으로 이전 결과와 비교해 성능 회귀를 확인할 수 있습니다.
+
+DB 옵션:
+    --mongo memory (기본값): mongomock-motor 메모리 DB, data/*.csv 장소를 적재 (pip install mongomock-motor)
+    --mongo url: MONGO_URL / DB_NAME의 실제 MongoDB 사용 (장소 데이터가 적재되어 있어야 함)
+
+LLM 옵션:
+    기본값: 고정 응답을 --latency / --planner-latency 지연으로 반환
+    --recordings FILE: --record로 기록한 실제 응답을 기록된 지연 시간 x --latency-scale로 재생
+    --record FILE: 실제 OpenAI 모델로 흐름을 1회 실행해 응답/지연 시간을 기록 (OPENAI_KEY 필요)
+
+사용 예:
+    python scripts/bench_endpoints.py --sessions 50 --concurrency 10
+    python scripts/bench_endpoints.py --output bench.json
+    python scripts/bench_endpoints.py --baseline bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_event_loop import percentile
+from fake_llm import install_fake_llm, install_recorder
+
+ENDPOINTS = ["/traits", "/perpose", "/recommend", "/people", "/day", "/options", "/planner"]
+
+# 세션마다 무작위로 고르는 사용자 입력
+DESTINATIONS = ["일본", "제주도", "파리", "교토", "유럽", "스위스", "발리", "뉴욕"]
+PURPOSES = ["문화 체험과 맛집 탐방", "조용히 쉬고 싶어요", "사진 찍기 좋은 곳", "아이와 함께 가족 여행"]
+PEOPLE = ["1명", "2명", "4명"]
+DAYS = ["1박 2일", "2박 3일", "3일"]
+OPTIONS = ["걷기 위주로", "대중교통 이용", "매운 음식 제외", "반려동물 동반"]
+
+
+async def use_memory_mongo():
+    """app_init이 mongomock-motor 메모리 DB를 사용하도록 교체하고 장소 데이터 적재"""
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit("mongomock-motor가 필요합니다: pip install mongomock-motor (또는 --mongo url)")
+
+    import upload_csv
+    from beanie import init_beanie
+    from src.database import database
+    from src.model.place import Place
+
+    client = AsyncMongoMockClient()
+    database.AsyncIOMotorClient = lambda *args, **kwargs: client
+    database.DB_NAME = database.DB_NAME or "odegano_bench"
+
+    # 장소 데이터를 배치 upsert 대신 insert_many로 바로 적재 (인덱스는 적재 후 app_init에서 생성)
+    await init_beanie(database=client[database.DB_NAME], document_models=[Place], skip_indexes=True)
+    coord_stats = {"ok": 0, "swapped": 0, "missing": 0, "invalid": 0, "out_of_bounds": 0}
+    seen = set()
+    for path, place_type in [("tourist_spots.csv", "관광지"), ("historic_sites.csv", "유적지")]:
+        csv_path = project_root / "data" / path
+        if not csv_path.exists():
+            continue
+        encoding = upload_csv.detect_encoding(str(csv_path))
+        for batch in upload_csv.batched(upload_csv.iter_places(str(csv_path), place_type, encoding, coord_stats), 1000):
+            # 원본의 중복 행은 upsert처럼 source_key 기준으로 하나만 적재
+            documents = []
+            for data in batch:
+                if data["source_key"] not in seen:
+                    seen.add(data["source_key"])
+                    documents.append(Place(**data).model_dump(exclude={"id", "revision_id"}))
+            if documents:
+                await Place.get_pymongo_collection().insert_many(documents)
+    print(f"메모리 DB에 장소 {len(seen)}개 적재\n")
+
+
+class Recorder:
+    """엔드포인트별 지연 시간(ms)과 실패 수 집계"""
+
+    def __init__(self):
+        self.latencies = {endpoint: [] for endpoint in ENDPOINTS}
+        self.errors = {endpoint: 0 for endpoint in ENDPOINTS}
+
+    async def call(self, client, endpoint: str, **kwargs):
+        start = time.perf_counter()
+        response = await client.post(endpoint, **kwargs)
+        self.latencies[endpoint].append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            self.errors[endpoint] += 1
+            raise RuntimeError(f"{endpoint} {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+
+async def run_session(client, recorder: Recorder, rng: random.Random):
+    """사용자 한 명의 전체 흐름"""
+    recent = await recorder.call(client, "/traits", params={"places": rng.choice(DESTINATIONS)})
+    recent_id = recent["_id"]
+
+    await recorder.call(client, "/perpose", params={"id": recent_id, "reason": rng.choice(PURPOSES)})
+    recommendations = await recorder.call(client, "/recommend", params={"id": recent_id, "limit": 5})
+    await recorder.call(client, "/people", params={"id": recent_id, "people": rng.choice(PEOPLE)})
+    await recorder.call(client, "/day", params={"id": recent_id, "day": rng.choice(DAYS)})
+    await recorder.call(client, "/options", params={"id": recent_id, "options": rng.choice(OPTIONS)})
+    await recorder.call(client, "/options", params={"id": recent_id, "options": "없어요"})
+
+    # 위경도가 있는 첫 추천 장소를 메인 여행지로 선택
+    places = [p for p in recommendations["places"] if p.get("latitude") is not None]
+    place = places[0] if places else {
+        "name": "샘플 여행지", "address": "전라남도 담양군", "latitude": 35.321, "longitude": 126.988,
+    }
+    main_place = {**place, "reason": "추천 장소 중 첫 번째"}
+    await recorder.call(client, "/planner", params={"id": recent_id, "background": False}, json=main_place)
+
+
+def summarize(recorder: Recorder, elapsed: float, sessions: int) -> dict:
+    endpoints = {}
+    for endpoint in ENDPOINTS:
+        values = recorder.latencies[endpoint]
+        if not values:
+            continue
+        endpoints[endpoint] = {
+            "count": len(values),
+            "errors": recorder.errors[endpoint],
+            "p50": statistics.median(values),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+    requests = sum(len(v) for v in recorder.latencies.values())
+    return {
+        "sessions": sessions,
+        "elapsed_s": elapsed,
+        "sessions_per_s": sessions / elapsed,
+        "requests_per_s": requests / elapsed,
+        "endpoints": endpoints,
+    }
+
+
+def print_report(result: dict, baseline: dict = None):
+    print(
+        f"세션 {result['sessions']}개, {result['elapsed_s']:.1f}초 "
+        f"(세션 {result['sessions_per_s']:.2f}/s, 요청 {result['requests_per_s']:.1f}/s)\n"
+    )
+    header = f"{'엔드포인트':<12} {'요청':>6} {'실패':>5} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}"
+    if baseline:
+        header += f" {'p95 변화':>10}"
+    print(header)
+    for endpoint, stats in result["endpoints"].items():
+        line = (
+            f"{endpoint:<12} {stats['count']:>6} {stats['errors']:>5} "
+            f"{stats['p50']:>9.1f} {stats['p95']:>9.1f} {stats['p99']:>9.1f}"
+        )
+        base = (baseline or {}).get("endpoints", {}).get(endpoint)
+        if base:
+            line += f" {(stats['p95'] - base['p95']) / base['p95'] * 100:>+9.1f}%"
+        print(line)
+
+
+async def run(args):
+    if args.record:
+        recorder_callback = install_recorder()
+    else:
+        # 기록에 없는 응답은 --latency / --planner-latency 지연의 고정 응답 사용
+        install_fake_llm(
+            latency=args.latency,
+            planner_latency=args.planner_latency,
+            recordings=args.recordings,
+            latency_scale=args.latency_scale,
+        )
+
+    # 시작 시 explain 리포트는 mongomock에서 지원하지 않으므로 생략
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+    if args.mongo == "memory":
+        await use_memory_mongo()
+
+    import httpx
+    from src.main import app
+
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    sessions = 1 if args.record else args.sessions
+    queue = asyncio.Queue()
+    for _ in range(sessions):
+        queue.put_nowait(None)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+            async def worker():
+                while not queue.empty():
+                    queue.get_nowait()
+                    try:
+                        await run_session(client, recorder, rng)
+                    except RuntimeError as e:
+                        print(f"  ⚠️  {e}")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - start
+
+    if args.record:
+        recorder_callback.save(args.record)
+        print(f"응답 {len(recorder_callback.responses)}개 기록: {args.record}")
+        return
+
+    result = summarize(recorder, elapsed, sessions)
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    print_report(result, baseline)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=30, help="실행할 전체 사용자 흐름 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시에 진행할 사용자 수")
+    parser.add_argument("--latency", type=float, default=1.0, help="가짜 LLM 호출당 지연(초)")
+    parser.add_argument("--planner-latency", type=float, default=5.0, help="가짜 planner LLM 지연(초)")
+    parser.add_argument("--recordings", help="기록된 LLM 응답 파일 (--record로 생성)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="기록된 지연 시간 배율")
+    parser.add_argument("--record", help="실제 모델 응답을 기록할 파일 경로 (OPENAI_KEY 필요)")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    parser.add_argument("--seed", type=int, default=0, help="사용자 입력 난수 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,107 @@
+"""
+/planner 호출이 진행 중일 때 /day 응답 지연 측정 벤치마크
+
+가짜 LLM(고정 지연)을 사용하므로 OpenAI 키는 필요 없습니다.
+
+MongoDB 옵션:
+    --mongo memory (기본값): mongomock-motor 메모리 DB, data/*.csv 장소를 적재 (pip install mongomock-motor)
+    --mongo url: MONGO_URL / DB_NAME의 실제 MongoDB 사용
+
+사용 예:
+    python scripts/bench_event_loop.py --planners 8 --planner-latency 5
+    python scripts/bench_event_loop.py --legacy   # 동기 invoke 동작 재현
+    python scripts/bench_event_loop.py --mongo url
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def measure(app, recent, args) -> list[float]:
+    """/planner를 동시에 실행하는 동안 /day를 일정 간격으로 보내 지연(ms) 측정"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def planner_call(i: int):
+            # 여행지를 다르게 해 중복 요청 합치기 없이 각각 생성되도록
+            main_place = {"name": f"샘플 여행지 {i}", "address": "전라남도 담양군", "latitude": 35.3, "longitude": 126.9}
+            response = await client.post("/planner", params={"id": str(recent.id), "background": False}, json=main_place)
+            response.raise_for_status()
+
+        planners = [asyncio.create_task(planner_call(i)) for i in range(args.planners)]
+
+        # 예정된 전송 시각 기준으로 지연을 측정 (루프가 막힌 시간도 포함)
+        latencies = []
+        start = time.perf_counter()
+        deadline = start + args.duration
+        i = 0
+        while time.perf_counter() < deadline and not all(t.done() for t in planners):
+            scheduled = start + i * args.interval
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await client.post("/day", params={"id": str(recent.id), "day": "3일"})
+            latencies.append((time.perf_counter() - scheduled) * 1000)
+            i += 1
+
+        await asyncio.gather(*planners)
+    return latencies
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm(planner_latency=args.planner_latency, block_event_loop=args.legacy)
+
+    # 시작 시 explain 리포트는 mongomock에서 지원하지 않으므로 생략
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+
+    import httpx
+    from src.main import app
+    from src.model.chat import Recent
+
+    # 장소 인덱스, HTTP 클라이언트 등 서버 시작 상태에서 측정
+    async with app.router.lifespan_context(app):
+        recent = Recent(categories={"place": "일본", "primary_traits": ["온천"]}, day="3일")
+        await recent.insert()
+        latencies = await measure(app, recent, args)
+
+    mode = "legacy(blocking)" if args.legacy else "async executor"
+    print(f"모드: {mode}, 동시 /planner: {args.planners}, LLM 지연: {args.planner_latency}s")
+    if not latencies:
+        print("측정된 /day 요청이 없습니다.")
+        return
+    print(f"/day 요청 수: {len(latencies)}")
+    print(f"p50: {statistics.median(latencies):.1f} ms")
+    print(f"p95: {percentile(latencies, 95):.1f} ms")
+    print(f"p99: {percentile(latencies, 99):.1f} ms")
+    print(f"max: {max(latencies):.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--planners", type=int, default=8, help="동시에 실행할 /planner 요청 수")
+    parser.add_argument("--planner-latency", type=float, default=5.0, help="가짜 planner LLM 지연(초)")
+    parser.add_argument("--duration", type=float, default=30.0, help="최대 측정 시간(초)")
+    parser.add_argument("--interval", type=float, default=0.05, help="/day 요청 간격(초)")
+    parser.add_argument("--legacy", action="store_true", help="LLM 호출이 이벤트 루프를 막도록 설정")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    asyncio.run(run(parser.parse_args()))
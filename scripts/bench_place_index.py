@@ -0,0 +1,99 @@
+"""
+장소 후보 조회 벤치마크: 메모리 PlaceIndex vs MongoDB 정규식 조회
+
+주변 장소 조회(find_nearby_places)는 2dsphere 인덱스($nearSphere) 조회와
+메모리 인덱스 격자 검색(DB를 쓸 수 없을 때의 대체 경로)의 응답 시간과 결과 일치를 비교합니다.
+
+사용 예:
+    python scripts/bench_place_index.py --repeat 50
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.database import app_init
+from src.model.place import Place
+from src.search.place_index import find_nearby_places, place_index
+
+QUERIES = ["전라남도", "서울", "제주", "담양", "경주", "부산", "일본", "파리"]
+
+# (이름, 위도, 경도)
+NEARBY_POINTS = [
+    ("서울시청", 37.5663, 126.9779),
+    ("담양", 35.3211, 126.9882),
+    ("경주", 35.8562, 129.2247),
+    ("성산일출봉", 33.4580, 126.9420),
+]
+
+
+async def mongo_lookup(place_name: str) -> list[Place]:
+    """기존 recommend_places의 조회 경로"""
+    return await Place.find(
+        {
+            "type": "관광지",
+            "$or": [
+                {"region": {"$regex": place_name, "$options": "i"}},
+                {"address": {"$regex": place_name, "$options": "i"}},
+            ],
+        },
+        Place.address != None,
+        Place.address != ""
+    ).limit(30).to_list()
+
+
+async def run(args):
+    await app_init()
+
+    start = time.perf_counter()
+    await place_index.load()
+    print(f"인덱스 로드: {len(place_index)}개 장소, {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    print(f"{'쿼리':<8} {'Mongo(ms)':>10} {'Index(us)':>10} {'결과 수':>12}")
+    for query in QUERIES:
+        mongo_times, index_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            mongo_result = await mongo_lookup(query)
+            mongo_times.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            index_result = place_index.search(query, place_type="관광지", limit=30)
+            index_times.append((time.perf_counter() - start) * 1_000_000)
+
+        print(
+            f"{query:<8} {statistics.median(mongo_times):>10.2f} {statistics.median(index_times):>10.1f} "
+            f"{len(mongo_result):>5} / {len(index_result):<5}"
+        )
+
+    print(f"\n{'주변 조회':<8} {'2dsphere(ms)':>12} {'Grid(us)':>10} {'결과 수':>12}  상위 일치")
+    for name, latitude, longitude in NEARBY_POINTS:
+        geo_times, grid_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            geo_result = await find_nearby_places(latitude, longitude, args.radius, args.limit)
+            geo_times.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            grid_result = place_index.nearby(latitude, longitude, args.radius, args.limit)
+            grid_times.append((time.perf_counter() - start) * 1_000_000)
+
+        same = [p.id for p, _ in geo_result] == [p.id for p, _ in grid_result]
+        print(
+            f"{name:<8} {statistics.median(geo_times):>12.2f} {statistics.median(grid_times):>10.1f} "
+            f"{len(geo_result):>5} / {len(grid_result):<5}  {'✅' if same else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리당 반복 횟수")
+    parser.add_argument("--radius", type=float, default=30.0, help="주변 조회 반경 (km)")
+    parser.add_argument("--limit", type=int, default=15, help="주변 조회 최대 개수")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,127 @@
+"""
+GET /planner/{recent_id} 응답 캐시 / ETag 벤치마크
+
+여행 기간별로 계획을 저장한 뒤 다음 세 경우의 응답 시간을 비교합니다.
+    - miss: 캐시를 비운 뒤 조회 (작업 상태 + 계획 DB 조회, pydantic 직렬화)
+    - hit: 캐시된 JSON bytes 응답
+    - 304: If-None-Match에 ETag를 보낸 조회 (본문 없음)
+또 응답 본문이 기존 응답(FastAPI 기본 직렬화)과 같은지, 하루 일정 수정과
+재생성 작업 등록 후(다른 워커에서 등록되어 이 워커의 캐시가 무효화되지 않은 경우 포함)
+이전 계획이 응답되지 않는지 확인합니다.
+
+사용 예:
+    python scripts/bench_planner_get.py
+    python scripts/bench_planner_get.py --days 3 14 30 --repeat 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm, sample_travel_plan
+
+
+async def timed(client, url: str, repeat: int, before=None, **kwargs) -> tuple:
+    """요청을 repeat번 보내고 (p50 ms, 마지막 응답) 반환 (before: 요청마다 먼저 실행할 함수)"""
+    times = []
+    response = None
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        response = await client.get(url, **kwargs)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), response
+
+
+async def check_trip(client, days: int, repeat: int) -> dict:
+    from fastapi.encoders import jsonable_encoder
+    from src.chain.planner.cache import planner_cache
+    from src.chain.planner.extractor import get_travel_plan
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+    from src.model.planner_job import PlannerJob
+
+    recent = Recent(categories={"place": "교토", "primary_traits": ["정원"]}, day=f"{days}일", finished=True)
+    await recent.insert()
+    await Planner(recent_id=recent.id, **sample_travel_plan(days)).insert()
+    url = f"/planner/{recent.id}"
+
+    miss_ms, response = await timed(client, url, repeat, before=planner_cache.clear)
+    expected = jsonable_encoder(await get_travel_plan(recent.id))
+    same_body = response.json() == expected
+    etag = response.headers["etag"]
+    hit_ms, _ = await timed(client, url, repeat)
+    not_modified_ms, not_modified = await timed(client, url, repeat, headers={"If-None-Match": etag})
+
+    # 하루 일정 수정 후에는 새 ETag와 새 본문
+    await client.patch(f"{url}/days/1")
+    edited = await client.get(url, headers={"If-None-Match": etag})
+    # 다른 워커에서 재생성 작업이 등록된 경우 (이 워커의 캐시는 무효화되지 않음)
+    await client.get(url)
+    await PlannerJob(recent_id=recent.id, main_place={"name": "죽녹원"}, status="queued").insert()
+    other_worker = await client.get(url)
+    await PlannerJob.find(PlannerJob.recent_id == recent.id).delete()
+    # 재생성 작업 등록 후에는 캐시된 계획 대신 작업 상태
+    await client.post("/planner", params={"id": str(recent.id)}, json={"name": "죽녹원"})
+    queued = await client.get(url)
+
+    return {
+        "days": days,
+        "bytes": len(response.content),
+        "miss": miss_ms,
+        "hit": hit_ms,
+        "not_modified": not_modified_ms,
+        "ok": (
+            same_body
+            and not_modified.status_code == 304
+            and not not_modified.content
+            and edited.status_code == 200
+            and edited.headers["etag"] != etag
+            and other_worker.status_code == 202
+            and queued.status_code in (200, 202)
+            and "status" in queued.json()
+        ),
+    }
+
+
+async def run(args):
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+
+    import httpx
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            results = [await check_trip(client, days, args.repeat) for days in args.days]
+
+    print(f"\n{'기간':>4} {'본문(B)':>8} {'miss(ms)':>9} {'hit(ms)':>8} {'304(ms)':>8}  확인")
+    for result in results:
+        mark = "✅" if result["ok"] else "❌"
+        print(
+            f"{result['days']:>4} {result['bytes']:>8} {result['miss']:>9.2f} "
+            f"{result['hit']:>8.2f} {result['not_modified']:>8.2f}  {mark}"
+        )
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="+", default=[3, 7, 14], help="확인할 여행 기간 목록")
+    parser.add_argument("--repeat", type=int, default=100, help="경우별 요청 수 (중앙값 사용)")
+    parser.add_argument("--latency", type=float, default=0.01, help="가짜 LLM 호출당 지연(초)")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    asyncio.run(run(parser.parse_args()))
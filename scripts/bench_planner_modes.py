@@ -0,0 +1,65 @@
+"""
+planner 생성 모드별 소요 시간 벤치마크 (single vs parallel)
+
+가짜 LLM은 응답 글자 수에 비례해 지연되므로, 여행 일수가 늘어날수록
+한 번에 생성하는 single 모드의 시간이 선형으로 증가하는 것을 재현합니다.
+DB와 OpenAI 키 없이 실행됩니다.
+
+사용 예:
+    python scripts/bench_planner_modes.py --days 1 3 5 7
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+
+def sample_inputs(travel_days: int) -> dict:
+    return {
+        "main_place_name": "샘플 여행지",
+        "main_place_address": "전라남도 담양군 담양읍",
+        "main_place_latitude": 35.321,
+        "main_place_longitude": 126.988,
+        "main_place_reason": "벤치마크",
+        "categories": "주요 관심사: 온천, 전통",
+        "main_purpose": "문화 체험과 맛집 탐방",
+        "people": "2명",
+        "travel_days": travel_days,
+        "considerations": "특별한 고려사항 없음",
+        "nearby_places": "후보 없음",
+    }
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm(planner_latency=args.latency, latency_per_char=args.latency_per_char)
+
+    from src.chain.planner.extractor import generate_travel_plan
+
+    print(f"{'일수':>4} {'single(s)':>10} {'parallel(s)':>12} {'배율':>6}")
+    for days in args.days:
+        timings = {}
+        for mode in ("single", "parallel"):
+            start = time.perf_counter()
+            plan = await generate_travel_plan(sample_inputs(days), mode)
+            timings[mode] = time.perf_counter() - start
+            assert len(plan.daily_plans) == days, f"{mode}: {len(plan.daily_plans)}일 생성됨"
+        print(
+            f"{days:>4} {timings['single']:>10.2f} {timings['parallel']:>12.2f} "
+            f"{timings['single'] / timings['parallel']:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="+", default=[1, 3, 5, 7], help="측정할 여행 일수")
+    parser.add_argument("--latency", type=float, default=0.5, help="LLM 호출당 기본 지연(초)")
+    parser.add_argument("--latency-per-char", type=float, default=0.002, help="응답 글자당 지연(초)")
+    asyncio.run(run(parser.parse_args()))
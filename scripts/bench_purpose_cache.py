@@ -0,0 +1,144 @@
+"""
+/perpose 유사 목적 캐시 벤치마크
+
+1. 목적 문장 쌍의 유사도(동의어 치환 후 n-gram 코사인)를 출력해 PURPOSE_CACHE_THRESHOLD를 정하는 데 참고하고,
+   같은 의도 쌍(MERGE_PAIRS)은 적중, 반대 의도 쌍(NEGATION_PAIRS)은 실패하는지 확인합니다 (틀리면 종료 코드 1).
+2. 같은 여행지 특징을 가진 Recent들에 비슷한 목적 문장을 보내 캐시 적중률,
+   LLM 호출 수, 적중/실패 시 지연 시간을 측정합니다 (가짜 LLM 사용).
+
+사용 예:
+    python scripts/bench_purpose_cache.py
+    python scripts/bench_purpose_cache.py --threshold 0.7 --latency 1.0
+    python scripts/bench_purpose_cache.py --mongo url
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+# 같은 의도를 다르게 쓴 목적 문장 묶음
+PURPOSE_GROUPS = [
+    ["맛집 탐방", "맛집탐방", "맛집 탐방 여행", "맛집 탐방!!", "맛집 투어", "먹방 여행"],
+    ["조용히 쉬고 싶어요", "조용히 쉬고 싶어", "조용하게 쉬고 싶어요", "힐링하며 쉬기"],
+    ["사진 찍기 좋은 곳", "사진 찍기 좋은 곳 위주로", "인생샷 명소"],
+    ["아이와 함께 가족 여행", "아이랑 가족 여행", "부모님과 효도 여행"],
+]
+# 캐시를 함께 써야 하는 같은 의도 쌍
+MERGE_PAIRS = [
+    ("맛집 탐방", "맛집 투어"),
+    ("맛집 탐방", "먹방 여행"),
+    ("맛집 탐방", "맛집 탐방!!"),
+    ("조용히 쉬고 싶어요", "조용하게 쉬고 싶어요"),
+    ("사진 찍기 좋은 곳", "인생샷 명소"),
+]
+# 문장은 비슷하지만 반대/다른 의도라 캐시를 쓰면 안 되는 쌍
+NEGATION_PAIRS = [
+    ("맛집 탐방", "맛집 탐방 제외"),
+    ("매운 음식 좋아하는", "매운 음식 싫어하는"),
+    ("쉬고 싶어요", "쉬고 싶지 않아요"),
+    ("바다 보면서 쉬고 싶어요", "바다 말고 산에서 쉬고 싶어요"),
+    ("맛집 탐방", "역사 탐방"),
+]
+DESTINATIONS = [
+    {"place": "일본", "primary_traits": ["미식", "온천", "사찰"]},
+    {"place": "파리", "primary_traits": ["미술관", "야경", "카페"]},
+]
+
+
+def print_similarities(threshold: float):
+    from src.chain.purpose.similarity import purpose_vector
+
+    print(f"{'기준 문장':<16} {'비교 문장':<20} {'유사도':>6}")
+    for group in PURPOSE_GROUPS:
+        for other in group[1:]:
+            score = float(purpose_vector(group[0]) @ purpose_vector(other))
+            mark = "적중" if score >= threshold else ""
+            print(f"{group[0]:<16} {other:<20} {score:>6.2f} {mark}")
+    print()
+
+
+def check_pairs(threshold: float) -> bool:
+    """purpose_cache와 같은 설정의 캐시로 같은 의도 쌍은 적중, 반대 의도 쌍은 실패하는지 확인"""
+    from src.cache.semantic_cache import SemanticCache
+    from src.chain.purpose.similarity import purpose_vector, same_polarity
+
+    ok = True
+    for pairs, expected in ((MERGE_PAIRS, True), (NEGATION_PAIRS, False)):
+        for cached, query in pairs:
+            cache = SemanticCache(threshold=threshold, vectorize=purpose_vector, compatible=same_polarity)
+            cache.set("context", cached, "reply")
+            hit = cache.get("context", query) is not None
+            score = float(purpose_vector(cached) @ purpose_vector(query))
+            mark = "✅" if hit == expected else "❌"
+            ok = ok and hit == expected
+            print(f"{mark} {cached:<16} {query:<24} {score:>5.2f} {'적중' if hit else '실패'} (기대: {'적중' if expected else '실패'})")
+    print()
+    return ok
+
+
+async def run(args):
+    os.environ["PURPOSE_CACHE_THRESHOLD"] = str(args.threshold)
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+
+    print_similarities(args.threshold)
+    pairs_ok = check_pairs(args.threshold)
+
+    import httpx
+    from src.chain.purpose.extractor import purpose_cache
+    from src.llm.tokens import token_usage
+    from src.main import app
+    from src.model.chat import Recent
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            purpose_cache.clear()
+            token_usage.reset()
+            latencies = {"hit": [], "miss": []}
+            for _ in range(args.rounds):
+                for categories in DESTINATIONS:
+                    for group in PURPOSE_GROUPS:
+                        for purpose in group:
+                            recent = Recent(categories=categories)
+                            await recent.insert()
+                            before = purpose_cache.stats()
+                            start = time.perf_counter()
+                            response = await client.post("/perpose", params={"id": str(recent.id), "reason": purpose})
+                            elapsed = (time.perf_counter() - start) * 1000
+                            if response.status_code != 200:
+                                sys.exit(f"/perpose {response.status_code}: {response.text[:200]}")
+                            hit = purpose_cache.stats()["misses"] == before["misses"]
+                            latencies["hit" if hit else "miss"].append(elapsed)
+
+    stats = purpose_cache.stats()
+    total = stats["hits"] + stats["similar_hits"] + stats["misses"]
+    calls = token_usage.stats().get("purpose", {}).get("calls", 0)
+    print(f"요청 {total}회: 정확히 같은 문장 {stats['hits']}회, 유사 문장 {stats['similar_hits']}회, 실패 {stats['misses']}회")
+    print(f"적중률 {(stats['hits'] + stats['similar_hits']) / total * 100:.1f}%, LLM 호출 {calls}회, 캐시 항목 {stats['size']}개")
+    for kind, values in latencies.items():
+        if values:
+            print(f"{kind:<5} p50 {statistics.median(values):>8.1f}ms  (n={len(values)})")
+    if not pairs_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("PURPOSE_CACHE_THRESHOLD", "0.75")), help="유사도 기준")
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 호출당 지연(초)")
+    parser.add_argument("--rounds", type=int, default=2, help="전체 문장 목록 반복 횟수")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,111 @@
+"""
+일별 동선 최적화(nearest neighbour + 2-opt) 벤치마크
+
+무작위 순서의 합성 일정(관광지 + 점심/저녁 + 숙소)을 만들어 크기별로
+optimize_day 소요 시간과 이동 거리 감소율을 측정합니다.
+--exact 이하 크기에서는 구간별 완전 탐색 최적해와 비교합니다.
+
+사용 예:
+    python scripts/bench_route.py
+    python scripts/bench_route.py --sizes 6 10 30 100 300 --repeat 50
+"""
+import argparse
+import copy
+import itertools
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.chain.planner.data import DayPlan, ScheduleItem
+from src.chain.planner.route import FIXED_TYPES, optimize_day, path_length
+from src.search.geo import haversine_matrix
+
+# 합성 일정 중심 좌표 (담양)와 흩어지는 범위(도)
+CENTER = (35.32, 126.99)
+SPREAD = 0.15
+
+
+def synthetic_day(stops: int, rng: random.Random) -> DayPlan:
+    """관광지 stops개를 점심 전/저녁 전으로 나누고 식당 2곳, 숙소 1곳을 넣은 무작위 순서 일정"""
+
+    def item(kind: str, index: int, **extra) -> ScheduleItem:
+        return ScheduleItem(
+            type=kind,
+            name=f"{kind} {index}",
+            address="전라남도 담양군",
+            latitude=CENTER[0] + rng.uniform(-SPREAD, SPREAD),
+            longitude=CENTER[1] + rng.uniform(-SPREAD, SPREAD),
+            visit_time="00:00",
+            reason="벤치마크",
+            **extra,
+        )
+
+    morning = stops // 2
+    schedule = [item("place", i) for i in range(morning)]
+    schedule.append(item("restaurant", 0, meal_time="점심"))
+    schedule += [item("place", i) for i in range(morning, stops)]
+    schedule.append(item("restaurant", 1, meal_time="저녁"))
+    schedule.append(item("accommodation", 0))
+    for minutes, entry in zip(range(9 * 60, 24 * 60, 30), schedule):
+        entry.visit_time = f"{minutes // 60:02d}:{minutes % 60:02d}"
+    return DayPlan(day=1, date="2025-01-01", schedule=schedule, summary="벤치마크")
+
+
+def exact_km(day: DayPlan) -> float:
+    """고정 항목 사이 구간마다 모든 순열을 시도한 최단 거리 (작은 일정 전용)"""
+    schedule = day.schedule
+    n = len(schedule)
+    dist = haversine_matrix([i.latitude for i in schedule], [i.longitude for i in schedule])
+    total = 0.0
+    segment_start = 0
+    for pos in range(n + 1):
+        if pos < n and schedule[pos].type not in FIXED_TYPES:
+            continue
+        stops = list(range(segment_start, pos))
+        head = [segment_start - 1] if segment_start > 0 else []
+        tail = [pos] if pos < n else []
+        total += min(path_length(dist, head + list(order) + tail) for order in itertools.permutations(stops))
+        segment_start = pos + 1
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 6, 8, 20, 50, 100, 200], help="하루 관광지 수")
+    parser.add_argument("--repeat", type=int, default=20, help="크기별 일정 수")
+    parser.add_argument("--exact", type=int, default=8, help="최적해와 비교할 최대 관광지 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'관광지':>6} {'p50(ms)':>9} {'max(ms)':>9} {'전(km)':>8} {'후(km)':>8} {'감소율':>7} {'최적해 대비':>10}")
+    for size in args.sizes:
+        times, before, after, gaps = [], [], [], []
+        for _ in range(args.repeat):
+            day = synthetic_day(size, rng)
+            original = copy.deepcopy(day)
+            start = time.perf_counter()
+            report = optimize_day(day)
+            times.append((time.perf_counter() - start) * 1000)
+            before.append(report["before_km"])
+            after.append(report["after_km"])
+            if size <= args.exact:
+                # 결과 거리는 소수 셋째 자리로 반올림되므로 최적해보다 아주 조금 작게 나올 수 있음
+                gaps.append(max(0.0, report["after_km"] / exact_km(original) - 1))
+
+        reduction = 1 - sum(after) / sum(before)
+        gap = f"{statistics.mean(gaps) * 100:+.2f}%" if gaps else "-"
+        print(
+            f"{size:>6} {statistics.median(times):>9.2f} {max(times):>9.2f} "
+            f"{statistics.mean(before):>8.1f} {statistics.mean(after):>8.1f} {reduction * 100:>6.1f}% {gap:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+API 프로세스 시작(import) 시간 벤치마크
+
+새 파이썬 프로세스에서 `python -X importtime -c "import src.main"`을 여러 번 실행해
+src.main import 시간(중앙값)과 import 비용이 큰 모듈을 출력합니다.
+체인 / LLM 클라이언트는 첫 사용 시 생성되므로 langchain_openai, openai가 시작 시 import 되면 경고합니다.
+--prewarm을 주면 lifespan에서 백그라운드로 실행되는 prewarm_chains() 시간도 측정합니다.
+
+--output으로 결과를 저장하고 --baseline으로 이전 결과와 비교하며,
+--max-ms를 넘으면 종료 코드 1을 반환하므로 배포 전 확인에 사용할 수 있습니다.
+
+사용 예:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --runs 5 --top 20 --prewarm
+    python scripts/bench_startup.py --output startup.json
+    python scripts/bench_startup.py --baseline startup.json --max-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+# 시작 시 import 되면 안 되는(첫 사용 시 불러오는) 모듈
+LAZY_MODULES = ["langchain_openai", "openai", "langchain_core.prompts", "langchain_core.output_parsers"]
+
+
+def parse_importtime(stderr: str) -> dict:
+    """-X importtime 출력 -> {모듈: (self us, cumulative us, 깊이)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def run_python(code: str, importtime: bool = False) -> tuple:
+    """새 프로세스에서 코드 실행, (소요 시간 ms, stdout, stderr) 반환"""
+    env = {**os.environ, "OPENAI_KEY": os.environ.get("OPENAI_KEY", "benchmark")}
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=project_root, env=env, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        sys.exit(f"실행 실패:\n{result.stderr[-2000:]}")
+    return elapsed, result.stdout, result.stderr
+
+
+def run_once(prewarm: bool) -> dict:
+    wall, _, stderr = run_python("import src.main", importtime=True)
+    prewarm_ms = None
+    if prewarm:
+        # 서버 시작 후 백그라운드 스레드에서 실행되는 작업 (import 시간과 따로 측정)
+        _, stdout, _ = run_python("import src.main; from src.chain.prewarm import prewarm_chains; print(prewarm_chains())")
+        prewarm_ms = float(stdout.strip().splitlines()[-1]) * 1000
+    return {"wall_ms": wall, "modules": parse_importtime(stderr), "prewarm_ms": prewarm_ms}
+
+
+def top_level_packages(modules: dict) -> dict:
+    """최상위 패키지별 import 시간 합계 (모듈 self 시간 기준, ms)"""
+    totals = {}
+    for name, (self_us, _, _) in modules.items():
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us / 1000
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    parser.add_argument("--prewarm", action="store_true", help="prewarm_chains() 시간도 측정")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-ms", type=float, help="src.main import 시간 상한 (넘으면 종료 코드 1)")
+    args = parser.parse_args()
+
+    runs = [run_once(args.prewarm) for _ in range(args.runs)]
+    import_ms = statistics.median(run["modules"]["src.main"][1] / 1000 for run in runs)
+    wall_ms = statistics.median(run["wall_ms"] for run in runs)
+    # 패키지별 시간은 중앙값에 가장 가까운 실행 기준
+    representative = min(runs, key=lambda run: abs(run["modules"]["src.main"][1] / 1000 - import_ms))
+    packages = top_level_packages(representative["modules"])
+    eager = [name for name in LAZY_MODULES if name in representative["modules"]]
+
+    result = {
+        "import_ms": import_ms,
+        "process_ms": wall_ms,
+        "modules": len(representative["modules"]),
+        "packages": dict(sorted(packages.items(), key=lambda item: -item[1])[:args.top]),
+        "eager_lazy_modules": eager,
+    }
+    if args.prewarm:
+        result["prewarm_ms"] = statistics.median(run["prewarm_ms"] for run in runs)
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+
+    def compare(key: str) -> str:
+        if not baseline or key not in baseline:
+            return ""
+        return f" (이전 {baseline[key]:.0f}ms, {(result[key] - baseline[key]) / baseline[key] * 100:+.1f}%)"
+
+    print(f"src.main import: {import_ms:.0f}ms{compare('import_ms')}")
+    print(f"프로세스 시작~import 완료: {wall_ms:.0f}ms{compare('process_ms')}")
+    if args.prewarm:
+        print(f"prewarm_chains(): {result['prewarm_ms']:.0f}ms{compare('prewarm_ms')}")
+    print(f"import된 모듈 수: {result['modules']}\n")
+
+    print(f"{'패키지':<24} {'self 합계(ms)':>14}")
+    for package, ms in result["packages"].items():
+        print(f"{package:<24} {ms:>14.1f}")
+
+    if eager:
+        print(f"\n⚠️  시작 시 import 된 지연 로드 대상 모듈: {', '.join(eager)}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.output}")
+
+    if args.max_ms and import_ms > args.max_ms:
+        print(f"\n❌ import 시간 {import_ms:.0f}ms > 상한 {args.max_ms:.0f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+구조화 출력 방식별 벤치마크 (parser vs native)
+
+fixtures/structured_outputs.json의 케이스(입력값 + 방식별 LLM 응답)를 가짜 LLM으로 재생해
+PlaceFeatures / PlaceRecommendations / TravelPlan 체인의 프롬프트 토큰 수, 지연 시간, 파싱 실패율을 비교합니다.
+가짜 LLM 지연은 프롬프트 길이(입력 처리)와 응답 길이(출력 생성)에 비례합니다.
+
+--record를 주면 실제 OpenAI 모델(OPENAI_KEY 필요)로 두 방식의 응답을 다시 받아 fixture를 갱신합니다.
+
+사용 예:
+    python scripts/bench_structured_output.py
+    python scripts/bench_structured_output.py --record
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import FakeChatModel, install_fake_llm
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "structured_outputs.json"
+
+
+def chain_outputs() -> dict:
+    """체인 이름 -> 서비스에서 사용하는 StructuredOutput"""
+    from src.chain.categories.extractor import features_output
+    from src.chain.planner.extractor import plan_output
+    from src.chain.recommend.extractor import recommend_output
+
+    return {"categories": features_output, "recommend": recommend_output, "planner": plan_output}
+
+
+async def measure(chain, inputs: dict) -> tuple:
+    """(지연 시간 ms, 성공 여부)"""
+    start = time.perf_counter()
+    try:
+        await chain.ainvoke(inputs)
+        ok = True
+    except Exception:
+        ok = False
+    return (time.perf_counter() - start) * 1000, ok
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm()
+
+    from src.llm.structured import StructuredOutput
+    from src.llm.tokens import count_tokens
+
+    outputs = chain_outputs()
+    cases = json.loads(Path(args.fixtures).read_text(encoding="utf-8"))
+
+    # 체인 -> 방식 -> {"tokens": [], "latency": [], "failures": int, "runs": int}
+    results: dict = {}
+    for case in cases:
+        service_output = outputs[case["chain"]]
+        fake = FakeChatModel(
+            latency=args.latency,
+            latency_per_char=args.latency_per_char,
+            latency_per_prompt_char=args.latency_per_prompt_char,
+            responses=[("", case["parser_response"])],
+            native_responses=[("", case["native_response"])],
+        )
+        output = StructuredOutput(
+            service_output.parser_prompt.template,
+            service_output.parser_prompt.input_variables,
+            service_output.schema,
+            lambda: fake,
+        )
+        strict = output.native_prompt | fake.with_structured_output(output.schema)
+        variants = {
+            "parser": (output.parser_prompt, output.parser_chain()),
+            "native(strict)": (output.native_prompt, strict),
+            # 서비스 기본 동작: 스키마 검증 실패 시 같은 응답 원문을 파서로 파싱 (LLM 재호출 없음)
+            "native": (output.native_prompt, output.chain("native")),
+        }
+        for mode, (prompt, chain) in variants.items():
+            stats = results.setdefault(case["chain"], {}).setdefault(
+                mode, {"tokens": [], "latency": [], "failures": 0, "runs": 0}
+            )
+            tokens = count_tokens(prompt.format(**case["inputs"]))
+            for _ in range(args.repeat):
+                latency, ok = await measure(chain, case["inputs"])
+                stats["tokens"].append(tokens)
+                stats["latency"].append(latency)
+                stats["runs"] += 1
+                stats["failures"] += 0 if ok else 1
+            if args.verbose:
+                print(f"  {case['chain']:<11} {mode:<16} {case['case']:<28} {'ok' if ok else 'FAIL'}")
+
+    print(f"{'체인':<11} {'방식':<16} {'프롬프트 토큰':>12} {'평균 지연(ms)':>14} {'실패율':>8}")
+    for chain_name, modes in results.items():
+        for mode, stats in modes.items():
+            failure_rate = stats["failures"] / stats["runs"] * 100
+            print(
+                f"{chain_name:<11} {mode:<16} {statistics.mean(stats['tokens']):>12.0f} "
+                f"{statistics.mean(stats['latency']):>14.0f} {failure_rate:>7.1f}%"
+            )
+
+
+async def record(args):
+    """실제 모델로 두 방식의 원본 응답을 다시 받아 fixture 갱신"""
+    outputs = chain_outputs()
+    path = Path(args.fixtures)
+    cases = json.loads(path.read_text(encoding="utf-8"))
+
+    for case in cases:
+        output = outputs[case["chain"]]
+        raw = await (output.parser_prompt | output.llm).ainvoke(case["inputs"])
+        case["parser_response"] = raw.content
+
+        native_llm = output.llm.with_structured_output(output.schema, include_raw=True)
+        native = await (output.native_prompt | native_llm).ainvoke(case["inputs"])
+        case["native_response"] = native["raw"].content
+        print(f"  ✅ {case['chain']}: {case['case']}")
+
+    path.write_text(json.dumps(cases, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n{len(cases)}개 케이스 저장: {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", default=str(FIXTURE_PATH), help="fixture 파일 경로")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스당 반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.2, help="LLM 호출당 기본 지연(초)")
+    parser.add_argument("--latency-per-char", type=float, default=0.0005, help="응답 글자당 지연(초)")
+    parser.add_argument("--latency-per-prompt-char", type=float, default=0.00005, help="프롬프트 글자당 지연(초)")
+    parser.add_argument("--verbose", action="store_true", help="케이스별 성공/실패 출력")
+    parser.add_argument("--record", action="store_true", help="실제 모델 응답으로 fixture 갱신 (OPENAI_KEY 필요)")
+    args = parser.parse_args()
+    asyncio.run(record(args) if args.record else run(args))
@@ -0,0 +1,184 @@
+"""
+워커 수별 처리량 부하 테스트
+
+uvicorn을 --workers N으로 실제 프로세스로 띄우고(가짜 LLM, serve_fake.py) 정해진 시간 동안
+동시 요청을 보내 워커 수에 따른 처리량(req/s)과 지연 시간 변화를 측정합니다.
+가짜 LLM 지연은 짧게 두어 서버 CPU(장소 검색, 프롬프트 구성, 토큰 계산, 직렬화)가 병목이 되게 합니다.
+
+부하 종류:
+    --profile read (기본값): 고정 ID로 저장한 Recent에 POST /recommend, GET /planner/{recent_id}
+        --mongo memory면 워커마다 같은 데이터를 가진 메모리 DB를 사용하므로 MongoDB 없이 실행됩니다.
+    --profile session: bench_endpoints.py의 전체 사용자 흐름 (워커 간 DB 공유 필요: --mongo url)
+
+부하 생성기도 같은 머신의 CPU를 사용하므로 워커 수는 CPU 수보다 적게 두고 비교하세요.
+
+사용 예:
+    python scripts/bench_workers.py --workers 1 2 4 --duration 20
+    python scripts/bench_workers.py --profile session --mongo url --workers 1 2 4 8
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_endpoints import Recorder, run_session
+from bench_event_loop import percentile
+
+
+def fixture_id(index: int) -> str:
+    """serve_fake.py가 모든 워커에 같은 ID로 저장하는 벤치마크용 Recent ID"""
+    return f"{index + 1:024x}"
+
+
+def start_server(args, workers: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "BENCH_LATENCY": str(args.latency),
+        "BENCH_PLANNER_LATENCY": str(args.planner_latency),
+        "BENCH_MONGO": args.mongo,
+        "BENCH_RECENTS": str(args.recents),
+        "PLANNER_BACKGROUND": "0",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "serve_fake:app",
+            "--app-dir", str(Path(__file__).parent),
+            "--port", str(args.port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+async def wait_ready(client, workers: int, timeout: float):
+    """모든 워커가 응답할 때까지 대기 (X-Worker-Pid 기준)"""
+    import httpx
+
+    pids = set()
+    deadline = time.perf_counter() + timeout
+    while len(pids) < workers:
+        if time.perf_counter() > deadline:
+            raise RuntimeError(f"워커 {workers}개 중 {len(pids)}개만 준비됨")
+        try:
+            # 새 연결로 보내야 다른 워커에 분배됨
+            response = await client.get("/tokens", headers={"Connection": "close"})
+            if response.status_code == 200:
+                pids.add(response.headers.get("X-Worker-Pid"))
+                continue
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+
+
+async def read_request(client, rng: random.Random, recents: int) -> str:
+    """고정 Recent에 추천 또는 저장된 계획 조회"""
+    recent_id = fixture_id(rng.randrange(recents))
+    if rng.random() < 0.5:
+        response = await client.post("/recommend", params={"id": recent_id, "limit": 5})
+    else:
+        response = await client.get(f"/planner/{recent_id}")
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.request.url.path} {response.status_code}: {response.text[:200]}")
+    return response.headers.get("X-Worker-Pid", "?")
+
+
+async def measure(args, workers: int) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", timeout=None, limits=limits) as client:
+        await wait_ready(client, workers, args.startup_timeout)
+
+        latencies = []
+        errors = 0
+        per_worker = {}
+        recorder = Recorder()
+        rng = random.Random(args.seed)
+        deadline = time.perf_counter() + args.duration
+
+        async def user():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    if args.profile == "session":
+                        await run_session(client, recorder, rng)
+                        pid = "-"
+                    else:
+                        pid = await read_request(client, rng, args.recents)
+                except (RuntimeError, httpx.TransportError) as e:
+                    errors += 1
+                    if errors <= 3:
+                        print(f"  ⚠️  {e}")
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+                per_worker[pid] = per_worker.get(pid, 0) + 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    if args.profile == "session":
+        requests = sum(len(v) for v in recorder.latencies.values())
+    else:
+        requests = len(latencies)
+    return {
+        "workers": workers,
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p95": percentile(latencies, 95) if latencies else 0.0,
+        "spread": sorted(per_worker.values(), reverse=True),
+    }
+
+
+async def run(args):
+    results = []
+    for workers in args.workers:
+        server = start_server(args, workers)
+        try:
+            print(f"워커 {workers}개 측정 중...")
+            results.append(await measure(args, workers))
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+
+    unit = "세션" if args.profile == "session" else "요청"
+    base = results[0]["rps"] if results else 0
+    print(f"\n{'워커':>4} {unit + '/s':>10} {'배율':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'실패':>5}  워커별 처리 수")
+    for result in results:
+        print(
+            f"{result['workers']:>4} {result['rps']:>10.1f} {result['rps'] / base:>5.2f}x "
+            f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['errors']:>5}  {result['spread']}"
+        )
+    print(f"\n(CPU {os.cpu_count()}개)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="측정할 워커 수 목록")
+    parser.add_argument("--profile", choices=["read", "session"], default="read", help="부하 종류")
+    parser.add_argument("--duration", type=float, default=20.0, help="워커 수별 측정 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 사용자 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 LLM 호출당 지연(초)")
+    parser.add_argument("--planner-latency", type=float, default=0.1, help="가짜 planner LLM 지연(초)")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    parser.add_argument("--recents", type=int, default=200, help="read 부하에 사용할 Recent 수")
+    parser.add_argument("--port", type=int, default=8765, help="서버 포트")
+    parser.add_argument("--startup-timeout", type=float, default=180.0, help="워커 준비 대기 시간(초)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+    if args.profile == "session" and args.mongo == "memory":
+        parser.error("session 부하는 워커 간 DB를 공유해야 하므로 --mongo url이 필요합니다")
+    asyncio.run(run(args))
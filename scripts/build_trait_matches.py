@@ -0,0 +1,50 @@
+"""
+태그 -> 장소 매칭 표(trait_matches) 생성 배치
+
+categories 체인이 만든 primary_traits 태그(캐시된 /traits 결과, 대화 기록, 기본 태그)마다
+주소가 있는 관광지 전체와의 TF-IDF 유사도를 계산해 상위 장소 ID를 저장합니다.
+/recommend는 이 표를 메모리에 올려(TRAIT_MATCH_RELOAD_SECONDS마다 다시 읽음) 후보를 바로 가져옵니다.
+장소 데이터를 다시 적재한 뒤나 주기적으로(예: 하루 한 번 cron) 실행하세요.
+
+사용 예:
+    python scripts/build_trait_matches.py
+    python scripts/build_trait_matches.py --top-n 300 --show 온천 사찰 미식
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.database import app_init
+from src.model.place import Place
+from src.search.trait_matches import TRAIT_MATCH_TOP_N, build_trait_matches, trait_match_table
+
+
+async def main(args):
+    await app_init()
+
+    stats = await build_trait_matches(args.top_n)
+    print(f"✅ 태그 {stats['traits']}개 x 장소 {stats['places']}개 매칭 ({stats['seconds']:.1f}초)")
+
+    if args.show:
+        await trait_match_table.load()
+        for trait in args.show:
+            matches = trait_match_table.lookup([trait], 5)
+            places = {place.id: place for place in await Place.find({"_id": {"$in": [pid for pid, _ in matches]}}).to_list()}
+            print(f"\n[{trait}]")
+            if not matches:
+                print("  (표에 없는 태그)")
+            for place_id, score in matches:
+                place = places.get(place_id)
+                print(f"  {score:.3f}  {place.name if place else place_id} | {place.address if place else ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-n", type=int, default=TRAIT_MATCH_TOP_N, help="태그별로 저장할 장소 수")
+    parser.add_argument("--show", nargs="*", help="생성 후 상위 장소를 출력할 태그")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,66 @@
+"""
+PlaceIndex 증분 갱신(refresh) 확인
+
+인덱스를 만든 뒤 같은 _id로 문서를 수정(upsert 재적재/좌표 보정), 삭제(--purge-legacy), 추가하고
+refresh()가 각각을 반영하는지, 변경이 없으면 아무것도 다시 읽지 않는지 확인합니다.
+메모리 DB에서만 실행합니다 (장소 문서를 수정/삭제하므로).
+
+사용 예:
+    python scripts/check_place_index_refresh.py
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("OPENAI_KEY", "check")
+
+
+async def run():
+    from bench_endpoints import use_memory_mongo
+    from src.database.database import app_init
+    from src.model.place import Place
+    from src.search.place_index import PlaceIndex
+
+    await use_memory_mongo()
+    await app_init()
+    collection = Place.get_pymongo_collection()
+    index = PlaceIndex()
+    await index.load()
+    total = len(index)
+    target = index.places[0]
+
+    checks = [("변경 없음", await index.refresh() == 0)]
+
+    await collection.update_one(
+        {"_id": target.id},
+        {"$set": {"name": "무지개 별빛 광장", "latitude": 35.0, "longitude": 127.0, "updated_at": datetime.now()}},
+    )
+    await index.refresh()
+    updated = index.get(target.id)
+    checks.append(("같은 _id 수정", updated is not None and updated.name == "무지개 별빛 광장" and updated.latitude == 35.0))
+    checks.append(("수정 후 이름 검색", index.match_name("무지개 별빛 광장", 0.9)[0][0].id == target.id))
+    checks.append(("수정 후 변경 없음", await index.refresh() == 0))
+
+    await collection.delete_one({"_id": target.id})
+    await index.refresh()
+    checks.append(("삭제", index.get(target.id) is None and len(index) == total - 1))
+    checks.append(("삭제 후 이름 검색", not index.match_name("무지개 별빛 광장", 0.9)))
+
+    added = Place(name="새 장소", type="관광지", address="서울특별시 종로구", updated_at=datetime.now())
+    await added.insert()
+    checks.append(("추가", await index.refresh() == 1 and index.get(added.id) is not None and len(index) == total))
+
+    for name, ok in checks:
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(ok for _, ok in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,106 @@
+"""
+생성된 일정 관광지의 장소 데이터 검증/보정 확인
+
+장소 데이터에서 관광지를 무작위로 골라 LLM이 흔히 만드는 오류를 섞은 일정을 만들고
+verify_travel_plan이 원래 장소로 보정하는지, 없는 장소는 unverified로 표시하는지 확인합니다.
+    - 좌표 오차: 좌표를 수 km 옮김
+    - 잘못된 좌표: 좌표를 0으로 (주소로 검증)
+    - 이름 변형: 앞에 시군구명을 붙이거나 공백 제거
+    - 지어낸 장소: 장소 데이터에 없는 이름
+
+사용 예:
+    python scripts/check_place_verify.py --items 200
+    python scripts/check_place_verify.py --mongo url
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+FAKE_NAMES = ["달빛 정원 카페거리", "하늘숲 전망대", "은하수 테마파크", "무지개 별빛 광장"]
+
+
+def schedule_item(name: str, latitude: float, longitude: float, address: str):
+    from src.chain.planner.data import ScheduleItem
+
+    return ScheduleItem(
+        type="place", name=name, address=address, latitude=latitude, longitude=longitude,
+        visit_time="10:00", reason="검증 확인",
+    )
+
+
+def make_case(place, kind: str, rng: random.Random):
+    """(일정 항목, 기대하는 Place ID 또는 None)"""
+    words = (place.address or "").split()
+    if kind == "shifted":
+        return schedule_item(place.name, place.latitude + rng.uniform(-0.05, 0.05), place.longitude + rng.uniform(-0.05, 0.05), place.address), place
+    if kind == "zero":
+        return schedule_item(place.name, 0.0, 0.0, place.address), place
+    if kind == "renamed":
+        name = f"{words[1]} {place.name}" if len(words) > 1 else place.name.replace(" ", "")
+        return schedule_item(name, place.latitude + 0.01, place.longitude - 0.01, place.address), place
+    name = rng.choice(FAKE_NAMES)
+    return schedule_item(name, place.latitude, place.longitude, place.address), None
+
+
+async def run(args):
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+
+    from src.chain.planner.data import DayPlan, TravelPlan
+    from src.chain.planner.verify import verify_travel_plan
+    from src.database.database import app_init
+    from beanie import PydanticObjectId
+    from src.search.place_index import place_index
+    from src.search.text import normalize
+
+    await app_init()
+    await place_index.load()
+    rng = random.Random(args.seed)
+    pool = [p for p in place_index.search("", place_type="관광지") if p.latitude is not None]
+
+    kinds = ["shifted", "zero", "renamed", "invented"]
+    results = {kind: {"ok": 0, "total": 0} for kind in kinds}
+    times = []
+    for _ in range(args.items):
+        kind = rng.choice(kinds)
+        item, expected = make_case(rng.choice(pool), kind, rng)
+        plan = TravelPlan(
+            main_destination_name="확인", main_destination_address="", main_destination_latitude=0, main_destination_longitude=0,
+            total_days=1, daily_plans=[DayPlan(day=1, date="2025-01-01", schedule=[item], summary="")], overview="",
+        )
+        start = time.perf_counter()
+        verify_travel_plan(plan)
+        times.append((time.perf_counter() - start) * 1000)
+        if expected is None:
+            ok = item.verification == "unverified"
+        else:
+            # 관광지/유적지 양쪽에 있는 같은 이름의 장소로 보정돼도 정답으로 봄
+            matched = place_index.get(PydanticObjectId(item.place_id)) if item.place_id else None
+            ok = matched is not None and normalize(matched.name) == normalize(expected.name)
+        if not ok and args.verbose:
+            print(f"  ✗ {kind}: {item.name} -> {item.verification} (기대: {expected.name if expected else '없음'})")
+        results[kind]["total"] += 1
+        results[kind]["ok"] += ok
+
+    print(f"{'유형':<10} {'정답':>6} {'전체':>6}")
+    for kind, result in results.items():
+        print(f"{kind:<10} {result['ok']:>6} {result['total']:>6}")
+    print(f"\n항목당 검증 시간 p50 {statistics.median(times):.2f}ms, max {max(times):.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200, help="확인할 항목 수")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    parser.add_argument("--verbose", action="store_true", help="틀린 항목 출력")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,133 @@
+"""
+하루 일정 재생성(PATCH /planner/{recent_id}/days/{day}) 확인
+
+여행 기간이 다른 계획을 만든 뒤 가운데 날을 다시 생성하고 다음을 확인합니다.
+    - 해당 일차 원소만 바뀌고 다른 날은 그대로인지, Planner 문서가 하나인지, updated_at이 갱신됐는지
+    - 계획 전체의 검증 수(verification)와 동선 요약(route)이 새 일정과 맞는지
+    - 재생성 토큰 수(프롬프트 + 응답)가 여행 기간과 관계없이 일정한지 (전체 생성과 비교)
+    - 없는 일차는 오류를 반환하는지
+
+사용 예:
+    python scripts/check_planner_day_edit.py --days 3 7 14
+    python scripts/check_planner_day_edit.py --mongo url
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+MAIN_PLACE = {
+    "name": "죽녹원", "address": "전라남도 담양군 담양읍 죽녹원로 119",
+    "latitude": 35.3269, "longitude": 126.9866, "reason": "대나무 숲",
+}
+
+
+async def check_trip(client, days: int) -> dict:
+    from src.chain.planner.verify import count_verification
+    from src.llm.tokens import token_usage
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+
+    recent = Recent(
+        categories={"place": "교토", "primary_traits": ["대나무", "정원", "사찰"]},
+        main_purpose="조용한 산책",
+        people="2명",
+        day=f"{days}일",
+        finished=True,
+    )
+    await recent.insert()
+
+    token_usage.reset()
+    response = await client.post("/planner", params={"id": str(recent.id), "background": False}, json=MAIN_PLACE)
+    if response.status_code != 200:
+        sys.exit(f"/planner {response.status_code}: {response.text[:200]}")
+    full = token_usage.stats()["planner"]
+    before = await Planner.find_one(Planner.recent_id == recent.id)
+
+    day = (days + 1) // 2
+    # 요약이 새 일정 기준으로 다시 계산되는지 보기 위해 저장된 요약을 틀린 값으로 바꿔 둠
+    stale = {"verification": {"matched": -1, "unverified": -1}}
+    if before.route:
+        stale["route"] = {**before.route, "after_km": -1.0, "days": [
+            {**entry, "after_km": -1.0} if entry["day"] == day else entry for entry in before.route["days"]
+        ]}
+    await Planner.get_pymongo_collection().update_one({"_id": before.id}, {"$set": stale})
+    token_usage.reset()
+    start = time.perf_counter()
+    response = await client.patch(f"/planner/{recent.id}/days/{day}", params={"theme": "대나무 숲 산책과 전통 정원"})
+    elapsed = (time.perf_counter() - start) * 1000
+    if response.status_code != 200:
+        sys.exit(f"PATCH {response.status_code}: {response.text[:200]}")
+    edit = token_usage.stats()["planner.day_edit"]
+
+    after = await Planner.find_one(Planner.recent_id == recent.id)
+    documents = await Planner.find(Planner.recent_id == recent.id).count()
+    others_unchanged = all(
+        old == new for old, new in zip(before.daily_plans, after.daily_plans) if old["day"] != day
+    )
+    route_days = {entry["day"]: entry for entry in (after.route or {}).get("days", [])}
+    summaries_match = (
+        after.verification == count_verification(after.daily_plans)
+        and (after.route is None or (
+            route_days.get(day) is not None
+            and abs(after.route["after_km"] - sum(entry["after_km"] for entry in route_days.values())) < 1e-6
+        ))
+    )
+    missing = await client.patch(f"/planner/{recent.id}/days/{days + 1}")
+    return {
+        "days": days,
+        "full_tokens": full["prompt_tokens"] + full["completion_tokens"],
+        "edit_tokens": edit["prompt_tokens"] + edit["completion_tokens"],
+        "edit_ms": elapsed,
+        "ok": (
+            documents == 1
+            and others_unchanged
+            and after.daily_plans[day - 1] == response.json()
+            and after.updated_at > before.updated_at
+            and after.created_at == before.created_at
+            and summaries_match
+            and missing.status_code != 200
+        ),
+    }
+
+
+async def run(args):
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+
+    import httpx
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            results = [await check_trip(client, days) for days in args.days]
+
+    print(f"\n{'기간':>4} {'전체 생성 토큰':>14} {'하루 재생성 토큰':>16} {'재생성(ms)':>11}  확인")
+    for result in results:
+        mark = "✅" if result["ok"] else "❌"
+        print(
+            f"{result['days']:>4} {result['full_tokens']:>14} {result['edit_tokens']:>16} "
+            f"{result['edit_ms']:>11.1f}  {mark}"
+        )
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="+", default=[3, 7, 14], help="확인할 여행 기간 목록")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 LLM 호출당 지연(초)")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,137 @@
+"""
+백그라운드 planner 작업 확인
+
+1. POST /planner가 바로 작업 ID를 반환하고, GET /planner/{recent_id}를 폴링하면
+   진행 중에는 202 + 작업 상태, 완료 후에는 저장된 여행 계획이 오는지 확인합니다.
+2. 생성 도중 서버를 종료(lifespan 종료)한 뒤 다시 시작하면 작업이 이어서 완료되는지 확인합니다.
+3. 서버가 비정상 종료되어 running으로 남은 작업이 복구되는지 확인합니다.
+
+MongoDB(MONGO_URL)가 필요하고 OpenAI 키는 필요 없습니다.
+
+사용 예:
+    python scripts/check_planner_jobs.py --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+MAIN_PLACE = {
+    "name": "성산일출봉", "address": "제주특별자치도 서귀포시 성산읍",
+    "latitude": 33.458, "longitude": 126.942, "reason": "일출 명소",
+}
+
+
+async def poll(client, recent_id: str, timeout: float) -> tuple:
+    """완료(200)될 때까지 GET /planner/{recent_id} 폴링, (마지막 응답, 진행 중 응답 수) 반환"""
+    pending = 0
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        response = await client.get(f"/planner/{recent_id}")
+        if response.status_code != 202:
+            return response, pending
+        pending += 1
+        await asyncio.sleep(0.05)
+    return response, pending
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+
+    import httpx
+    from src.main import app
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+    from src.model.planner_job import PlannerJob
+
+    def client():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        return httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None)
+
+    def new_recent() -> Recent:
+        return Recent(
+            categories={"place": "제주도", "primary_traits": ["자연", "해변"]},
+            main_purpose="조용히 쉬고 싶어요",
+            people="2명",
+            day="2박 3일",
+            finished=True,
+        )
+
+    results = []
+    recents = []
+
+    # 1. 등록 후 폴링
+    async with app.router.lifespan_context(app):
+        recent = new_recent()
+        await recent.insert()
+        recents.append(recent)
+        async with client() as c:
+            start = time.perf_counter()
+            submitted = await c.post("/planner", params={"id": str(recent.id), "mode": "parallel"}, json=MAIN_PLACE)
+            submit_ms = (time.perf_counter() - start) * 1000
+            again = await c.post("/planner", params={"id": str(recent.id), "mode": "parallel"}, json=MAIN_PLACE)
+            response, pending = await poll(c, str(recent.id), args.latency * 20)
+        same_job = submitted.json().get("job_id") == again.json().get("job_id")
+        ok = submitted.status_code == 202 and same_job and response.status_code == 200 and "daily_plans" in response.json()
+        print(f"1. 등록 {submitted.status_code} ({submit_ms:.0f}ms), 중복 등록 시 같은 작업: {same_job}, 진행 중 응답 {pending}회 -> {response.status_code}")
+        results.append(ok)
+
+    # 2. 생성 도중 정상 종료 후 재시작
+    async with app.router.lifespan_context(app):
+        recent = new_recent()
+        await recent.insert()
+        recents.append(recent)
+        async with client() as c:
+            await c.post("/planner", params={"id": str(recent.id)}, json=MAIN_PLACE)
+            await asyncio.sleep(args.latency / 2)
+    job = await PlannerJob.find_one(PlannerJob.recent_id == recent.id)
+    status_after_stop = job.status
+    async with app.router.lifespan_context(app):
+        async with client() as c:
+            response, _ = await poll(c, str(recent.id), args.latency * 20)
+    ok = status_after_stop == "queued" and response.status_code == 200
+    print(f"2. 종료 후 작업 상태: {status_after_stop}, 재시작 후 -> {response.status_code}")
+    results.append(ok)
+
+    # 3. 비정상 종료로 running에 남은 작업 복구
+    recent = new_recent()
+    await recent.insert()
+    recents.append(recent)
+    stale = datetime.now() - timedelta(hours=1)
+    await PlannerJob(
+        recent_id=recent.id, main_place=MAIN_PLACE, status="running", attempts=1,
+        created_at=stale, updated_at=stale, started_at=stale,
+    ).insert()
+    async with app.router.lifespan_context(app):
+        async with client() as c:
+            response, _ = await poll(c, str(recent.id), args.latency * 20)
+    job = await PlannerJob.find_one(PlannerJob.recent_id == recent.id)
+    ok = response.status_code == 200 and job.status == "done" and job.attempts == 2
+    print(f"3. 중단된 작업 복구 -> {response.status_code}, 상태 {job.status}, 시도 {job.attempts}회")
+    results.append(ok)
+
+    for recent in recents:
+        await PlannerJob.find(PlannerJob.recent_id == recent.id).delete()
+        await Planner.find(Planner.recent_id == recent.id).delete()
+        await recent.delete()
+
+    print("✅ 통과" if all(results) else "❌ 실패")
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 호출당 지연(초)")
+    asyncio.run(run(parser.parse_args()))
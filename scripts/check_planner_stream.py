@@ -0,0 +1,125 @@
+"""
+POST /planner/stream 확인
+
+1. day 이벤트가 일수만큼 온 뒤 done으로 끝나는지 확인합니다.
+2. 같은 요청의 스트림과 동기 POST /planner를 동시에 보내면 LLM 호출 하나를 공유하는지 확인합니다.
+3. 저장이 실패하면 연결이 끊기지 않고 error 이벤트로 끝나는지 확인합니다.
+4. 같은 Recent의 백그라운드 작업이 진행 중이면 409와 작업 상태를 반환하는지 확인합니다.
+
+MongoDB(MONGO_URL)가 필요하고 OpenAI 키는 필요 없습니다.
+
+사용 예:
+    python scripts/check_planner_stream.py --latency 0.3
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+MAIN_PLACE = {
+    "name": "성산일출봉", "address": "제주특별자치도 서귀포시 성산읍",
+    "latitude": 33.458, "longitude": 126.942, "reason": "일출 명소",
+}
+
+
+async def read_stream(client, recent_id: str) -> tuple:
+    """스트림을 끝까지 읽고 (상태 코드, 이벤트 목록) 반환"""
+    async with client.stream("POST", "/planner/stream", params={"id": recent_id}, json=MAIN_PLACE) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return response.status_code, [response.json()]
+        events = [json.loads(line) async for line in response.aiter_lines() if line]
+    return response.status_code, events
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        await check(app)
+
+
+async def check(app):
+    import httpx
+    from src.llm.tokens import token_usage
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+
+    recent = Recent(
+        categories={"place": "제주도", "primary_traits": ["자연", "해변"]},
+        main_purpose="조용히 쉬고 싶어요",
+        people="2명",
+        day="2박 3일",
+        finished=True,
+    )
+    await recent.insert()
+    recent_id = str(recent.id)
+    ok = True
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check", timeout=None) as client:
+        # 1. day 이벤트 후 done
+        status, events = await read_stream(client, recent_id)
+        kinds = [event["event"] for event in events]
+        passed = status == 200 and kinds == ["day"] * 3 + ["done"]
+        print(f"1. 스트림 이벤트: {kinds} {'✅' if passed else '❌'}")
+        ok = ok and passed
+
+        # 2. 스트림 + 동기 호출 동시 요청
+        token_usage.reset()
+        (status, events), response = await asyncio.gather(
+            read_stream(client, recent_id),
+            client.post("/planner", params={"id": recent_id, "background": False}, json=MAIN_PLACE),
+        )
+        calls = token_usage.stats().get("planner", {}).get("calls", 0)
+        passed = events[-1]["event"] == "done" and response.status_code == 200 and calls == 1
+        print(f"2. 스트림 + 동기 호출: LLM 호출 {calls}회, 동기 응답 {response.status_code} {'✅' if passed else '❌'}")
+        ok = ok and passed
+
+        # 3. 저장 실패 시 error 이벤트
+        original_insert = Planner.insert
+
+        async def failing_insert(self, *args, **kwargs):
+            raise RuntimeError("저장 실패 (확인용)")
+
+        await Planner.find(Planner.recent_id == recent.id).delete()
+        Planner.insert = failing_insert
+        try:
+            status, events = await read_stream(client, recent_id)
+        finally:
+            Planner.insert = original_insert
+        passed = status == 200 and events[-1]["event"] == "error"
+        print(f"3. 저장 실패: 마지막 이벤트 {events[-1]} {'✅' if passed else '❌'}")
+        ok = ok and passed
+
+        # 4. 진행 중인 백그라운드 작업이 있으면 409
+        await client.post("/planner", params={"id": recent_id, "background": True}, json=MAIN_PLACE)
+        status, events = await read_stream(client, recent_id)
+        passed = status == 409 and events[0].get("status") in ("queued", "running")
+        print(f"4. 작업 진행 중 스트림: {status} {'✅' if passed else '❌'}")
+        ok = ok and passed
+
+    await Planner.find(Planner.recent_id == recent.id).delete()
+    await recent.delete()
+
+    print("✅ 통과" if ok else "❌ 실패")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.3, help="가짜 LLM 호출당 지연(초)")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,71 @@
+"""
+/options 동시 요청 정합성 확인
+
+같은 Recent에 /options를 동시에 N번 보내고 옵션이 하나도 유실되지 않았는지 확인합니다.
+이어서 부정 응답으로 완료 처리한 뒤 추가 요청이 거부되는지도 확인합니다.
+MongoDB(MONGO_URL)가 필요하고 OpenAI 키는 필요 없습니다.
+
+사용 예:
+    python scripts/check_session_concurrency.py --requests 50
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm()
+
+    import httpx
+    from src.database.database import app_init
+    from src.main import app
+    from src.model.chat import Recent
+
+    await app_init()
+    recent = Recent(categories={"place": "일본", "primary_traits": ["온천"]})
+    await recent.insert()
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        expected = [f"옵션 {i}" for i in range(args.requests)]
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/options", params={"id": str(recent.id), "options": option})
+            for option in expected
+        ])
+        elapsed = time.perf_counter() - start
+
+        failed = [r.status_code for r in responses if r.status_code != 200]
+        saved = (await Recent.get(recent.id)).options
+        missing = set(expected) - set(saved)
+        print(f"동시 /options {args.requests}회: {elapsed * 1000:.0f}ms, 실패 응답 {len(failed)}개")
+        print(f"저장된 옵션 {len(saved)}개, 유실 {len(missing)}개")
+
+        # 완료 처리 후에는 추가/수정 불가
+        done = await client.post("/options", params={"id": str(recent.id), "options": "없어요"})
+        after = await client.post("/options", params={"id": str(recent.id), "options": "늦은 옵션"})
+        finished = (await Recent.get(recent.id)).finished
+        print(f"완료 처리: {done.status_code}, finished={finished}, 완료 후 추가 요청: {after.status_code}")
+
+    await recent.delete()
+
+    ok = not failed and not missing and len(saved) == args.requests and finished and after.status_code != 200
+    print("✅ 통과" if ok else "❌ 실패")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50, help="동시에 보낼 /options 요청 수")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,135 @@
+"""
+중복 요청 합치기(single-flight) 확인
+
+같은 Recent에 /perpose, /recommend, /planner를 동시에 N번 보내고,
+LLM 호출이 한 번씩만 일어났는지와 Planner 문서가 하나만 저장됐는지 확인합니다.
+또 메인 여행지나 모드가 다른 동시 생성은 합쳐지지 않는지, 먼저 시작한 생성에 합류한
+호출(백그라운드 작업)도 일별 일정 콜백을 모두 받는지 확인합니다.
+MongoDB(MONGO_URL)가 필요하고 OpenAI 키는 필요 없습니다.
+
+사용 예:
+    python scripts/check_singleflight.py --requests 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+
+async def burst(client, endpoint: str, count: int, **kwargs) -> tuple:
+    """같은 요청을 동시에 count번 보내고 (소요 시간 ms, 실패 응답 수) 반환"""
+    start = time.perf_counter()
+    responses = await asyncio.gather(*[client.post(endpoint, **kwargs) for _ in range(count)])
+    elapsed = (time.perf_counter() - start) * 1000
+    failed = [r for r in responses if r.status_code != 200]
+    for response in failed[:3]:
+        print(f"  ⚠️  {endpoint} {response.status_code}: {response.text[:200]}")
+    return elapsed, len(failed)
+
+
+async def run(args):
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm(latency=args.latency, planner_latency=args.latency)
+    os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+
+    from src.main import app
+
+    # 장소 인덱스까지 로드된 서버 상태에서 확인
+    async with app.router.lifespan_context(app):
+        await check(app, args)
+
+
+async def check(app, args):
+    import httpx
+    from src.llm.tokens import token_usage
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+
+    recent = Recent(
+        categories={"place": "제주도", "primary_traits": ["자연", "해변", "드라이브"]},
+        main_purpose="조용히 쉬고 싶어요",
+        people="2명",
+        day="2박 3일",
+        finished=True,
+    )
+    await recent.insert()
+    main_place = {
+        "name": "성산일출봉", "address": "제주특별자치도 서귀포시 성산읍",
+        "latitude": 33.458, "longitude": 126.942, "reason": "일출 명소",
+    }
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        token_usage.reset()
+        elapsed, failed = await burst(client, "/perpose", args.requests, params={"id": str(recent.id), "reason": "조용히 쉬고 싶어요"})
+        purpose_calls = token_usage.stats().get("purpose", {}).get("calls", 0)
+        print(f"동시 /perpose {args.requests}회: {elapsed:.0f}ms, 실패 {failed}개, LLM 호출 {purpose_calls}회")
+        purpose_ok = failed == 0 and purpose_calls == 1
+
+        elapsed, failed = await burst(client, "/recommend", args.requests, params={"id": str(recent.id), "limit": 5})
+        recommend_calls = token_usage.stats().get("recommend", {}).get("calls", 0)
+        print(f"동시 /recommend {args.requests}회: {elapsed:.0f}ms, 실패 {failed}개, LLM 호출 {recommend_calls}회")
+        ok = purpose_ok and failed == 0 and recommend_calls == 1
+
+        elapsed, failed = await burst(client, "/planner", args.requests, params={"id": str(recent.id), "background": False}, json=main_place)
+        planner_calls = sum(
+            usage["calls"] for chain, usage in token_usage.stats().items() if chain.startswith("planner")
+        )
+        documents = await Planner.find(Planner.recent_id == recent.id).count()
+        print(f"동시 /planner {args.requests}회: {elapsed:.0f}ms, 실패 {failed}개, LLM 호출 {planner_calls}회, 저장된 계획 {documents}개")
+        ok = ok and failed == 0 and documents == 1
+
+    ok = await check_plan_keys(recent, main_place) and ok
+
+    await Planner.find(Planner.recent_id == recent.id).delete()
+    await recent.delete()
+
+    print("✅ 통과" if ok else "❌ 실패")
+    if not ok:
+        sys.exit(1)
+
+
+async def check_plan_keys(recent, main_place: dict) -> bool:
+    """다른 여행지/모드는 따로 생성하고, 합류한 호출도 on_day를 모두 받는지 확인"""
+    from src.chain.planner.extractor import create_travel_plan
+
+    from src.llm.tokens import token_usage
+
+    other_place = {**main_place, "name": "우도", "address": "제주특별자치도 제주시 우도면"}
+    token_usage.reset()
+    await asyncio.gather(
+        create_travel_plan(recent.id, main_place, "single"),
+        create_travel_plan(recent.id, other_place, "single"),
+    )
+    calls = token_usage.stats().get("planner", {}).get("calls", 0)
+    separate = calls == 2
+    print(f"다른 메인 여행지 동시 생성: LLM 호출 {calls}회")
+
+    # 동기 호출이 먼저 시작한 parallel 생성에 백그라운드 작업처럼 on_day를 가진 호출이 합류
+    received = []
+
+    async def on_day(day_plan):
+        received.append(day_plan.day)
+
+    leader = asyncio.create_task(create_travel_plan(recent.id, main_place, "parallel"))
+    await asyncio.sleep(0)
+    planner = await create_travel_plan(recent.id, main_place, "parallel", on_day=on_day)
+    await leader
+    all_days = sorted(received) == [plan["day"] for plan in planner.daily_plans]
+    print(f"합류한 호출의 일별 콜백: {sorted(received)} / 전체 {planner.total_days}일")
+    return separate and all_days
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5, help="동시에 보낼 같은 요청 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 호출당 지연(초)")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,58 @@
+"""
+태그 매칭 표(trait_matches) 점수 확인
+
+기본 태그(BASE_TRAITS)마다 build_trait_matches와 같은 대상/점수(score_traits)로
+상위 장소를 뽑아, 각 장소의 이름이나 설명에 태그 텍스트가 실제로 들어 있는지 확인합니다.
+(한 글자 태그가 해시 충돌한 바이그램과 일치하는 문제 등의 회귀 확인용)
+
+사용 예:
+    python scripts/check_trait_matches.py
+    python scripts/check_trait_matches.py --top 20 --mongo url
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("OPENAI_KEY", "check")
+
+
+async def run(args):
+    from src.database.database import app_init
+    from src.model.place import Place
+    from src.search.text import normalize
+    from src.search.trait_matches import BASE_TRAITS, score_traits
+
+    if args.mongo == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+    await app_init()
+
+    places = await Place.find({"type": "관광지"}, Place.address > "").sort(+Place.id).to_list()
+    if not places:
+        sys.exit("장소 데이터가 없습니다.")
+    texts = [normalize(place.name) + "|" + normalize(place.description) for place in places]
+
+    failures = 0
+    rows = score_traits(places, BASE_TRAITS, args.top)
+    for trait, (positions, _) in zip(BASE_TRAITS, rows):
+        wrong = [places[pos].name for pos in positions if normalize(trait) not in texts[pos]]
+        failures += len(wrong)
+        mark = "✅" if not wrong else "❌"
+        print(f"{mark} {trait:<6} 상위 {len(positions):>3}개 중 불일치 {len(wrong)}개 {wrong[:3] if wrong else ''}")
+
+    print(f"\n태그 {len(BASE_TRAITS)}개, 불일치 {failures}개")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=10, help="태그별로 확인할 상위 장소 수")
+    parser.add_argument("--mongo", choices=["memory", "url"], default="memory", help="MongoDB 종류")
+    asyncio.run(run(parser.parse_args()))
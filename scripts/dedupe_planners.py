@@ -0,0 +1,37 @@
+"""
+planners 컬렉션의 중복 recent_id 정리
+
+planners.recent_id unique 인덱스는 중복 문서가 있으면 생성되지 않으므로,
+recent_id별로 가장 최근 계획만 남깁니다. 중복 문서를 영구 삭제하므로 서버 시작 시에는 실행하지 않고,
+인덱스 도입 전에 한 번 직접 실행합니다. (그 전까지 서버는 인덱스 없이 시작하며 경고를 출력)
+(app_init은 인덱스를 생성하므로 사용하지 않고 직접 연결)
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.dedupe import dedupe_planners
+
+load_dotenv()
+
+MONGO_URL = os.getenv("MONGO_URL")
+DB_NAME = os.getenv("DB_NAME")
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGO_URL)
+    removed = await dedupe_planners(client[DB_NAME])
+    print(f"✅ 중복 여행 계획 {removed}개 삭제")
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,314 @@
+"""
+벤치마크용 가짜 LLM
+
+실제 OpenAI 호출 대신 고정된 응답을 지정한 지연 시간 후 반환합니다.
+체인 모듈이 import 되기 전에 install_fake_llm()을 호출해야 합니다.
+
+LLMRecorder로 실제 모델의 응답/지연 시간을 기록해 두면 install_fake_llm(recordings=...)으로
+같은 응답을 기록된 지연 시간대로 재생할 수 있습니다.
+"""
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+
+
+def sample_day_plan(day: int) -> dict:
+    """DayPlan 형식의 샘플 응답"""
+    return {
+        "day": day,
+        "date": f"2025-01-{day:02d}",
+        "schedule": [
+            {
+                "type": "place",
+                "name": f"샘플 여행지 {day}",
+                "address": "전라남도 담양군 담양읍",
+                "latitude": 35.3210 + day * 0.01,
+                "longitude": 126.9880 + day * 0.01,
+                "visit_time": "09:00",
+                "reason": "벤치마크용 장소",
+            },
+            {
+                "type": "restaurant",
+                "name": f"샘플 식당 {day}",
+                "address": "전라남도 담양군 담양읍",
+                "latitude": 35.3220 + day * 0.01,
+                "longitude": 126.9890 + day * 0.01,
+                "visit_time": "12:00",
+                "reason": "벤치마크용 식당",
+                "cuisine_type": "한식",
+                "meal_time": "점심",
+            },
+        ],
+        "summary": f"{day}일차 일정",
+    }
+
+
+def sample_travel_plan(days: int = 3) -> dict:
+    """TravelPlan 형식의 샘플 응답"""
+    return {
+        "main_destination_name": "샘플 여행지 1",
+        "main_destination_address": "전라남도 담양군 담양읍",
+        "main_destination_latitude": 35.331,
+        "main_destination_longitude": 126.998,
+        "total_days": days,
+        "daily_plans": [sample_day_plan(day) for day in range(1, days + 1)],
+        "overview": "벤치마크용 여행 계획",
+    }
+
+
+def sample_skeleton(days: int = 3) -> dict:
+    """TripSkeleton 형식의 샘플 응답"""
+    return {
+        "days": [
+            {"day": day, "date": f"2025-01-{day:02d}", "theme": f"테마 {day}", "area": f"지역 {day}"}
+            for day in range(1, days + 1)
+        ],
+        "overview": "벤치마크용 여행 계획",
+    }
+
+
+def _travel_days(prompt: str) -> int:
+    match = re.search(r"여행 기간: (\d+)일", prompt)
+    return int(match.group(1)) if match else 3
+
+
+def _day(prompt: str) -> int:
+    match = re.search(r"Day (\d+) 하루의", prompt)
+    return int(match.group(1)) if match else 1
+
+
+SAMPLE_PLACE_FEATURES = {
+    "place": "일본",
+    "primary_traits": ["온천", "전통", "료칸", "정원", "라멘"],
+    "categories": [
+        {"category": "음식", "tags": ["라멘", "스시"]},
+        {"category": "문화", "tags": ["전통", "사찰"]},
+    ],
+    "short_description": "전통과 현대가 어우러진 차분한 분위기",
+}
+
+SAMPLE_RECOMMENDATIONS = {
+    "places": [
+        {"name": "샘플 관광지", "address": "전라남도 담양군", "reason": "벤치마크용 추천"},
+    ]
+}
+
+
+def sample_recommendations(prompt: str) -> dict:
+    """프롬프트의 후보 장소 목록에서 앞쪽 limit개를 고른 추천 응답"""
+    match = re.search(r"정확히 (\d+)개", prompt)
+    limit = int(match.group(1)) if match else 5
+    places = []
+    for line in re.findall(r"^\d+\. (.+)$", prompt, re.MULTILINE)[:limit]:
+        name, _, rest = line.partition(" | ")
+        address = rest.partition(" | ")[0]
+        places.append({"name": name, "address": address, "reason": "키워드와 잘 맞는 장소"})
+    return {"places": places} if places else SAMPLE_RECOMMENDATIONS
+
+Response = Union[str, Callable[[str], str]]
+
+# (프롬프트에 포함된 문구, 응답) 목록 - 먼저 일치하는 항목의 응답을 사용
+# 응답이 함수면 프롬프트 전문을 받아 응답 문자열을 만듦
+DEFAULT_RESPONSES: List[Tuple[str, Response]] = [
+    ("여행 전체의 뼈대만", lambda p: json.dumps(sample_skeleton(_travel_days(p)), ensure_ascii=False)),
+    ("하루의 상세 일정만", lambda p: json.dumps(sample_day_plan(_day(p)), ensure_ascii=False)),
+    ("전문 여행 플래너", lambda p: json.dumps(sample_travel_plan(_travel_days(p)), ensure_ascii=False)),
+    ("여행 장소 추천 전문가", lambda p: json.dumps(sample_recommendations(p), ensure_ascii=False)),
+    ("여행지 특징을 추출하는", json.dumps(SAMPLE_PLACE_FEATURES, ensure_ascii=False)),
+    ("여행 큐레이션 AI", "좋아요 😊 차분한 분위기의 여행 컨셉을 추천드릴게요."),
+]
+
+
+class FakeChatModel(BaseChatModel):
+    """지연 시간을 흉내 내는 가짜 채팅 모델"""
+    latency: float = 1.0
+    # 응답 글자 수에 비례하는 추가 지연 (출력 토큰 생성 시간 흉내)
+    latency_per_char: float = 0.0
+    responses: List[Tuple[str, Any]] = DEFAULT_RESPONSES
+    # 네이티브 구조화 출력(with_structured_output) 응답 (None이면 responses 사용)
+    native_responses: Optional[List[Tuple[str, Any]]] = None
+    # 프롬프트 글자 수에 비례하는 추가 지연 (입력 토큰 처리 시간 흉내)
+    latency_per_prompt_char: float = 0.0
+    # 응답 문구별 기록된 지연 시간 (있으면 latency 계산 대신 사용)
+    recorded_latency: Dict[str, float] = {}
+    # 기록된 지연 시간 배율
+    latency_scale: float = 1.0
+    # True면 동기 invoke처럼 이벤트 루프를 막음 (기존 동작 재현용)
+    block_event_loop: bool = False
+    # 스트리밍 시 한 번에 전송할 글자 수
+    stream_chunk_size: int = 40
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _match(self, text: str) -> Tuple[str, Any]:
+        return next(((marker, resp) for marker, resp in self.responses if marker in text), ("", ""))
+
+    def _content(self, messages: List[BaseMessage]) -> str:
+        text = self._prompt(messages)
+        response = self._match(text)[1]
+        return response(text) if callable(response) else response
+
+    def _delay(self, content: str, prompt: str = "") -> float:
+        marker = self._match(prompt)[0]
+        if marker in self.recorded_latency:
+            return self.recorded_latency[marker] * self.latency_scale
+        return self.latency + self.latency_per_char * len(content) + self.latency_per_prompt_char * len(prompt)
+
+    def _prompt(self, messages: List[BaseMessage]) -> str:
+        return "\n".join(str(m.content) for m in messages)
+
+    def _respond(self, content: str) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        content = self._content(messages)
+        time.sleep(self._delay(content, self._prompt(messages)))
+        return self._respond(content)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        content = self._content(messages)
+        delay = self._delay(content, self._prompt(messages))
+        if self.block_event_loop:
+            time.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+        return self._respond(content)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        # 전체 지연 시간을 청크 수만큼 나눠 토큰이 생성되는 것처럼 전송
+        content = self._content(messages)
+        delay = self._delay(content, self._prompt(messages))
+        size = self.stream_chunk_size
+        pieces = [content[i:i + size] for i in range(0, len(content), size)] or [""]
+        for piece in pieces:
+            await asyncio.sleep(delay / len(pieces))
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+
+
+    def with_structured_output(self, schema: Any, include_raw: bool = False, **kwargs: Any) -> Runnable:
+        """네이티브 구조화 출력 흉내 (native_responses의 JSON을 스키마로 검증해 반환)"""
+        native = self.model_copy(update={"responses": self.native_responses or self.responses})
+        if not include_raw:
+            return native | RunnableLambda(lambda message: schema.model_validate_json(message.content))
+
+        def parse(message: AIMessage) -> dict:
+            try:
+                return {"raw": message, "parsed": schema.model_validate_json(message.content), "parsing_error": None}
+            except Exception as e:
+                return {"raw": message, "parsed": None, "parsing_error": e}
+
+        return native | RunnableLambda(parse)
+
+
+class LLMRecorder(BaseCallbackHandler):
+    """
+    실제 모델 호출의 응답과 지연 시간을 DEFAULT_RESPONSES의 문구별로 기록하는 콜백
+
+    같은 문구가 여러 번 호출되면 마지막 응답과 평균 지연 시간을 저장합니다.
+    """
+    run_inline = True
+
+    def __init__(self):
+        self._started: Dict[Any, Tuple[str, float]] = {}
+        self.responses: Dict[str, str] = {}
+        self.latencies: Dict[str, List[float]] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        text = "\n".join(str(m.content) for batch in messages for m in batch)
+        marker = next((marker for marker, _ in DEFAULT_RESPONSES if marker in text), None)
+        if marker:
+            self._started[run_id] = (marker, time.perf_counter())
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        started = self._started.pop(run_id, None)
+        if not started:
+            return
+        marker, start = started
+        self.responses[marker] = response.generations[0][0].text
+        self.latencies.setdefault(marker, []).append(time.perf_counter() - start)
+
+    def save(self, path: Union[str, Path]):
+        recordings = [
+            {
+                "marker": marker,
+                "response": response,
+                "latency": sum(self.latencies[marker]) / len(self.latencies[marker]),
+            }
+            for marker, response in self.responses.items()
+        ]
+        Path(path).write_text(json.dumps(recordings, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def install_recorder() -> LLMRecorder:
+    """실제 LLM 클라이언트에 LLMRecorder 연결"""
+    from src.llm.llm_client import get_llm, get_llm_for_planner
+
+    recorder = LLMRecorder()
+    for llm in (get_llm(), get_llm_for_planner()):
+        llm.callbacks = [recorder]
+    return recorder
+
+
+def load_recordings(path: Union[str, Path]) -> Tuple[List[Tuple[str, Response]], Dict[str, float]]:
+    """
+    기록 파일을 (응답 목록, 문구별 지연 시간)으로 변환
+
+    기록되지 않은 문구는 DEFAULT_RESPONSES의 응답을 사용합니다.
+    """
+    recordings = json.loads(Path(path).read_text(encoding="utf-8"))
+    recorded = {r["marker"]: r["response"] for r in recordings}
+    responses = [(marker, recorded.get(marker, resp)) for marker, resp in DEFAULT_RESPONSES]
+    return responses, {r["marker"]: r["latency"] for r in recordings}
+
+
+def install_fake_llm(
+    latency: float = 1.0,
+    planner_latency: float = 5.0,
+    block_event_loop: bool = False,
+    latency_per_char: float = 0.0,
+    recordings: Optional[Union[str, Path]] = None,
+    latency_scale: float = 1.0,
+):
+    """
+    llm_client의 싱글턴을 가짜 모델로 교체
+
+    recordings를 주면 기록된 응답을 기록된 지연 시간 x latency_scale로 재생합니다.
+    """
+    from src.llm import llm_client
+
+    options = {"block_event_loop": block_event_loop, "latency_per_char": latency_per_char}
+    if recordings:
+        responses, recorded_latency = load_recordings(recordings)
+        options.update(responses=responses, recorded_latency=recorded_latency, latency_scale=latency_scale)
+
+    llm_client._llm = FakeChatModel(latency=latency, **options)
+    llm_client._llm_planner = FakeChatModel(latency=planner_latency, **options)
@@ -0,0 +1,54 @@
+"""
+체인별 고정 프롬프트 토큰 수 리포트
+
+입력값을 비운 상태로 각 프롬프트를 렌더링해 템플릿 + format_instructions만의 토큰 수를
+구조화 출력 방식(parser/native)별로 계산합니다.
+매 호출마다 고정으로 나가는 비용이므로 프롬프트 크기를 조정할 때 기준으로 사용합니다.
+OpenAI 키와 DB 없이 실행됩니다.
+
+사용 예:
+    python scripts/report_prompt_tokens.py
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fake_llm import install_fake_llm
+
+
+def main():
+    # 체인 모듈 import 전에 가짜 LLM 설치
+    install_fake_llm()
+
+    from src.chain.categories import extractor as categories
+    from src.chain.planner import extractor as planner
+    from src.chain.purpose import extractor as purpose
+    from src.chain.recommend import extractor as recommend
+    from src.llm.tokens import count_tokens
+
+    def prompt_tokens(prompt) -> int:
+        return count_tokens(prompt.format(**{variable: "" for variable in prompt.input_variables}))
+
+    outputs = {
+        "categories": categories.features_output,
+        "recommend": recommend.recommend_output,
+        "planner": planner.plan_output,
+        "planner.skeleton": planner.skeleton_output,
+        "planner.day": planner.day_output,
+    }
+
+    print(f"{'체인':<18} {'parser':>8} {'native':>8} {'format_instructions':>20}")
+    print(f"{'purpose':<18} {prompt_tokens(purpose.get_purpose_prompt()):>8} {'-':>8} {'-':>20}")
+    for name, output in outputs.items():
+        print(
+            f"{name:<18} {prompt_tokens(output.parser_prompt):>8} {prompt_tokens(output.native_prompt):>8} "
+            f"{count_tokens(output.format_instructions):>20}"
+        )
+    print(f"\n후보 장소 목록 예산 (RECOMMEND_PLACES_TOKEN_BUDGET): {recommend.RECOMMEND_PLACES_TOKEN_BUDGET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+가짜 LLM을 사용하는 src.main:app (bench_workers.py에서 uvicorn 멀티 워커로 실행)
+
+    python -m uvicorn serve_fake:app --app-dir scripts --workers 4
+
+워커마다 이 모듈을 import하면서 가짜 LLM을 설치하고, lifespan 시작 시 벤치마크용
+Recent / Planner 문서를 고정 ID로 저장합니다. 응답 헤더 X-Worker-Pid로 처리한 워커를 알 수 있습니다.
+
+환경 변수:
+    BENCH_LATENCY, BENCH_PLANNER_LATENCY: 가짜 LLM 지연(초)
+    BENCH_MONGO: memory(워커별 mongomock-motor 메모리 DB) 또는 url(MONGO_URL)
+    BENCH_RECENTS: 저장할 Recent 수
+"""
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_workers import fixture_id
+from fake_llm import install_fake_llm, sample_travel_plan
+
+BENCH_MONGO = os.getenv("BENCH_MONGO", "memory")
+BENCH_RECENTS = int(os.getenv("BENCH_RECENTS", "200"))
+
+DESTINATIONS = ["일본", "제주도", "파리", "교토", "유럽", "스위스", "발리", "뉴욕"]
+TRAITS = ["자연", "해변", "역사", "미식", "쇼핑", "온천", "야경", "미술관", "트레킹", "사찰"]
+
+# 체인 모듈 import 전에 가짜 LLM 설치
+install_fake_llm(
+    latency=float(os.getenv("BENCH_LATENCY", "0.05")),
+    planner_latency=float(os.getenv("BENCH_PLANNER_LATENCY", "0.1")),
+)
+os.environ.setdefault("MONGO_EXPLAIN_ON_STARTUP", "0")
+
+from beanie import PydanticObjectId
+from src.main import app
+
+
+async def seed_fixtures(count: int):
+    """벤치마크용 Recent / Planner 문서를 고정 ID로 저장 (이미 있으면 덮어씀)"""
+    from src.model.chat import Recent
+    from src.model.planner import Planner
+
+    for index in range(count):
+        recent_id = PydanticObjectId(fixture_id(index))
+        traits = [TRAITS[(index + offset) % len(TRAITS)] for offset in range(3)]
+        await Recent(
+            id=recent_id,
+            categories={"place": DESTINATIONS[index % len(DESTINATIONS)], "primary_traits": traits},
+            main_purpose=f"{traits[0]} 위주의 여행",
+            people="2명",
+            day="2박 3일",
+            finished=True,
+        ).save()
+        await Planner.find(Planner.recent_id == recent_id).delete()
+        await Planner(recent_id=recent_id, **sample_travel_plan(3)).insert()
+
+
+_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def lifespan(app):
+    if BENCH_MONGO == "memory":
+        from bench_endpoints import use_memory_mongo
+        await use_memory_mongo()
+    async with _lifespan(app) as state:
+        await seed_fixtures(BENCH_RECENTS)
+        print(f"worker {os.getpid()} ready")
+        yield state
+
+
+app.router.lifespan_context = lifespan
+
+
+@app.middleware("http")
+async def worker_pid(request, call_next):
+    response = await call_next(request)
+    response.headers["X-Worker-Pid"] = str(os.getpid())
+    return response
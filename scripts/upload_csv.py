@@ -1,8 +1,12 @@
+import argparse
 import asyncio
 import csv
 import sys
+import time
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
-import chardet
+from chardet.universaldetector import UniversalDetector
 import os
 from dotenv import load_dotenv
 
@@ -12,7 +16,10 @@ sys.path.insert(0, str(project_root))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
+from pymongo import UpdateOne
 from src.model.place import Place
+from src.search.geo import in_korea
+from src.search.text import normalize
 
 load_dotenv()
 
@@ -20,140 +27,324 @@ load_dotenv()
 MONGO_URL = os.getenv("MONGO_URL")
 DB_NAME = os.getenv("DB_NAME")
 
-def detect_encoding(file_path: str) -> str:
-    """파일의 인코딩을 자동으로 감지"""
+# 인코딩 감지에 사용할 최대 바이트 수
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+def detect_encoding(file_path: str, max_bytes: int = ENCODING_SNIFF_BYTES) -> str:
+    """파일 앞부분만 읽어 인코딩을 자동으로 감지"""
+    detector = UniversalDetector()
+    read = 0
     with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        return result['encoding']
+        while read < max_bytes and not detector.done:
+            chunk = file.read(min(8192, max_bytes - read))
+            if not chunk:
+                break
+            detector.feed(chunk)
+            read += len(chunk)
+    detector.close()
+    encoding = detector.result['encoding'] or 'utf-8'
+    # EUC-KR로 감지되더라도 확장 문자를 위해 CP949로 읽음
+    return 'cp949' if encoding.lower() == 'euc-kr' else encoding
+
+# 위도/경도 컬럼 후보 (유적지 CSV는 x=경도, y=위도)
+LAT_COLUMNS = ("위도", "latitude", "lat", "y")
+LON_COLUMNS = ("경도", "longitude", "lon", "lng", "x")
+
+
+def find_column(headers: list, candidates: tuple):
+    """컬럼명이 후보와 정확히 일치하는 컬럼을 우선 찾고, 없으면 부분 일치로 찾음"""
+    normalized = {h: h.strip().lower() for h in headers if h}
+    for candidate in candidates:
+        for header, name in normalized.items():
+            if name == candidate:
+                return header
+    for candidate in candidates:
+        if len(candidate) < 2:
+            continue
+        for header, name in normalized.items():
+            if candidate in name:
+                return header
+    return None
+
+
+def parse_coordinates(row: dict, lat_key, lon_key):
+    """
+    행에서 위도/경도를 읽어 검증
+
+    Returns:
+        (위도, 경도, 상태) - 상태는 ok / swapped / missing / invalid / out_of_bounds
+    """
+    raw_lat = (row.get(lat_key) or "").strip() if lat_key else ""
+    raw_lon = (row.get(lon_key) or "").strip() if lon_key else ""
+    if not raw_lat or not raw_lon:
+        return None, None, "missing"
+
+    try:
+        lat, lon = float(raw_lat), float(raw_lon)
+    except ValueError:
+        return None, None, "invalid"
+
+    if in_korea(lat, lon):
+        return lat, lon, "ok"
+    # 위도/경도가 뒤바뀐 데이터 보정
+    if in_korea(lon, lat):
+        return lon, lat, "swapped"
+    return None, None, "out_of_bounds"
+
+
+def print_coverage(stats: dict, total: int):
+    """파일별 좌표 적재 현황 출력"""
+    with_coords = stats["ok"] + stats["swapped"]
+    coverage = with_coords / total * 100 if total else 0.0
+    print(f"  📍 좌표 보유: {with_coords}/{total} ({coverage:.1f}%)")
+    print(
+        f"     정상 {stats['ok']}, 위경도 보정 {stats['swapped']}, 누락 {stats['missing']}, "
+        f"형식 오류 {stats['invalid']}, 국내 범위 밖 {stats['out_of_bounds']}"
+    )
+
+
+def source_key(row: dict, place_type: str, name: str, address: str) -> str:
+    """
+    재적재 시에도 변하지 않는 원본 기준 키
+
+    유적지는 id_poi(없으면 id), 관광지는 이름 + 주소를 사용
+    """
+    natural_id = (row.get('id_poi') or row.get('id') or '').strip()
+    if natural_id:
+        return f"{place_type}:{natural_id}"
+    return f"{place_type}:{normalize(name)}|{normalize(address)}"
+
+
+def iter_places(csv_file_path: str, place_type: str, encoding: str, coord_stats: dict):
+    """CSV를 한 행씩 읽어 Place 데이터(dict)를 생성하는 제너레이터"""
+    with open(csv_file_path, 'r', encoding=encoding, newline='') as file:
+        csv_reader = csv.DictReader(file)
+
+        # 첫 줄에서 컬럼명 확인
+        headers = csv_reader.fieldnames
+        print(f"  📋 컬럼: {', '.join(headers[:5])}...")
+
+        # 위도, 경도 컬럼 매핑
+        lat_key = find_column(headers, LAT_COLUMNS)
+        lon_key = find_column(headers, LON_COLUMNS)
+        print(f"  🧭 좌표 컬럼: 위도={lat_key}, 경도={lon_key}")
+
+        for idx, row in enumerate(csv_reader):
+            try:
+                # CSV 컬럼명에 맞게 조정
+                # 관광지 CSV: 관광지명, 소재지도로명주소, 관광지소개 등
+                # 유적지 CSV: poi_nm, sido_nm, sgg_nm, bemd_nm, ri_nm, mcate_nm 등
+
+                # 명칭 추출
+                name = row.get('관광지명', row.get('poi_nm', row.get('명칭', row.get('이름', '')))).strip()
+
+                # 주소 조합 (유적지는 여러 컬럼을 합쳐야 함)
+                address = ''
+                if 'mcate_nm' in row:  # 유적지 CSV
+                    # mcate_nm, sido_nm, sgg_nm, bemd_nm, ri_nm 등을 조합
+                    parts = [
+                        row.get('sido_nm', '').strip(),
+                        row.get('sgg_nm', '').strip(),
+                        row.get('bemd_nm', '').strip(),
+                        row.get('ri_nm', '').strip(),
+                        row.get('branch_nm', '').strip(),
+                    ]
+                    address = ' '.join([p for p in parts if p])
+                else:  # 관광지 CSV
+                    address = row.get('소재지도로명주소', row.get('소재지지번주소', row.get('주소', row.get('소재지', '')))).strip()
+
+                # 설명
+                description = row.get('관광지소개', row.get('설명', row.get('개요', ''))).strip()
+
+                # 지역
+                region = row.get('시도', row.get('sido_nm', row.get('지역', ''))).strip()
+
+                place_data = {
+                    'name': name,
+                    'type': place_type,
+                    'address': address,
+                    'description': description,
+                    'region': region,
+                    'source_key': source_key(row, place_type, name, address),
+                }
+
+                if not place_data['name']:  # 이름이 있는 경우만 추가
+                    continue
 
-async def upload_csv_to_mongodb(csv_file_path: str, place_type: str):
+                # 위도, 경도 검증 후 추가
+                lat, lon, status = parse_coordinates(row, lat_key, lon_key)
+                coord_stats[status] += 1
+                if lat is not None:
+                    place_data['latitude'] = lat
+                    place_data['longitude'] = lon
+
+                yield place_data
+
+            except Exception as e:
+                print(f"  ⚠️  {idx+1}번째 행 처리 중 오류: {str(e)}")
+                continue
+
+
+def batched(iterable, size: int):
+    """iterable을 size 크기의 리스트로 나눠 생성"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def upsert_batch(batch: list) -> tuple:
+    """
+    source_key 기준 bulk upsert (반환: 신규, 갱신 수)
+
+    실행 중인 서버의 PlaceIndex가 바뀐 문서만 다시 읽도록 updated_at은 새 문서와
+    값이 실제로 바뀐 문서에만 기록합니다. 같은 파일을 다시 적재하면 갱신 수는 0이고
+    updated_at도 그대로이므로 서버 인덱스가 다시 만들어지지 않습니다.
     """
-    CSV 파일을 읽어서 MongoDB에 업로드
-    
+    documents = [
+        # Place 모델 검증 (location 자동 생성 포함)
+        Place(**place_data).model_dump(exclude={"id", "revision_id", "updated_at"})
+        for place_data in batch
+    ]
+    updated_at = datetime.now()
+    collection = Place.get_pymongo_collection()
+
+    # 1. 적재할 값과 하나라도 다른 기존 문서에 수정 시각 기록 (upsert 전에 비교)
+    await collection.bulk_write([
+        UpdateOne(
+            {
+                "source_key": document["source_key"],
+                "$or": [{field: {"$ne": value}} for field, value in document.items() if field != "source_key"],
+            },
+            {"$set": {"updated_at": updated_at}},
+        )
+        for document in documents
+    ], ordered=False)
+
+    # 2. 값 upsert (새 문서만 수정 시각을 함께 기록, 바뀐 값이 없으면 modified로 세지 않음)
+    result = await collection.bulk_write([
+        UpdateOne(
+            {"source_key": document["source_key"]},
+            {"$set": document, "$setOnInsert": {"updated_at": updated_at}},
+            upsert=True,
+        )
+        for document in documents
+    ], ordered=False)
+    return result.upserted_count, result.modified_count
+
+
+async def upload_csv_to_mongodb(
+    csv_file_path: str,
+    place_type: str,
+    batch_size: int = 500,
+    concurrency: int = 4,
+    purge_legacy: bool = False,
+):
+    """
+    CSV 파일을 스트리밍으로 읽어서 MongoDB에 배치 upsert
+
+    같은 파일을 다시 적재해도 source_key 기준으로 갱신되므로 중복이 생기지 않습니다.
+
     Args:
         csv_file_path: CSV 파일 경로
         place_type: 장소 유형 ('관광지' 또는 '유적지')
+        batch_size: bulk_write 한 번에 보낼 행 수
+        concurrency: 동시에 진행할 배치 쓰기 수
+        purge_legacy: source_key가 없는 (이전 방식으로 적재된) 같은 유형 문서 삭제
     """
     # MongoDB 연결
     client = AsyncIOMotorClient(MONGO_URL)
     db = client[DB_NAME]
-    
+
     # Beanie 초기화
     await init_beanie(database=db, document_models=[Place])
-    
+
     # 파일 인코딩 감지
     encoding = detect_encoding(csv_file_path)
     print(f"  📝 감지된 인코딩: {encoding}")
-    
-    # CSV 파일 읽기
-    places_data = []
-    
+
+    if purge_legacy:
+        deleted = await Place.find(Place.type == place_type, Place.source_key == None).delete()
+        print(f"  🧹 이전 방식으로 적재된 {place_type} {deleted.deleted_count if deleted else 0}개 삭제")
+
+    coord_stats = {"ok": 0, "swapped": 0, "missing": 0, "invalid": 0, "out_of_bounds": 0}
+    totals = {"rows": 0, "inserted": 0, "updated": 0}
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = set()
+    start = time.perf_counter()
+
+    async def write(batch: list):
+        try:
+            inserted, updated = await upsert_batch(batch)
+            totals["inserted"] += inserted
+            totals["updated"] += updated
+        finally:
+            semaphore.release()
+        totals["rows"] += len(batch)
+        elapsed = time.perf_counter() - start
+        print(f"  ⏳ {totals['rows']}행 처리 ({totals['rows'] / elapsed:.0f}행/초)")
+
     try:
-        with open(csv_file_path, 'r', encoding=encoding) as file:
-            csv_reader = csv.DictReader(file)
-            
-            # 첫 줄에서 컬럼명 확인
-            headers = csv_reader.fieldnames
-            print(f"  📋 컬럼: {', '.join(headers[:5])}...")
-            
-            for idx, row in enumerate(csv_reader):
-                try:
-                    # CSV 컬럼명에 맞게 조정
-                    # 관광지 CSV: 관광지명, 소재지도로명주소, 관광지소개 등
-                    # 유적지 CSV: poi_nm, sido_nm, sgg_nm, bemd_nm, ri_nm, mcate_nm 등
-                    
-                    # 명칭 추출
-                    name = row.get('관광지명', row.get('poi_nm', row.get('명칭', row.get('이름', '')))).strip()
-                    
-                    # 주소 조합 (유적지는 여러 컬럼을 합쳐야 함)
-                    address = ''
-                    if 'mcate_nm' in row:  # 유적지 CSV
-                        # mcate_nm, sido_nm, sgg_nm, bemd_nm, ri_nm 등을 조합
-                        parts = [
-                            row.get('sido_nm', '').strip(),
-                            row.get('sgg_nm', '').strip(),
-                            row.get('bemd_nm', '').strip(),
-                            row.get('ri_nm', '').strip(),
-                            row.get('branch_nm', '').strip(),
-                        ]
-                        address = ' '.join([p for p in parts if p])
-                    else:  # 관광지 CSV
-                        address = row.get('소재지도로명주소', row.get('소재지지번주소', row.get('주소', row.get('소재지', '')))).strip()
-                    
-                    # 설명
-                    description = row.get('관광지소개', row.get('설명', row.get('개요', ''))).strip()
-                    
-                    # 지역
-                    region = row.get('시도', row.get('sido_nm', row.get('지역', ''))).strip()
-                    
-                    place_data = {
-                        'name': name,
-                        'type': place_type,
-                        'address': address,
-                        'description': description,
-                        'region': region,
-                    }
-                    
-                    # 위도, 경도가 있다면 추가
-                    lat_key = next((k for k in row.keys() if '위도' in k or 'latitude' in k.lower()), None)
-                    lon_key = next((k for k in row.keys() if '경도' in k or 'longitude' in k.lower()), None)
-                    
-                    if lat_key and row.get(lat_key):
-                        try:
-                            place_data['latitude'] = float(row[lat_key])
-                        except (ValueError, TypeError):
-                            pass
-                            
-                    if lon_key and row.get(lon_key):
-                        try:
-                            place_data['longitude'] = float(row[lon_key])
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    if place_data['name']:  # 이름이 있는 경우만 추가
-                        places_data.append(Place(**place_data))
-                        
-                except Exception as e:
-                    print(f"  ⚠️  {idx+1}번째 행 처리 중 오류: {str(e)}")
-                    continue
-        
-        # MongoDB에 일괄 삽입
-        if places_data:
-            await Place.insert_many(places_data)
-            print(f"  ✅ {len(places_data)}개의 {place_type} 데이터를 업로드했습니다.")
+        for batch in batched(iter_places(csv_file_path, place_type, encoding, coord_stats), batch_size):
+            # 진행 중인 배치가 concurrency개를 넘지 않도록 대기 (메모리 사용량 고정)
+            await semaphore.acquire()
+            for task in [t for t in pending if t.done()]:
+                pending.discard(task)
+                task.result()  # 실패한 배치가 있으면 여기서 중단
+            pending.add(asyncio.create_task(write(batch)))
+
+        await asyncio.gather(*pending)
+
+        if totals["rows"]:
+            elapsed = time.perf_counter() - start
+            print(
+                f"  ✅ {place_type} {totals['rows']}행 적재 완료: 신규 {totals['inserted']}, "
+                f"갱신 {totals['updated']}, {elapsed:.1f}초 ({totals['rows'] / elapsed:.0f}행/초)"
+            )
+            print_coverage(coord_stats, totals["rows"])
         else:
             print(f"  ⚠️  업로드할 데이터가 없습니다.")
-            
+
     except Exception as e:
+        for task in pending:
+            task.cancel()
         print(f"  ❌ 오류 발생: {str(e)}")
     finally:
         client.close()
 
-async def main():
+async def main(args):
     """메인 함수"""
     print("🚀 CSV 파일을 MongoDB에 업로드합니다.\n")
-    
+
     # data 폴더 경로
     data_dir = project_root / "data"
-    
+
     # 업로드할 파일 목록
     files_to_upload = [
         {"path": data_dir / "tourist_spots.csv", "type": "관광지"},
         {"path": data_dir / "historic_sites.csv", "type": "유적지"},
     ]
-    
+
     for file_info in files_to_upload:
         file_path = file_info["path"]
         place_type = file_info["type"]
-        
+
         if file_path.exists():
             print(f"📁 {file_path.name} 파일을 업로드 중...")
-            await upload_csv_to_mongodb(str(file_path), place_type)
+            await upload_csv_to_mongodb(
+                str(file_path),
+                place_type,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
+                purge_legacy=args.purge_legacy,
+            )
         else:
             print(f"⚠️  {file_path.name} 파일을 찾을 수 없습니다.")
-    
+
     print("\n✨ 모든 작업이 완료되었습니다!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=500, help="bulk upsert 배치 크기")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 배치 쓰기 수")
+    parser.add_argument("--purge-legacy", action="store_true", help="source_key 없이 적재된 기존 문서 삭제")
+    asyncio.run(main(parser.parse_args()))
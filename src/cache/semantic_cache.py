@@ -0,0 +1,130 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+
+from src.search.ranker import tf_vector
+from src.search.text import normalize
+
+
+def canonical(text: str) -> str:
+    """정규화 후 문장 부호, 이모지 제거 ("맛집 탐방!!" -> "맛집탐방")"""
+    return "".join(ch for ch in normalize(text) if ch.isalnum())
+
+
+def unit_vector(text: str) -> np.ndarray:
+    """문자 바이그램 로그 빈도 벡터를 길이 1로 정규화 (내적 = 코사인 유사도)"""
+    vector = tf_vector(text)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """
+    문맥 키 + 유사 문장 기반 LRU + TTL 메모리 캐시
+
+    문맥(context)이 같은 항목 중 질의 문장과 코사인 유사도가 threshold 이상인
+    가장 가까운 항목의 값을 돌려줍니다. 정규화한 문장(문장 부호 제외)이 같으면 벡터 계산 없이 바로 적중합니다.
+    compatible(질의, 후보)가 False인 후보는 유사도와 관계없이 제외합니다 (예: 부정 표현이 다른 문장).
+    maxsize를 넘으면 문맥과 관계없이 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        threshold: float = 0.75,
+        vectorize: Callable[[str], np.ndarray] = unit_vector,
+        compatible: Optional[Callable[[str, str], bool]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.vectorize = vectorize
+        self.compatible = compatible
+        # (문맥, 정규화 문장) -> (만료 시각, 벡터, 값)
+        self._data: "OrderedDict[Tuple[Hashable, str], tuple[float, np.ndarray, Any]]" = OrderedDict()
+        # 문맥 -> 해당 문맥의 정규화 문장 목록
+        self._contexts: Dict[Hashable, Set[str]] = {}
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, context: Hashable, text: str) -> Optional[Any]:
+        """
+        같은 문맥에서 text와 가장 유사한 항목의 값 조회
+
+        Args:
+            context: 문맥 키 (이 값이 같은 항목끼리만 비교)
+            text: 질의 문장
+
+        Returns:
+            Optional[Any]: 유사도 threshold 이상인 항목의 값, 없으면 None
+        """
+        self._expire(context)
+        text = canonical(text)
+        item = self._data.get((context, text))
+        if item is not None:
+            self._data.move_to_end((context, text))
+            self.hits += 1
+            return item[2]
+
+        candidates = list(self._contexts.get(context, ()))
+        if self.compatible is not None:
+            candidates = [candidate for candidate in candidates if self.compatible(text, candidate)]
+        if candidates:
+            matrix = np.stack([self._data[(context, candidate)][1] for candidate in candidates])
+            scores = matrix @ self.vectorize(text)
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                key = (context, candidates[best])
+                self._data.move_to_end(key)
+                self.similar_hits += 1
+                return self._data[key][2]
+
+        self.misses += 1
+        return None
+
+    def set(self, context: Hashable, text: str, value: Any):
+        text = canonical(text)
+        key = (context, text)
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._data[key] = (expires_at, self.vectorize(text), value)
+        self._data.move_to_end(key)
+        self._contexts.setdefault(context, set()).add(text)
+        while len(self._data) > self.maxsize:
+            self._remove(next(iter(self._data)))
+
+    def clear(self):
+        self._data.clear()
+        self._contexts.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+        }
+
+    def _expire(self, context: Hashable):
+        """문맥 안의 만료된 항목 제거"""
+        if not self.ttl:
+            return
+        now = time.monotonic()
+        for text in list(self._contexts.get(context, ())):
+            if self._data[(context, text)][0] < now:
+                self._remove((context, text))
+
+    def _remove(self, key: Tuple[Hashable, str]):
+        context, text = key
+        self._data.pop(key, None)
+        texts = self._contexts.get(context)
+        if texts is not None:
+            texts.discard(text)
+            if not texts:
+                del self._contexts[context]
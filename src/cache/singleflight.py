@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 작업을 하나만 실행하고 결과를 공유
+
+    먼저 들어온 호출이 작업을 태스크로 시작하고, 완료 전에 같은 키로 들어온 호출은
+    그 태스크의 결과(또는 예외)를 함께 기다립니다. 완료되면 키를 지우므로 결과를 캐시하지는 않습니다.
+    한 호출자가 취소되어도(클라이언트 연결 종료 등) 다른 호출자를 위해 작업은 계속 진행됩니다.
+
+    진행 중인 작업은 프로세스 메모리에만 있으므로 같은 워커에 들어온 호출끼리만 합쳐지는 최선 노력 방식입니다.
+    다중 워커(src/serve.py)에서 정확성이 필요한 중복 방지는 DB 쪽(unique 인덱스 등)에 둡니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        키별로 fn을 한 번만 실행
+
+        Args:
+            key: 중복 판단 키
+            fn: 실행할 코루틴 함수 (인자 없음)
+
+        Returns:
+            (결과, 공유 여부): 다른 호출이 시작한 작업의 결과를 받았으면 공유 여부가 True
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if shared:
+            self.shared += 1
+        else:
+            self.started += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task), shared
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 호출자가 취소된 경우에도 예외 미확인 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        return {"inflight": len(self._inflight), "started": self.started, "shared": self.shared}
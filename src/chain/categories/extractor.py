@@ -1,36 +1,107 @@
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+import copy
+import hashlib
+import os
+from functools import lru_cache
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from src.cache.ttl_cache import TTLCache
 from src.chain.categories.data import PlaceFeatures
 from src.chain.categories.prompt import EXTRACTOR_PROMPT
+from src.llm.executor import run_chain
 from src.llm.llm_client import get_llm
+from src.llm.structured import STRUCTURED_OUTPUT_MODE, StructuredOutput
+from src.metrics.registry import span
+from src.model.cache import CachedTraits
 from src.model.chat import Recent
+from src.search.text import normalize
+
+features_output = StructuredOutput(EXTRACTOR_PROMPT, ["place"], PlaceFeatures, get_llm)
+
+
+@lru_cache(maxsize=1)
+def prompt_version() -> str:
+    """프롬프트/모델이 바뀌면 캐시 키도 바뀌도록 버전 해시 생성 (첫 호출 시 한 번 계산)"""
+    llm = features_output.llm
+    return hashlib.sha256(
+        "|".join([
+            EXTRACTOR_PROMPT,
+            features_output.format_instructions,
+            STRUCTURED_OUTPUT_MODE,
+            str(getattr(llm, "model_name", "")),
+            str(getattr(llm, "temperature", "")),
+        ]).encode("utf-8")
+    ).hexdigest()[:12]
 
-llm = get_llm()
-parser = PydanticOutputParser(pydantic_object=PlaceFeatures)
-format_instructions = parser.get_format_instructions()
 
-prompt = PromptTemplate(
-    template=EXTRACTOR_PROMPT,
-    input_variables=["place"],
-    partial_variables={"format_instructions": format_instructions},
+traits_cache = TTLCache(
+    maxsize=int(os.getenv("TRAITS_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("TRAITS_CACHE_TTL", "86400")),
 )
+# MongoDB 2차 캐시 사용 여부
+TRAITS_CACHE_MONGO = os.getenv("TRAITS_CACHE_MONGO", "false").lower() in ("1", "true", "yes")
+
+# MongoDB 2차 캐시 적중/실패 횟수
+mongo_cache_stats = {"hits": 0, "misses": 0}
+
+
+def traits_cache_key(place: str) -> str:
+    return f"{prompt_version()}:{normalize(place)}"
+
+
+async def get_cached_features(key: str) -> Optional[dict]:
+    """메모리 캐시 -> MongoDB 캐시 순서로 조회"""
+    features = traits_cache.get(key)
+    if features is not None or not TRAITS_CACHE_MONGO:
+        return features
+
+    cached = await CachedTraits.find_one(CachedTraits.key == key)
+    if not cached:
+        mongo_cache_stats["misses"] += 1
+        return None
+    mongo_cache_stats["hits"] += 1
+    traits_cache.set(key, cached.features)
+    return cached.features
+
+
+async def set_cached_features(key: str, features: dict):
+    traits_cache.set(key, features)
+    if TRAITS_CACHE_MONGO:
+        try:
+            await CachedTraits(key=key, features=features).insert()
+        except DuplicateKeyError:
+            # 동시에 같은 여행지를 요청한 경우 먼저 저장된 값을 유지
+            pass
+
 
 async def extract_place_traits(place: str) -> Recent:
     place = place.strip()
     if not place:
         raise ValueError("place(여행지)를 빈값으로 보낼 수 없습니다.")
-    chain = prompt | llm | parser
-    result = chain.invoke({"place": place})
 
-    if isinstance(result, PlaceFeatures):
-        parsed: PlaceFeatures = result
-    else:
-        parsed = PlaceFeatures(**result)
+    key = traits_cache_key(place)
+    with span("cache_lookup"):
+        features = await get_cached_features(key)
+
+    if features is None:
+        chain = features_output.chain()
+        result = await run_chain(chain, {"place": place}, name="categories")
+
+        if isinstance(result, PlaceFeatures):
+            parsed: PlaceFeatures = result
+        else:
+            parsed = PlaceFeatures(**result)
+
+        features = parsed.model_dump()
+        with span("cache_store"):
+            await set_cached_features(key, features)
 
     data = Recent(
-        categories= parsed.model_dump(),
+        categories=copy.deepcopy(features),
     )
 
-    await data.insert()
+    with span("recent_insert"):
+        await data.insert()
 
-    return data
\ No newline at end of file
+    return data
@@ -0,0 +1,83 @@
+import os
+from typing import NamedTuple, Optional
+
+import orjson
+from beanie import PydanticObjectId
+
+from src.cache.ttl_cache import TTLCache
+from src.metrics.registry import span
+from src.model.planner import Planner
+
+# 직렬화한 여행 계획 캐시 크기와 유지 시간(초)
+# 무효화는 쓰기가 일어난 워커 프로세스에만 적용되므로, 다른 워커가 이전 계획을 응답하는 시간은 TTL로 제한
+# (재생성 작업 등록은 GET에서 캐시보다 먼저 작업 상태를 확인하므로 TTL과 관계없이 바로 반영)
+PLANNER_CACHE_SIZE = int(os.getenv("PLANNER_CACHE_SIZE", "1024"))
+PLANNER_CACHE_TTL = float(os.getenv("PLANNER_CACHE_TTL", "30"))
+
+
+class CachedPlan(NamedTuple):
+    """GET /planner/{recent_id} 응답 본문(JSON bytes)과 ETag"""
+    etag: str
+    body: bytes
+
+
+planner_cache = TTLCache(maxsize=PLANNER_CACHE_SIZE, ttl=PLANNER_CACHE_TTL)
+# If-None-Match로 304를 응답한 횟수
+not_modified_stats = {"count": 0}
+# 무효화 횟수 (조회 중에 쓰기가 일어나면 조회한 이전 계획을 캐시에 넣지 않기 위해 사용)
+_invalidations = 0
+
+
+def plan_etag(planner: Planner) -> str:
+    """문서 ID + updated_at(ms, MongoDB 저장 정밀도) 기반 ETag"""
+    return f'"{planner.id}-{int(planner.updated_at.timestamp() * 1000)}"'
+
+
+def serialize_plan(planner: Planner) -> CachedPlan:
+    """FastAPI 기본 응답과 같은 형식(_id 별칭, JSON 호환 값)으로 한 번만 직렬화"""
+    return CachedPlan(plan_etag(planner), orjson.dumps(planner.model_dump(mode="json", by_alias=True)))
+
+
+def get_cached_plan(recent_id: PydanticObjectId) -> Optional[CachedPlan]:
+    return planner_cache.get(str(recent_id))
+
+
+def cache_plan(recent_id: PydanticObjectId, planner: Planner, invalidations: int) -> CachedPlan:
+    """
+    여행 계획을 직렬화해 캐시에 저장
+
+    Args:
+        recent_id: Recent 문서 ID
+        planner: 조회한 여행 계획
+        invalidations: 조회 시작 전 invalidation_count() 값 (그 사이 쓰기가 있었으면 저장하지 않음)
+
+    Returns:
+        CachedPlan: 직렬화 결과
+    """
+    with span("planner_serialize"):
+        cached = serialize_plan(planner)
+    if invalidations == _invalidations:
+        planner_cache.set(str(recent_id), cached)
+    return cached
+
+
+def invalidation_count() -> int:
+    return _invalidations
+
+
+def invalidate_plan(recent_id: PydanticObjectId):
+    """여행 계획 저장/수정, 재생성 작업 등록 시 호출"""
+    global _invalidations
+    _invalidations += 1
+    planner_cache.delete(str(recent_id))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 값, 약한 ETag, * 허용)가 etag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if value == "*" or value.removeprefix("W/") == etag:
+            return True
+    return False
@@ -1,5 +1,6 @@
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 
 class ScheduleItem(BaseModel):
@@ -19,6 +20,10 @@ class ScheduleItem(BaseModel):
     # 숙소 전용 필드
     accommodation_type: Optional[str] = Field(None, description="숙소 유형 (숙소인 경우)")
 
+    # 생성 후 장소 데이터와 대조한 결과 (LLM 출력 스키마에서는 제외)
+    verification: SkipJsonSchema[Optional[str]] = Field(None, description="matched(장소 데이터로 좌표 보정), unverified(일치하는 장소 없음)")
+    place_id: SkipJsonSchema[Optional[str]] = Field(None, description="일치한 Place 문서 ID")
+
 
 class DayPlan(BaseModel):
     """하루 일정"""
@@ -37,3 +42,17 @@ class TravelPlan(BaseModel):
     total_days: int = Field(..., description="전체 여행 일수")
     daily_plans: List[DayPlan] = Field(..., description="일별 여행 계획")
     overview: str = Field(..., description="전체 여행 개요 및 팁")
+
+
+class DaySkeleton(BaseModel):
+    """하루 일정 뼈대"""
+    day: int = Field(..., description="여행 일차 (1부터 시작)")
+    date: str = Field(..., description="날짜 (예: 2024-03-15)")
+    theme: str = Field(..., description="하루 일정 테마")
+    area: str = Field(..., description="하루 동안 주로 머무를 지역")
+
+
+class TripSkeleton(BaseModel):
+    """전체 여행 뼈대 (일별 테마와 지역)"""
+    days: List[DaySkeleton] = Field(..., description="일별 뼈대")
+    overview: str = Field(..., description="전체 여행 개요 및 팁")
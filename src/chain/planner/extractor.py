@@ -1,37 +1,95 @@
+import asyncio
+import os
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from beanie import PydanticObjectId
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+from pymongo.errors import DuplicateKeyError
 
-from src.chain.planner.data import TravelPlan
-from src.chain.planner.prompt import PLANNER_PROMPT
+from src.cache.singleflight import SingleFlight
+from src.chain.planner.cache import CachedPlan, cache_plan, invalidate_plan, invalidation_count
+from src.chain.planner.data import DayPlan, DaySkeleton, TravelPlan, TripSkeleton
+from src.chain.planner.prompt import DAY_PLAN_PROMPT, PLANNER_PROMPT, SKELETON_PROMPT
+from src.chain.planner.route import PLANNER_ROUTE_OPTIMIZE, optimize_day, optimize_travel_plan, replace_day_route
+from src.chain.planner.stream import DayPlanStreamParser
+from src.chain.planner.verify import count_verification, verification_enabled, verify_day, verify_travel_plan
+from src.llm.executor import run_chain, stream_chain
 from src.llm.llm_client import get_llm_for_planner
+from src.llm.structured import StructuredOutput
+from src.metrics.registry import span
 from src.model.chat import Recent
 from src.model.planner import Planner
+from src.search.place_index import find_nearby_places
 
-llm = get_llm_for_planner()
-parser = PydanticOutputParser(pydantic_object=TravelPlan)
-format_instructions = parser.get_format_instructions()
-
-prompt = PromptTemplate(
-    template=PLANNER_PROMPT,
-    input_variables=[
-        "main_place_name",
-        "main_place_address", 
-        "main_place_latitude",
-        "main_place_longitude",
-        "main_place_reason",
-        "categories",
-        "main_purpose",
-        "people",
-        "travel_days",
-        "considerations"
-    ],
-    partial_variables={"format_instructions": format_instructions},
+PLAN_INPUT_VARIABLES = [
+    "main_place_name",
+    "main_place_address", 
+    "main_place_latitude",
+    "main_place_longitude",
+    "main_place_reason",
+    "categories",
+    "main_purpose",
+    "people",
+    "travel_days",
+    "considerations",
+    "nearby_places"
+]
+
+plan_output = StructuredOutput(PLANNER_PROMPT, PLAN_INPUT_VARIABLES, TravelPlan, get_llm_for_planner)
+
+# 병렬 모드: 뼈대 생성 후 일별 일정을 동시에 생성
+skeleton_output = StructuredOutput(SKELETON_PROMPT, PLAN_INPUT_VARIABLES, TripSkeleton, get_llm_for_planner)
+
+day_output = StructuredOutput(
+    DAY_PLAN_PROMPT,
+    PLAN_INPUT_VARIABLES + ["skeleton", "day", "date", "theme", "area"],
+    DayPlan,
+    get_llm_for_planner,
 )
 
+PLANNER_MODES = ("single", "parallel")
+# 기본 생성 모드 ("single": 한 번에 전체 생성, "parallel": 뼈대 + 일별 병렬 생성)
+PLANNER_MODE = os.getenv("PLANNER_MODE", "single")
+# 요청 하나에서 동시에 생성할 최대 일수
+PLANNER_DAY_CONCURRENCY = int(os.getenv("PLANNER_DAY_CONCURRENCY", "4"))
+# 뼈대의 일수가 요청과 다를 때 뼈대를 다시 생성할 횟수 (그래도 빠진 날은 기본 뼈대로 채움)
+PLANNER_SKELETON_RETRIES = int(os.getenv("PLANNER_SKELETON_RETRIES", "1"))
+# 프롬프트에 제공할 주변 실제 장소 검색 반경(km)과 개수
+PLANNER_NEARBY_RADIUS_KM = float(os.getenv("PLANNER_NEARBY_RADIUS_KM", "30"))
+PLANNER_NEARBY_LIMIT = int(os.getenv("PLANNER_NEARBY_LIMIT", "15"))
+
+# 일별 일정이 완성될 때마다 호출되는 콜백 (진행 상황 저장용)
+DayCallback = Callable[[DayPlan], Awaitable[None]]
+
+# (recent_id, 메인 여행지, 모드)별로 진행 중인 계획 생성 (같은 요청의 중복 호출은 진행 중인 생성에 합류)
+# 같은 워커 안에서만 합쳐지며, 워커 간 중복 저장은 planners.recent_id unique 인덱스가 막음
+planner_flight = SingleFlight("planner")
+# (recent_id, 일차)별로 진행 중인 하루 일정 재생성
+day_flight = SingleFlight("planner.day")
+
+
+async def format_nearby_places(main_place: Dict[str, Any]) -> str:
+    """메인 여행지 주변의 실제 장소 목록을 프롬프트용 문자열로 포맷팅"""
+    latitude = main_place.get("latitude")
+    longitude = main_place.get("longitude")
+    if not latitude or not longitude:
+        return "후보 없음"
+    
+    with span("place_nearby"):
+        nearby = await find_nearby_places(
+            float(latitude),
+            float(longitude),
+            radius_km=PLANNER_NEARBY_RADIUS_KM,
+            limit=PLANNER_NEARBY_LIMIT,
+        )
+    lines = [
+        f"- {place.name} | {place.address or ''} | {place.latitude:.6f}, {place.longitude:.6f} | {distance:.1f}km"
+        for place, distance in nearby
+        if place.name != main_place.get("name")
+    ]
+    return "\n".join(lines) if lines else "후보 없음"
+
 
 def parse_travel_days(day_str: str) -> int:
     """여행 기간 문자열을 일수로 변환"""
@@ -68,27 +126,23 @@ def parse_travel_days(day_str: str) -> int:
         return 1
 
 
-async def create_travel_plan(
+async def build_plan_inputs(
     recent_id: PydanticObjectId,
     main_place: Dict[str, Any]
-) -> Planner:
+) -> Dict[str, Any]:
     """
-    메인 여행지를 기반으로 전체 여행 계획을 생성하고 DB에 저장합니다.
+    Recent 데이터와 메인 여행지 정보로 planner 프롬프트 입력값을 구성합니다.
     
     Args:
         recent_id: Recent 문서 ID
         main_place: 메인 여행지 정보
-            - name: 장소 이름
-            - address: 주소
-            - latitude: 위도
-            - longitude: 경도
-            - reason: 선택 이유
     
     Returns:
-        Planner: 저장된 여행 계획 문서
+        Dict[str, Any]: PLANNER_PROMPT 입력값
     """
     # 1. Recent 데이터 가져오기
-    recent = await Recent.get(recent_id)
+    with span("recent_get"):
+        recent = await Recent.get(recent_id)
     if not recent:
         raise ValueError("Recent 데이터를 찾을 수 없습니다.")
     
@@ -127,10 +181,7 @@ async def create_travel_plan(
     if not categories_str:
         categories_str = "일반 관광"
     
-    # 3. AI에게 여행 계획 요청
-    chain = prompt | llm | parser
-    
-    result = chain.invoke({
+    return {
         "main_place_name": main_place.get("name", ""),
         "main_place_address": main_place.get("address", ""),
         "main_place_latitude": main_place.get("latitude", 0.0),
@@ -141,14 +192,17 @@ async def create_travel_plan(
         "people": people,
         "travel_days": travel_days,
         "considerations": considerations,
-    })
-    
-    if isinstance(result, TravelPlan):
-        travel_plan = result
-    else:
-        travel_plan = TravelPlan(**result)
-    
-    # 4. Planner 문서 생성 및 저장
+        "nearby_places": await format_nearby_places(main_place),
+    }
+
+
+async def save_travel_plan(recent_id: PydanticObjectId, travel_plan: TravelPlan) -> Planner:
+    """TravelPlan의 관광지를 장소 데이터로 검증/보정하고 일별 동선을 최적화한 뒤 Planner 문서로 저장"""
+    # 좌표를 먼저 보정해야 동선 계산에 실제 좌표가 쓰임
+    with span("place_verify"):
+        verification = verify_travel_plan(travel_plan)
+    with span("route_optimize"):
+        route = optimize_travel_plan(travel_plan)
     planner = Planner(
         recent_id=recent_id,
         main_destination_name=travel_plan.main_destination_name,
@@ -158,13 +212,499 @@ async def create_travel_plan(
         total_days=travel_plan.total_days,
         daily_plans=[plan.model_dump() for plan in travel_plan.daily_plans],
         overview=travel_plan.overview,
+        verification=verification,
+        route=route,
+    )
+    
+    with span("planner_insert"):
+        try:
+            await planner.insert()
+        except DuplicateKeyError:
+            # recent_id는 unique 인덱스이므로 다시 생성한 계획은 기존 문서를 덮어씀
+            existing = await Planner.find_one(Planner.recent_id == recent_id)
+            planner.id = existing.id
+            planner.created_at = existing.created_at
+            await planner.replace()
+    invalidate_plan(recent_id)
+    
+    return planner
+
+
+async def _generate_single(inputs: Dict[str, Any]) -> TravelPlan:
+    """한 번의 LLM 호출로 전체 일정 생성"""
+    chain = plan_output.chain()
+    result = await run_chain(chain, inputs, model="planner", name="planner")
+    
+    if isinstance(result, TravelPlan):
+        return result
+    return TravelPlan(**result)
+
+
+def _skeleton_days(days: List[DaySkeleton], travel_days: int) -> Dict[int, DaySkeleton]:
+    """
+    뼈대를 {일차: 뼈대}로 정리 (중복 일차는 처음 것만 사용)
+
+    서로 다른 일차가 정확히 travel_days개면 번호가 어긋나도(0부터 시작 등) 순서대로 1~travel_days로 다시 매기고,
+    그렇지 않으면 1~travel_days 범위의 일차만 남깁니다.
+    """
+    distinct: Dict[int, DaySkeleton] = {}
+    for day in sorted(days, key=lambda d: d.day):
+        distinct.setdefault(day.day, day)
+    if len(distinct) == travel_days:
+        return {i: day.model_copy(update={"day": i}) for i, day in enumerate(distinct.values(), start=1)}
+    return {number: day for number, day in distinct.items() if 1 <= number <= travel_days}
+
+
+def _fill_skeleton_days(by_day: Dict[int, DaySkeleton], travel_days: int, main_address: str) -> List[DaySkeleton]:
+    """
+    빠진 일차를 기본 뼈대로 채워 1~travel_days 순서의 목록 반환
+
+    날짜는 있는 일차의 날짜(YYYY-MM-DD)에서 일수만큼 더해 계산하고, 지역은 앞 일차(없으면 메인 여행지 주소)를 따릅니다.
+
+    Args:
+        by_day: {일차: 뼈대}
+        travel_days: 여행 일수
+        main_address: 메인 여행지 주소
+
+    Returns:
+        List[DaySkeleton]: 일차 순서의 뼈대 목록
+    """
+    base = None
+    for number, day in sorted(by_day.items()):
+        try:
+            base = datetime.strptime(day.date, "%Y-%m-%d") - timedelta(days=number - 1)
+            break
+        except ValueError:
+            continue
+
+    days = []
+    for number in range(1, travel_days + 1):
+        day = by_day.get(number)
+        if day is None:
+            date = (base + timedelta(days=number - 1)).strftime("%Y-%m-%d") if base else ""
+            area = days[-1].area if days else main_address
+            day = DaySkeleton(day=number, date=date, theme="주변 관광 및 자유 일정", area=area)
+        days.append(day)
+    return days
+
+
+async def _generate_parallel(inputs: Dict[str, Any], on_day: Optional[DayCallback] = None) -> TravelPlan:
+    """짧은 뼈대를 먼저 생성한 뒤 일별 일정을 동시에 생성해 합침"""
+    travel_days = inputs["travel_days"]
+    skeleton: TripSkeleton = await run_chain(
+        skeleton_output.chain(), inputs, model="planner", name="planner.skeleton"
+    )
+    by_day = _skeleton_days(skeleton.days, travel_days)
+    for _ in range(PLANNER_SKELETON_RETRIES):
+        if len(by_day) == travel_days:
+            break
+        retry: TripSkeleton = await run_chain(
+            skeleton_output.chain(), inputs, model="planner", name="planner.skeleton"
+        )
+        for number, day in _skeleton_days(retry.days, travel_days).items():
+            by_day.setdefault(number, day)
+    if len(by_day) < travel_days:
+        print(f"⚠️  뼈대에 {travel_days}일 중 {len(by_day)}일만 있어 나머지는 기본 뼈대로 채웁니다.")
+    days = _fill_skeleton_days(by_day, travel_days, inputs["main_place_address"])
+    skeleton_str = "\n".join(f"- Day {d.day} ({d.date}): {d.theme} / {d.area}" for d in days)
+    
+    semaphore = asyncio.Semaphore(PLANNER_DAY_CONCURRENCY)
+    day_chain = day_output.chain()
+    
+    async def generate_day(day) -> DayPlan:
+        async with semaphore:
+            day_plan: DayPlan = await run_chain(day_chain, {
+                **inputs,
+                "skeleton": skeleton_str,
+                "day": day.day,
+                "date": day.date,
+                "theme": day.theme,
+                "area": day.area,
+            }, model="planner", name="planner.day")
+        day_plan.day = day.day
+        if on_day:
+            await on_day(day_plan)
+        return day_plan
+    
+    daily_plans = await asyncio.gather(*(generate_day(day) for day in days))
+    
+    return TravelPlan(
+        main_destination_name=inputs["main_place_name"],
+        main_destination_address=inputs["main_place_address"],
+        main_destination_latitude=inputs["main_place_latitude"],
+        main_destination_longitude=inputs["main_place_longitude"],
+        total_days=len(daily_plans),
+        daily_plans=list(daily_plans),
+        overview=skeleton.overview,
+    )
+
+
+async def generate_travel_plan(
+    inputs: Dict[str, Any],
+    mode: Optional[str] = None,
+    on_day: Optional[DayCallback] = None
+) -> TravelPlan:
+    """
+    프롬프트 입력값으로 TravelPlan 생성 (DB 저장 없음)
+    
+    Args:
+        inputs: build_plan_inputs 결과
+        mode: "single" 또는 "parallel" (기본값: PLANNER_MODE)
+        on_day: parallel 모드에서 하루 일정이 완성될 때마다 호출할 콜백
+    
+    Returns:
+        TravelPlan: 생성된 여행 계획
+    """
+    mode = mode or PLANNER_MODE
+    if mode not in PLANNER_MODES:
+        raise ValueError(f"지원하지 않는 planner 모드입니다: {mode}")
+    
+    if mode == "parallel":
+        return await _generate_parallel(inputs, on_day)
+    return await _generate_single(inputs)
+
+
+class DayFanout:
+    """
+    진행 중인 계획 생성 하나의 일별 일정을 합류한 모든 호출자의 콜백에 전달
+
+    먼저 시작한 호출만 생성을 실행하므로, 나중에 합류한 호출(백그라운드 작업 등)의 콜백도
+    받을 수 있도록 완성된 일정을 모아 두고 구독한 콜백 모두에 전달합니다.
+    """
+
+    def __init__(self):
+        self.days: List[DayPlan] = []
+        self.callbacks: List[DayCallback] = []
+        self.closed = False
+
+    def subscribe(self, on_day: DayCallback) -> List[DayPlan]:
+        """콜백 등록 후 이미 완성된 일정 반환 (합류한 호출이 따로 전달)"""
+        self.callbacks.append(on_day)
+        return list(self.days)
+
+    def unsubscribe(self, on_day: DayCallback):
+        if on_day in self.callbacks:
+            self.callbacks.remove(on_day)
+
+    async def publish(self, day_plan: DayPlan):
+        self.days.append(day_plan)
+        for callback in list(self.callbacks):
+            try:
+                await callback(day_plan)
+            except Exception as e:
+                # 한 호출자의 진행 상황 저장 실패가 다른 호출자의 생성을 멈추지 않도록
+                print(f"⚠️ planner day callback failed: {e}")
+
+
+# 진행 중인 계획 생성별 일정 전달 (planner_flight와 같은 키)
+_day_fanouts: Dict[Any, DayFanout] = {}
+
+
+def plan_flight_key(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any],
+    mode: Optional[str] = None
+) -> tuple:
+    """
+    계획 생성 중복 판단 키
+
+    프롬프트에 들어가는 메인 여행지 값과 생성 모드가 같은 요청만 같은 생성으로 봅니다
+    (같은 Recent라도 다른 여행지/모드로 다시 요청하면 따로 생성).
+    """
+    fields = ("name", "address", "latitude", "longitude", "reason")
+    place = tuple(str(main_place.get(field, "")).strip() for field in fields)
+    return (str(recent_id), place, mode or PLANNER_MODE)
+
+
+async def create_travel_plan(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any],
+    mode: Optional[str] = None,
+    on_day: Optional[DayCallback] = None
+) -> Planner:
+    """
+    메인 여행지를 기반으로 전체 여행 계획을 생성하고 DB에 저장합니다.
+    같은 recent_id, 메인 여행지, 모드로 이미 생성 중인 계획이 있으면(중복 클릭, 재시도) 새로 만들지 않고
+    그 결과를 함께 받습니다. 합류한 호출의 on_day도 이미 완성된 일정부터 차례로 호출됩니다.
+    
+    Args:
+        recent_id: Recent 문서 ID
+        main_place: 메인 여행지 정보
+            - name: 장소 이름
+            - address: 주소
+            - latitude: 위도
+            - longitude: 경도
+            - reason: 선택 이유
+        mode: 생성 모드 ("single" 또는 "parallel", 기본값: PLANNER_MODE 환경 변수)
+        on_day: parallel 모드에서 하루 일정이 완성될 때마다 호출할 콜백
+    
+    Returns:
+        Planner: 저장된 여행 계획 문서
+    """
+    key = plan_flight_key(recent_id, main_place, mode)
+    return await _join_plan(
+        key,
+        lambda publish: _create_travel_plan(recent_id, main_place, mode, publish),
+        on_day,
     )
+
+
+async def _join_plan(
+    key: tuple,
+    generate: Callable[[DayCallback], Awaitable[Planner]],
+    on_day: Optional[DayCallback]
+) -> Planner:
+    """
+    planner_flight로 계획 생성을 실행하거나 진행 중인 생성에 합류
+
+    Args:
+        key: plan_flight_key 결과
+        generate: 생성 함수 (완성된 일정을 전달할 콜백을 받아 저장된 Planner 반환)
+        on_day: 하루 일정이 완성될 때마다 호출할 콜백
+
+    Returns:
+        Planner: 저장된 여행 계획 문서
+    """
+    fanout = _day_fanouts.get(key)
+    if fanout is None or fanout.closed:
+        fanout = _day_fanouts[key] = DayFanout()
+    
+    async def lead() -> Planner:
+        try:
+            return await generate(fanout.publish)
+        finally:
+            fanout.closed = True
+            if _day_fanouts.get(key) is fanout:
+                del _day_fanouts[key]
     
-    await planner.insert()
+    if on_day is None:
+        planner, _ = await planner_flight.do(key, lead)
+        return planner
     
+    replay = fanout.subscribe(on_day)
+    
+    async def replay_days():
+        for day_plan in replay:
+            await on_day(day_plan)
+    
+    try:
+        # 합류 여부가 먼저 정해지도록 생성 호출을 먼저 시작
+        (planner, _), _ = await asyncio.gather(planner_flight.do(key, lead), replay_days())
+    finally:
+        fanout.unsubscribe(on_day)
     return planner
 
 
+async def _create_travel_plan(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any],
+    mode: Optional[str],
+    on_day: Optional[DayCallback]
+) -> Planner:
+    inputs = await build_plan_inputs(recent_id, main_place)
+    
+    # 3. AI에게 여행 계획 요청
+    travel_plan = await generate_travel_plan(inputs, mode, on_day)
+    
+    # 4. Planner 문서 생성 및 저장
+    return await save_travel_plan(recent_id, travel_plan)
+
+
+async def stream_travel_plan(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    여행 계획을 스트리밍으로 생성합니다.
+    
+    입력값 검증(Recent 조회)은 즉시 수행하고, 생성 이벤트는 반환된 이터레이터로 전달합니다.
+    생성은 create_travel_plan과 같은 planner_flight(single 모드 키)로 실행되므로, 같은 요청의
+    동시 호출(스트림, 동기 호출, 같은 워커의 백그라운드 작업)은 LLM 호출 하나를 공유합니다.
+    스트림이 다른 호출의 single 모드 생성에 합류하면 day 이벤트 없이 done만 전달될 수 있고,
+    클라이언트 연결이 끊겨도 생성은 끝까지 진행되어 저장됩니다.
+    
+    day 이벤트는 장소 검증과 동선 최적화 전의 일정이므로, 클라이언트는 done을 받으면
+    표시 중인 일정을 done의 daily_plans로 교체해야 합니다 (좌표, 순서, 일정이 달라질 수 있음).
+    
+    Returns:
+        AsyncIterator[Dict[str, Any]]: 이벤트 스트림
+            - {"event": "day", "data": DayPlan}: 하루 일정이 완성될 때마다 (검증/동선 최적화 전)
+            - {"event": "done", "data": Planner}: 전체 계획 저장 후 (최종 일정)
+            - {"event": "error", "message": str}: 생성/파싱/저장 실패 시
+    """
+    inputs = await build_plan_inputs(recent_id, main_place)
+    return _stream_plan_events(recent_id, main_place, inputs)
+
+
+async def _stream_plan_events(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any],
+    inputs: Dict[str, Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    days: "asyncio.Queue[DayPlan]" = asyncio.Queue()
+    
+    async def on_day(day_plan: DayPlan):
+        days.put_nowait(day_plan)
+    
+    generation = asyncio.ensure_future(_join_plan(
+        plan_flight_key(recent_id, main_place, "single"),
+        lambda publish: _stream_travel_plan(recent_id, inputs, publish),
+        on_day,
+    ))
+    try:
+        while True:
+            next_day = asyncio.ensure_future(days.get())
+            await asyncio.wait([next_day, generation], return_when=asyncio.FIRST_COMPLETED)
+            if not next_day.done():
+                next_day.cancel()
+                break
+            yield {"event": "day", "data": next_day.result().model_dump()}
+        while not days.empty():
+            yield {"event": "day", "data": days.get_nowait().model_dump()}
+        
+        try:
+            planner = generation.result()
+        except Exception as e:
+            yield {"event": "error", "message": str(e)}
+            return
+        yield {"event": "done", "data": planner.model_dump(mode="json")}
+    finally:
+        # 연결이 끊겨도 생성은 planner_flight에서 계속 진행 (이 호출자만 대기 중단)
+        generation.cancel()
+
+
+async def _stream_travel_plan(
+    recent_id: PydanticObjectId,
+    inputs: Dict[str, Any],
+    on_day: DayCallback
+) -> Planner:
+    # 일정을 부분적으로 파싱하려면 응답 텍스트가 필요하므로 스트리밍은 항상 parser 방식 프롬프트를 사용
+    chain = plan_output.parser_prompt | plan_output.llm
+    stream_parser = DayPlanStreamParser()
+    chunks = []
+    
+    async for chunk in stream_chain(chain, inputs, model="planner", name="planner"):
+        text = chunk.content if isinstance(chunk.content, str) else ""
+        chunks.append(text)
+        for day_plan in stream_parser.feed(text):
+            await on_day(day_plan)
+    
+    with span("parse.planner"):
+        travel_plan = plan_output.parser.parse("".join(chunks))
+    
+    return await save_travel_plan(recent_id, travel_plan)
+
+
+def _day_context(day_plan: Dict[str, Any]) -> str:
+    """이웃한 날의 요약과 방문 장소 (재생성할 날의 프롬프트에 뼈대로 제공)"""
+    names = ", ".join(item.get("name", "") for item in day_plan.get("schedule", []))
+    return f"- Day {day_plan.get('day')} ({day_plan.get('date', '')}): {day_plan.get('summary', '')} / 일정: {names}"
+
+
+def _day_area(day_plan: Dict[str, Any], default: str) -> str:
+    """하루 일정 관광지 주소에서 가장 많이 나온 시도/시군구"""
+    areas = Counter(
+        " ".join(item.get("address", "").split()[:2])
+        for item in day_plan.get("schedule", [])
+        if item.get("type") == "place" and item.get("address")
+    )
+    return areas.most_common(1)[0][0] if areas else default
+
+
+async def regenerate_day(
+    recent_id: PydanticObjectId,
+    day: int,
+    theme: Optional[str] = None,
+    area: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    저장된 여행 계획의 하루 일정만 다시 생성해 해당 배열 원소만 갱신합니다.
+    앞뒤 날의 일정만 프롬프트에 넣으므로 여행 기간이 길어도 토큰 사용량과 지연 시간이 일정합니다.
+    
+    Args:
+        recent_id: Recent 문서 ID
+        day: 다시 생성할 일차 (1부터 시작)
+        theme: 새 테마 (없으면 기존 하루 요약)
+        area: 새 지역 (없으면 기존 관광지 주소에서 추출)
+    
+    Returns:
+        Dict[str, Any]: 새로 저장된 DayPlan
+    """
+    day_plan, _ = await day_flight.do(
+        (str(recent_id), day, theme, area),
+        lambda: _regenerate_day(recent_id, day, theme, area),
+    )
+    return day_plan
+
+
+async def _regenerate_day(
+    recent_id: PydanticObjectId,
+    day: int,
+    theme: Optional[str],
+    area: Optional[str]
+) -> Dict[str, Any]:
+    planner = await get_travel_plan(recent_id)
+    days = {plan.get("day"): plan for plan in planner.daily_plans}
+    current = days.get(day)
+    if current is None:
+        raise ValueError(f"{day}일차 일정이 없습니다. (전체 {planner.total_days}일)")
+    
+    main_place = {
+        "name": planner.main_destination_name,
+        "address": planner.main_destination_address,
+        "latitude": planner.main_destination_latitude,
+        "longitude": planner.main_destination_longitude,
+    }
+    inputs = await build_plan_inputs(recent_id, main_place)
+    neighbours = [days[d] for d in (day - 1, day + 1) if d in days]
+    
+    day_plan: DayPlan = await run_chain(day_output.chain(), {
+        **inputs,
+        "travel_days": planner.total_days,
+        "skeleton": "\n".join(_day_context(plan) for plan in neighbours) or "없음",
+        "day": day,
+        "date": current.get("date", ""),
+        "theme": theme or current.get("summary", ""),
+        "area": area or _day_area(current, planner.main_destination_address),
+    }, model="planner", name="planner.day_edit")
+    day_plan.day = day
+    day_plan.date = current.get("date", day_plan.date)
+    
+    verified = verification_enabled()
+    if verified:
+        with span("place_verify"):
+            verify_day(day_plan)
+    route_report = None
+    if PLANNER_ROUTE_OPTIMIZE:
+        with span("route_optimize"):
+            route_report = optimize_day(day_plan)
+    
+    # 계획 전체의 검증/동선 요약도 새 일정 기준으로 다시 계산
+    data = day_plan.model_dump()
+    daily_plans = [data if plan.get("day") == day else plan for plan in planner.daily_plans]
+    verification = None
+    if verified or planner.verification is not None:
+        verification = count_verification(daily_plans)
+    route = replace_day_route(planner.route, route_report)
+    
+    # 해당 일차 원소만 위치 연산자로 교체 (다른 날은 그대로)
+    # 요약을 읽은 문서 기준으로 계산했으므로 그 사이 다른 수정이 있었으면 저장하지 않음 (updated_at 비교)
+    with span("planner_day_update"):
+        result = await Planner.get_pymongo_collection().update_one(
+            {"recent_id": recent_id, "daily_plans.day": day, "updated_at": planner.updated_at},
+            {"$set": {
+                "updated_at": datetime.now(),
+                "verification": verification,
+                "route": route,
+                "daily_plans.$": data,
+            }},
+        )
+    if result.matched_count == 0:
+        raise ValueError("여행 계획이 변경되어 일정을 저장하지 못했습니다. 다시 시도해주세요.")
+    invalidate_plan(recent_id)
+    return data
+
+
 async def get_travel_plan(recent_id: PydanticObjectId) -> Planner:
     """
     Recent ID로 저장된 여행 계획 조회
@@ -175,7 +715,23 @@ async def get_travel_plan(recent_id: PydanticObjectId) -> Planner:
     Returns:
         Planner: 여행 계획 문서
     """
-    planner = await Planner.find_one(Planner.recent_id == recent_id)
+    with span("planner_find"):
+        planner = await Planner.find_one(Planner.recent_id == recent_id)
     if not planner:
         raise ValueError("해당 Recent ID에 대한 여행 계획을 찾을 수 없습니다.")
     return planner
+
+
+async def load_serialized_plan(recent_id: PydanticObjectId) -> CachedPlan:
+    """
+    저장된 여행 계획을 DB에서 조회해 JSON bytes와 ETag로 직렬화하고 캐시에 저장 (캐시 조회는 get_cached_plan)
+    
+    Args:
+        recent_id: Recent 문서 ID
+    
+    Returns:
+        CachedPlan: (etag, body)
+    """
+    invalidations = invalidation_count()
+    planner = await get_travel_plan(recent_id)
+    return cache_plan(recent_id, planner, invalidations)
@@ -0,0 +1,251 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import NotIn
+from pymongo.errors import DuplicateKeyError
+
+from src.chain.planner.cache import invalidate_plan
+from src.chain.planner.data import DayPlan
+from src.chain.planner.extractor import PLANNER_MODES, create_travel_plan
+from src.model.chat import Recent
+from src.model.planner_job import PlannerJob
+
+# POST /planner 기본 동작 (1: 작업 ID를 바로 반환하고 백그라운드에서 생성, 0: 생성이 끝날 때까지 대기)
+PLANNER_BACKGROUND = os.getenv("PLANNER_BACKGROUND", "1") == "1"
+# 동시에 실행할 백그라운드 생성 작업 수
+PLANNER_JOB_WORKERS = int(os.getenv("PLANNER_JOB_WORKERS", "4"))
+# running 상태로 이 시간(초) 동안 갱신이 없으면 서버가 중단된 것으로 보고 다시 실행
+PLANNER_JOB_STALE_SECONDS = float(os.getenv("PLANNER_JOB_STALE_SECONDS", "600"))
+# 중단된 작업 확인 주기 (초)
+PLANNER_JOB_RECOVERY_SECONDS = float(os.getenv("PLANNER_JOB_RECOVERY_SECONDS", "60"))
+# 작업당 최대 실행 시도 횟수 (서버 중단으로 재실행되는 경우 포함)
+PLANNER_JOB_MAX_ATTEMPTS = int(os.getenv("PLANNER_JOB_MAX_ATTEMPTS", "3"))
+
+ACTIVE_STATUSES = ["queued", "running"]
+
+
+def job_status(job: PlannerJob) -> Dict[str, Any]:
+    """작업 상태 응답"""
+    return {
+        "job_id": str(job.id),
+        "recent_id": str(job.recent_id),
+        "status": job.status,
+        "days": job.days,
+        "planner_id": str(job.planner_id) if job.planner_id else None,
+        "error": job.error,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+
+class PlannerJobQueue:
+    """
+    백그라운드 여행 계획 생성 작업 큐
+
+    작업 상태는 planner_jobs 컬렉션에 저장하고, 프로세스 안에서는 작업 ID만 큐에 넣어
+    정해진 수의 워커가 처리합니다. 워커는 queued -> running을 조건부 갱신으로 선점하므로
+    같은 작업이 여러 번 큐에 들어가거나 여러 프로세스가 복구해도 한 번만 실행됩니다.
+    서버가 중단되어 running으로 남은 작업은 주기적인 복구에서 다시 queued로 돌립니다.
+    """
+
+    def __init__(self, workers: int = PLANNER_JOB_WORKERS):
+        self.workers = workers
+        self._queue: "asyncio.Queue[PydanticObjectId]" = asyncio.Queue()
+        self._queued: Set[PydanticObjectId] = set()
+        self._running: Set[PydanticObjectId] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    def enqueue(self, job_id: PydanticObjectId):
+        if job_id in self._queued or job_id in self._running:
+            return
+        self._queued.add(job_id)
+        self._queue.put_nowait(job_id)
+
+    async def start(self):
+        """미완료 작업을 복구하고 워커 시작"""
+        await self.recover()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._recover_periodically(PLANNER_JOB_RECOVERY_SECONDS)))
+
+    async def stop(self):
+        """워커 종료 (실행 중이던 작업은 queued로 되돌려 다음 시작 시 바로 이어서 실행)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._running:
+            await PlannerJob.find(
+                {"_id": {"$in": list(self._running)}},
+                PlannerJob.status == "running",
+            ).update_many({"$set": {"status": "queued", "updated_at": datetime.now()}})
+            self._running.clear()
+
+    async def recover(self) -> int:
+        """
+        중단된 작업 정리 후 queued 작업을 큐에 추가
+
+        Returns:
+            int: 큐에 추가한 작업 수
+        """
+        now = datetime.now()
+        stale = now - timedelta(seconds=PLANNER_JOB_STALE_SECONDS)
+        await PlannerJob.find(
+            PlannerJob.status == "running",
+            PlannerJob.updated_at < stale,
+            PlannerJob.attempts >= PLANNER_JOB_MAX_ATTEMPTS,
+        ).update_many({"$set": {
+            "status": "failed",
+            "error": "여행 계획 생성이 반복해서 중단되었습니다.",
+            "updated_at": now,
+            "finished_at": now,
+        }})
+        await PlannerJob.find(
+            PlannerJob.status == "running",
+            PlannerJob.updated_at < stale,
+        ).update_many({"$set": {"status": "queued", "updated_at": now}})
+
+        count = 0
+        async for job in PlannerJob.find(PlannerJob.status == "queued").sort(PlannerJob.created_at):
+            if job.id not in self._queued and job.id not in self._running:
+                self.enqueue(job.id)
+                count += 1
+        return count
+
+    async def _recover_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.recover()
+            except Exception as e:
+                print(f"planner job recovery failed: {e}")
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                print(f"planner job {job_id} failed: {e}")
+
+    async def _run(self, job_id: PydanticObjectId):
+        # 다른 워커/프로세스가 먼저 가져간 작업이면 건너뜀
+        now = datetime.now()
+        job = await PlannerJob.find_one(
+            PlannerJob.id == job_id,
+            PlannerJob.status == "queued",
+        ).update(
+            {"$set": {"status": "running", "started_at": now, "updated_at": now}, "$inc": {"attempts": 1}},
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+        if not job:
+            return
+
+        async def on_day(day_plan: DayPlan):
+            # 완성된 일정을 바로 저장 (updated_at 갱신이 진행 중 표시 역할도 함)
+            await PlannerJob.find_one(PlannerJob.id == job_id, PlannerJob.status == "running").update(
+                {"$push": {"days": day_plan.model_dump()}, "$set": {"updated_at": datetime.now()}}
+            )
+
+        self._running.add(job_id)
+        try:
+            planner = await create_travel_plan(job.recent_id, job.main_place, job.mode, on_day=on_day)
+        except asyncio.CancelledError:
+            # 서버 종료: _running에 남겨 stop()에서 queued로 되돌림
+            raise
+        except Exception as e:
+            update = {"status": "failed", "error": str(e)}
+        else:
+            update = {"status": "done", "planner_id": planner.id, "days": planner.daily_plans}
+        self._running.discard(job_id)
+
+        now = datetime.now()
+        await PlannerJob.find_one(PlannerJob.id == job_id, PlannerJob.status == "running").update(
+            {"$set": {**update, "updated_at": now, "finished_at": now}}
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {"queued": self._queue.qsize(), "running": len(self._running), "workers": self.workers}
+
+
+planner_jobs = PlannerJobQueue()
+
+
+async def submit_planner_job(
+    recent_id: PydanticObjectId,
+    main_place: Dict[str, Any],
+    mode: Optional[str] = None
+) -> PlannerJob:
+    """
+    여행 계획 생성 작업 등록
+
+    같은 Recent의 작업이 이미 queued/running이면 새로 만들지 않고 그 작업을 반환하고,
+    완료/실패한 작업이 있으면 새 입력값으로 다시 queued 상태로 만듭니다.
+
+    Args:
+        recent_id: Recent 문서 ID
+        main_place: 메인 여행지 정보
+        mode: 생성 모드 ("single" 또는 "parallel", 기본값: PLANNER_MODE 환경 변수)
+
+    Returns:
+        PlannerJob: 등록(또는 진행 중인) 작업
+    """
+    if mode and mode not in PLANNER_MODES:
+        raise ValueError(f"지원하지 않는 planner 모드입니다: {mode}")
+    if not await Recent.get(recent_id):
+        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
+
+    job = PlannerJob(recent_id=recent_id, main_place=main_place, mode=mode)
+    try:
+        await job.insert()
+    except DuplicateKeyError:
+        now = datetime.now()
+        job = await PlannerJob.find_one(
+            PlannerJob.recent_id == recent_id,
+            NotIn(PlannerJob.status, ACTIVE_STATUSES),
+        ).update(
+            {"$set": {
+                "main_place": main_place,
+                "mode": mode,
+                "status": "queued",
+                "days": [],
+                "planner_id": None,
+                "error": None,
+                "attempts": 0,
+                "created_at": now,
+                "updated_at": now,
+                "started_at": None,
+                "finished_at": None,
+            }},
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+        if not job:
+            # 이미 진행 중인 작업에 합류
+            return await PlannerJob.find_one(PlannerJob.recent_id == recent_id)
+
+    # 캐시된 이전 계획 대신 작업 상태를 응답하도록
+    invalidate_plan(recent_id)
+    planner_jobs.enqueue(job.id)
+    return job
+
+
+async def get_job_status(recent_id: PydanticObjectId) -> Optional[Dict[str, Any]]:
+    """
+    Recent ID의 생성 작업 상태 조회
+
+    작업이 진행 중이거나 실패했으면 작업 상태를, 작업이 없거나 완료됐으면 None을 반환합니다
+    (이 경우 저장된 여행 계획을 그대로 응답).
+    GET /planner/{recent_id}마다 호출되므로 먼저 상태만 조회하고(recent_id unique 인덱스),
+    완료되지 않은 작업만 일별 일정을 포함한 전체 문서를 읽습니다.
+    """
+    state = await PlannerJob.get_pymongo_collection().find_one({"recent_id": recent_id}, {"status": 1})
+    if not state or state.get("status") == "done":
+        return None
+    job = await PlannerJob.find_one(PlannerJob.recent_id == recent_id)
+    if job and job.status != "done":
+        return job_status(job)
+    return None
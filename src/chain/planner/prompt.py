@@ -14,6 +14,9 @@ PLANNER_PROMPT = """당신은 전문 여행 플래너입니다. 사용자가 선
 - 여행 기간: {travel_days}일 (반드시 {travel_days}일 전체에 대한 일정을 작성해야 합니다)
 - 고려사항: {considerations}
 
+## 주변 실제 장소 후보 (이름 | 주소 | 위도, 경도 | 메인 여행지로부터 거리)
+{nearby_places}
+
 ## 작성 지침
 
 1. **메인 여행지를 중심으로 계획 구성**
@@ -22,7 +25,8 @@ PLANNER_PROMPT = """당신은 전문 여행 플래너입니다. 사용자가 선
 
 2. **주변 추가 여행지 추천**
    - 메인 여행지로부터 30km 이내의 관광지, 명소, 체험 장소 추천
-   - 실제로 존재하는 장소만 추천하고 정확한 주소, 위도, 경도 포함
+   - 위 "주변 실제 장소 후보"에서 우선 선택하고, 후보의 주소와 위도/경도를 그대로 사용
+   - 후보 외의 장소는 실제로 존재하는 장소만 추천하고 정확한 주소, 위도, 경도 포함
 
 3. **식당 추천**
    - 반드시 실제로 존재하는 식당만 추천
@@ -69,3 +73,72 @@ PLANNER_PROMPT = """당신은 전문 여행 플래너입니다. 사용자가 선
 반드시 {travel_days}일 전체에 대한 일정을 작성해주세요.
 중복된 장소, 식당, 숙소가 없도록 주의해주세요.
 """
+
+SKELETON_PROMPT = """당신은 전문 여행 플래너입니다. 상세 일정을 작성하기 전에 여행 전체의 뼈대만 짧게 작성해주세요.
+
+## 메인 여행지 정보
+- 이름: {main_place_name}
+- 주소: {main_place_address}
+- 위도: {main_place_latitude}
+- 경도: {main_place_longitude}
+- 선택 이유: {main_place_reason}
+
+## 사용자 정보
+- 여행 카테고리: {categories}
+- 여행 목적: {main_purpose}
+- 인원: {people}
+- 여행 기간: {travel_days}일
+- 고려사항: {considerations}
+
+## 주변 실제 장소 후보 (이름 | 주소 | 위도, 경도 | 메인 여행지로부터 거리)
+{nearby_places}
+
+## 작성 지침
+1. Day 1부터 Day {travel_days}까지 정확히 {travel_days}개의 일별 뼈대를 작성
+2. 각 날짜마다 테마(theme)와 주로 머무를 지역(area)을 한 줄로 작성
+3. 메인 여행지는 첫날 또는 가장 중요한 날에 배치
+4. 날마다 지역이 겹치지 않도록 메인 여행지 30km 이내에서 동선을 나눔
+5. overview에는 전체 여행 개요와 팁을 2~3문장으로 작성
+
+## 출력 형식
+{format_instructions}
+"""
+
+DAY_PLAN_PROMPT = """당신은 전문 여행 플래너입니다. 전체 여행 뼈대 중 Day {day} 하루의 상세 일정만 작성해주세요.
+
+## 메인 여행지 정보
+- 이름: {main_place_name}
+- 주소: {main_place_address}
+- 위도: {main_place_latitude}
+- 경도: {main_place_longitude}
+- 선택 이유: {main_place_reason}
+
+## 사용자 정보
+- 여행 카테고리: {categories}
+- 여행 목적: {main_purpose}
+- 인원: {people}
+- 여행 기간: {travel_days}일
+- 고려사항: {considerations}
+
+## 주변 실제 장소 후보 (이름 | 주소 | 위도, 경도 | 메인 여행지로부터 거리)
+{nearby_places}
+
+## 전체 여행 뼈대
+{skeleton}
+
+## 작성할 날
+- Day {day} ({date})
+- 테마: {theme}
+- 지역: {area}
+
+## 작성 지침
+1. 위 테마와 지역에 맞춰 Day {day} 하루 일정만 작성
+2. 다른 날의 테마/지역에 해당하는 장소, 식당, 숙소는 사용하지 않음
+3. schedule 배열에 여행지("place"), 식당("restaurant"), 숙소("accommodation")를 visit_time 순서로 배치
+4. 점심(12:00-13:30), 저녁(18:00-19:30) 식당 배치, 마지막 날({travel_days}일차)이 아니면 20:00-21:00에 숙소 배치
+5. 여행지는 "주변 실제 장소 후보"에서 우선 선택하고 후보의 주소와 위도/경도를 그대로 사용
+6. 모든 장소는 실제로 존재하는 곳만 추천하고 정확한 주소와 소수점 6자리 이상의 위도/경도를 제공
+
+## 출력 형식
+{format_instructions}
+"""
@@ -0,0 +1,183 @@
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.chain.planner.data import DayPlan, ScheduleItem, TravelPlan
+from src.search.geo import haversine_matrix, in_korea
+
+# 저장 전 일별 동선 최적화 여부 (0이면 LLM이 준 순서 그대로 저장)
+PLANNER_ROUTE_OPTIMIZE = os.getenv("PLANNER_ROUTE_OPTIMIZE", "1") == "1"
+# 식사/숙소는 시간대가 정해져 있으므로 순서를 바꾸지 않음
+FIXED_TYPES = ("restaurant", "accommodation")
+# 2-opt 개선 반복 상한 (구간 정류장 수 기준 배수)
+TWO_OPT_ROUNDS_PER_STOP = 4
+
+
+def _is_fixed(item: ScheduleItem) -> bool:
+    return item.type in FIXED_TYPES or not in_korea(item.latitude, item.longitude)
+
+
+def path_length(dist: np.ndarray, path: List[int]) -> float:
+    """경로(노드 순서)의 총 거리"""
+    if len(path) < 2:
+        return 0.0
+    nodes = np.asarray(path)
+    return float(dist[nodes[:-1], nodes[1:]].sum())
+
+
+def nearest_neighbor(dist: np.ndarray, start: int, stops: List[int]) -> List[int]:
+    """start에서 출발해 가장 가까운 정류장을 차례로 방문하는 순서"""
+    remaining = list(stops)
+    order = []
+    current = start
+    while remaining:
+        nearest = int(np.argmin(dist[current, remaining]))
+        current = remaining.pop(nearest)
+        order.append(current)
+    return order
+
+
+def two_opt(dist: np.ndarray, path: List[int]) -> List[int]:
+    """
+    양 끝을 고정한 경로에서 구간 뒤집기로 거리가 줄어드는 동안 개선
+
+    i마다 가능한 모든 j의 개선량을 한 번에 계산해 가장 큰 개선을 적용합니다.
+
+    Args:
+        dist: 거리 행렬
+        path: 시작 노드 + 정류장 + 끝 노드
+
+    Returns:
+        List[int]: 개선된 경로 (양 끝은 그대로)
+    """
+    path = np.asarray(path)
+    n = len(path)
+    if n < 4:
+        return path.tolist()
+
+    for _ in range(TWO_OPT_ROUNDS_PER_STOP * n):
+        improved = False
+        for i in range(1, n - 2):
+            a, b = path[i - 1], path[i]
+            c, d = path[i + 1:n - 1], path[i + 2:n]
+            # path[i..j]를 뒤집을 때의 거리 변화 (j = i+1 .. n-2)
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                j = i + 1 + best
+                path[i:j + 1] = path[i:j + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return path.tolist()
+
+
+def solve_segment(dist: np.ndarray, start: int, stops: List[int], end: int) -> List[int]:
+    """
+    start -> (stops 전부) -> end 경로의 정류장 순서를 nearest neighbour + 2-opt로 계산
+
+    Returns:
+        List[int]: 정류장 방문 순서 (start, end 제외)
+    """
+    if len(stops) < 2:
+        return list(stops)
+    path = [start] + nearest_neighbor(dist, start, stops) + [end]
+    return two_opt(dist, path)[1:-1]
+
+
+def optimize_day(day: DayPlan) -> Dict[str, Any]:
+    """
+    하루 일정의 관광지 방문 순서를 이동 거리가 짧아지도록 재배치 (day.schedule을 직접 수정)
+
+    식당/숙소(와 좌표가 잘못된 항목)는 위치와 시간을 고정하고, 그 사이 구간 안에서만
+    관광지 순서를 바꿉니다. 따라서 점심 전 관광지는 점심 전에, 저녁 전 관광지는 저녁 전에 남고
+    식사 시간대가 바뀌지 않습니다. 구간의 방문 시간은 원래 시간 순서대로 새 순서에 다시 배정합니다.
+
+    Args:
+        day: 하루 일정
+
+    Returns:
+        Dict[str, Any]: {"day", "before_km", "after_km", "moved"(순서가 바뀐 항목 수)}
+    """
+    schedule = day.schedule
+    n = len(schedule)
+    report = {"day": day.day, "before_km": 0.0, "after_km": 0.0, "moved": 0}
+    if n < 2:
+        return report
+
+    fixed = [_is_fixed(item) for item in schedule]
+    valid = np.array([in_korea(item.latitude, item.longitude) for item in schedule])
+    # 마지막 노드는 어디서든 거리 0인 가상 노드 (일정 시작/끝이 열려 있는 구간용)
+    dist = np.zeros((n + 1, n + 1))
+    dist[:n, :n] = haversine_matrix([item.latitude for item in schedule], [item.longitude for item in schedule])
+    # 좌표가 잘못된 항목까지의 거리는 계산하지 않음
+    dist[:n, :n][~valid, :] = 0.0
+    dist[:n, :n][:, ~valid] = 0.0
+    virtual = n
+
+    before = list(range(n))
+    after = list(range(n))
+    segment_start = 0
+    for pos in range(n + 1):
+        if pos < n and not fixed[pos]:
+            continue
+        stops = list(range(segment_start, pos))
+        if len(stops) >= 2:
+            start = segment_start - 1 if segment_start > 0 else virtual
+            end = pos if pos < n else virtual
+            order = solve_segment(dist, start, stops, end)
+            # 원래 순서보다 나빠지면 그대로 둠
+            if path_length(dist, [start] + order + [end]) < path_length(dist, [start] + stops + [end]) - 1e-9:
+                after[segment_start:pos] = order
+        segment_start = pos + 1
+
+    report["before_km"] = round(path_length(dist, before), 3)
+    report["after_km"] = round(path_length(dist, after), 3)
+    report["moved"] = sum(1 for old, new in zip(before, after) if old != new)
+    if report["moved"]:
+        times = [item.visit_time for item in schedule]
+        day.schedule = [schedule[idx] for idx in after]
+        for item, visit_time in zip(day.schedule, times):
+            item.visit_time = visit_time
+    return report
+
+
+def optimize_travel_plan(travel_plan: TravelPlan) -> Optional[Dict[str, Any]]:
+    """
+    모든 일차의 동선을 최적화하고 이동 거리 전/후를 반환
+
+    Returns:
+        Optional[Dict[str, Any]]: {"before_km", "after_km", "days": [일별 결과]}, 비활성화 시 None
+    """
+    if not PLANNER_ROUTE_OPTIMIZE:
+        return None
+    days = [optimize_day(day) for day in travel_plan.daily_plans]
+    return {
+        "before_km": round(sum(day["before_km"] for day in days), 3),
+        "after_km": round(sum(day["after_km"] for day in days), 3),
+        "days": days,
+    }
+
+
+def replace_day_route(route: Optional[Dict[str, Any]], report: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    하루 일정을 다시 만든 뒤 계획의 동선 요약(optimize_travel_plan 결과)에서 해당 일차를 교체하고 합계를 다시 계산
+
+    Args:
+        route: 저장된 동선 요약 (없으면 None)
+        report: 새 하루 일정의 optimize_day 결과 (최적화하지 않았으면 None)
+
+    Returns:
+        Optional[Dict[str, Any]]: 새 동선 요약, 요약이 없거나 해당 일차를 최적화하지 않아 맞지 않게 되면 None
+    """
+    if route is None or report is None:
+        return None
+    days = [day for day in route.get("days", []) if day.get("day") != report["day"]]
+    days.append(report)
+    days.sort(key=lambda day: day.get("day", 0))
+    return {
+        "before_km": round(sum(day["before_km"] for day in days), 3),
+        "after_km": round(sum(day["after_km"] for day in days), 3),
+        "days": days,
+    }
@@ -0,0 +1,83 @@
+import json
+from typing import List
+
+from pydantic import ValidationError
+
+from src.chain.planner.data import DayPlan
+
+
+class DayPlanStreamParser:
+    """
+    스트리밍되는 TravelPlan JSON에서 완성된 DayPlan을 순서대로 꺼내는 증분 파서
+
+    "daily_plans" 배열 안의 객체가 닫히는 시점에 해당 객체만 파싱합니다.
+    이미 검사한 위치는 다시 검사하지 않습니다.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = -1
+        self._done = False
+
+    def _find_array_start(self) -> bool:
+        key = self._buffer.find('"daily_plans"')
+        if key == -1:
+            return False
+        bracket = self._buffer.find("[", key)
+        if bracket == -1:
+            return False
+        self._in_array = True
+        self._pos = bracket + 1
+        return True
+
+    def feed(self, text: str) -> List[DayPlan]:
+        """새 텍스트 조각을 추가하고 이번에 완성된 DayPlan 목록을 반환"""
+        completed = []
+        if self._done:
+            return completed
+        self._buffer += text
+
+        if not self._in_array and not self._find_array_start():
+            return completed
+
+        buffer = self._buffer
+        while self._pos < len(buffer):
+            char = buffer[self._pos]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._object_start = self._pos
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._object_start != -1:
+                    raw = buffer[self._object_start:self._pos + 1]
+                    self._object_start = -1
+                    try:
+                        completed.append(DayPlan.model_validate(json.loads(raw)))
+                    except (json.JSONDecodeError, ValidationError):
+                        # 형식이 잘못된 일정은 건너뛰고 최종 파싱에서 처리
+                        pass
+            elif char == "]" and self._depth == 0:
+                # daily_plans 배열 종료
+                self._done = True
+                self._buffer = ""
+                break
+
+            self._pos += 1
+
+        return completed
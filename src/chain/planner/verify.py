@@ -0,0 +1,121 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from src.chain.planner.data import DayPlan, ScheduleItem, TravelPlan
+from src.search.geo import haversine_km, in_korea
+from src.search.place_index import place_index, region_tokens
+from src.search.text import normalize
+
+# 생성된 일정의 관광지를 장소 데이터와 대조해 좌표를 보정할지 여부
+PLANNER_VERIFY_PLACES = os.getenv("PLANNER_VERIFY_PLACES", "1") == "1"
+# 같은 장소로 볼 최소 이름 유사도 (0~1)
+PLACE_MATCH_MIN_SCORE = float(os.getenv("PLACE_MATCH_MIN_SCORE", "0.6"))
+# 생성된 좌표와 장소 데이터 좌표가 이 거리(km) 안이면 같은 장소로 봄
+PLACE_MATCH_RADIUS_KM = float(os.getenv("PLACE_MATCH_RADIUS_KM", "20"))
+
+MATCHED = "matched"
+UNVERIFIED = "unverified"
+
+# 검증 결과별 항목 수 (프로세스 누적)
+verification_stats = {MATCHED: 0, UNVERIFIED: 0}
+
+
+def verify_item(item: ScheduleItem) -> bool:
+    """
+    관광지 항목을 이름이 비슷한 Place와 대조해 좌표/ID를 덮어씀 (item을 직접 수정)
+
+    이름 후보 중 생성된 좌표에서 PLACE_MATCH_RADIUS_KM 안에 있거나, 좌표가 틀렸더라도
+    주소의 시도/시군구가 같은 장소만 인정하고, 이름 점수가 높고 가까운 순으로 고릅니다.
+
+    Returns:
+        bool: 일치하는 장소를 찾았는지 여부
+    """
+    candidates = place_index.match_name(item.name, PLACE_MATCH_MIN_SCORE)
+    has_coordinates = in_korea(item.latitude, item.longitude)
+    # 생성된 주소의 시도/시군구 ("전남 담양군"처럼 약칭도 장소 쪽 토큰과 비교됨)
+    address_tokens = {normalize(word) for word in item.address.split()[:2]} - {""}
+
+    best = None
+    for place, score in candidates:
+        if place.latitude is None or place.longitude is None:
+            continue
+        distance = float(haversine_km(item.latitude, item.longitude, place.latitude, place.longitude))
+        if has_coordinates and distance <= PLACE_MATCH_RADIUS_KM:
+            rank = (score, -distance)
+        elif address_tokens and address_tokens <= region_tokens(place.address, place.region):
+            # 좌표가 틀렸어도 주소 지역이 같으면 인정 (거리는 비교 기준에서 제외)
+            rank = (score, -PLACE_MATCH_RADIUS_KM)
+        else:
+            continue
+        if best is None or rank > best[0]:
+            best = (rank, place)
+
+    if best is None:
+        return False
+    place = best[1]
+    item.latitude = place.latitude
+    item.longitude = place.longitude
+    if place.address:
+        item.address = place.address
+    item.place_id = str(place.id)
+    return True
+
+
+def verify_day(day: DayPlan) -> Dict[str, int]:
+    """
+    하루 일정의 관광지(type=place)를 장소 데이터로 검증하고 결과를 항목에 표시
+
+    식당/숙소는 장소 데이터에 없으므로 검증하지 않습니다 (verification=None).
+
+    Returns:
+        Dict[str, int]: {"matched", "unverified"} 항목 수
+    """
+    counts = {MATCHED: 0, UNVERIFIED: 0}
+    for item in day.schedule:
+        if item.type != "place":
+            continue
+        item.verification = MATCHED if verify_item(item) else UNVERIFIED
+        counts[item.verification] += 1
+    for key, count in counts.items():
+        verification_stats[key] += count
+    return counts
+
+
+def verify_travel_plan(travel_plan: TravelPlan) -> Optional[Dict[str, int]]:
+    """
+    모든 일차의 관광지를 장소 데이터로 검증 (verify_day)
+
+    장소 인덱스가 로드되지 않은 경우(스크립트 실행 등)에는 건너뜁니다.
+
+    Returns:
+        Optional[Dict[str, int]]: {"matched", "unverified"} 항목 수, 건너뛰면 None
+    """
+    if not verification_enabled():
+        return None
+    counts = {MATCHED: 0, UNVERIFIED: 0}
+    for day in travel_plan.daily_plans:
+        for key, count in verify_day(day).items():
+            counts[key] += count
+    return counts
+
+
+def verification_enabled() -> bool:
+    return PLANNER_VERIFY_PLACES and place_index.loaded
+
+
+def count_verification(daily_plans: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    저장된 일정 항목의 검증 표시(verification)로 계획 전체의 검증 결과 수를 다시 계산
+
+    Args:
+        daily_plans: DayPlan dict 목록
+
+    Returns:
+        Dict[str, int]: {"matched", "unverified"} 항목 수
+    """
+    counts = {MATCHED: 0, UNVERIFIED: 0}
+    for plan in daily_plans:
+        for item in plan.get("schedule", []):
+            if item.get("verification") in counts:
+                counts[item["verification"]] += 1
+    return counts
@@ -0,0 +1,31 @@
+import os
+import time
+
+from src.chain.categories.extractor import features_output, prompt_version
+from src.chain.planner.extractor import day_output, plan_output, skeleton_output
+from src.chain.purpose.extractor import get_purpose_chain
+from src.chain.recommend.extractor import recommend_output
+from src.llm.llm_client import get_llm
+from src.llm.tokens import get_encoding
+
+# 서버 시작 후 백그라운드에서 체인을 미리 생성할지 여부 (0이면 첫 요청 때 생성)
+CHAIN_PREWARM = os.getenv("CHAIN_PREWARM", "1") == "1"
+
+
+def prewarm_chains() -> float:
+    """
+    LLM 클라이언트, 구조화 출력 체인, 프롬프트, tiktoken 인코딩을 미리 생성
+
+    langchain / openai 모듈 import가 포함되어 수백 ms가 걸리므로 별도 스레드에서 실행합니다.
+
+    Returns:
+        float: 소요 시간(초)
+    """
+    start = time.perf_counter()
+    get_llm()
+    get_purpose_chain()
+    for output in (features_output, recommend_output, plan_output, skeleton_output, day_output):
+        output.prewarm()
+    prompt_version()
+    get_encoding()
+    return time.perf_counter() - start
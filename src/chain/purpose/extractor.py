@@ -1,22 +1,77 @@
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING
+
 from beanie import PydanticObjectId
-from langchain_core.prompts import PromptTemplate
+from src.cache.semantic_cache import SemanticCache
 from src.chain.purpose.prompt import PURPOSE_PROMPT
+from src.chain.purpose.similarity import purpose_vector, same_polarity
+from src.llm.executor import run_chain
 from src.llm.llm_client import get_llm
+from src.metrics.registry import span
 from src.model.chat import Recent
 
-llm = get_llm()
+if TYPE_CHECKING:
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.runnables import Runnable
+
+_purpose_prompt = None
+_purpose_chain = None
 
-purpose_prompt = PromptTemplate(
-    template=PURPOSE_PROMPT,
-    input_variables=["place_features", "user_purpose"],
+# 여행지 특징이 같고 목적 문장이 비슷하면(동의어 치환 후 비교, 부정 표현이 같을 때만) 이전 응답을 재사용
+purpose_cache = SemanticCache(
+    maxsize=int(os.getenv("PURPOSE_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("PURPOSE_CACHE_TTL", "86400")),
+    threshold=float(os.getenv("PURPOSE_CACHE_THRESHOLD", "0.75")),
+    vectorize=purpose_vector,
+    compatible=same_polarity,
 )
+# 0이면 목적 응답 캐시를 사용하지 않음
+PURPOSE_CACHE = os.getenv("PURPOSE_CACHE", "1") == "1"
+
+def get_purpose_prompt() -> "PromptTemplate":
+    """목적 응답 프롬프트 (최초 사용 시 생성)"""
+    global _purpose_prompt
+    if _purpose_prompt is None:
+        from langchain_core.prompts import PromptTemplate
+
+        _purpose_prompt = PromptTemplate(
+            template=PURPOSE_PROMPT,
+            input_variables=["place_features", "user_purpose"],
+        )
+    return _purpose_prompt
+
+def get_purpose_chain() -> "Runnable":
+    """목적 응답 체인 (최초 사용 시 한 번만 생성)"""
+    global _purpose_chain
+    if _purpose_chain is None:
+        _purpose_chain = get_purpose_prompt() | get_llm()
+    return _purpose_chain
+
+def purpose_cache_context(categories: dict) -> str:
+    """여행지 특징(categories) 전체의 해시 (프롬프트에 그대로 들어가므로 전부 같아야 재사용)"""
+    payload = json.dumps(categories, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
 
 async def respond_to_purpose(id: PydanticObjectId, user_purpose: str) -> str:
-    recent = await Recent.get(id)
-    await recent.set({Recent.main_purpose: user_purpose})
-    chain = purpose_prompt | llm
-    response = chain.invoke({
+    with span("recent_get"):
+        recent = await Recent.get(id)
+    with span("recent_update"):
+        await recent.set({Recent.main_purpose: user_purpose})
+
+    context = purpose_cache_context(recent.categories)
+    if PURPOSE_CACHE:
+        with span("cache_lookup"):
+            cached = purpose_cache.get(context, user_purpose)
+        if cached is not None:
+            return cached
+
+    response = await run_chain(get_purpose_chain(), {
         "place_features": recent.categories,
         "user_purpose": user_purpose
-    })
+    }, name="purpose")
+    if PURPOSE_CACHE:
+        with span("cache_store"):
+            purpose_cache.set(context, user_purpose, response.content)
     return response.content
\ No newline at end of file
@@ -0,0 +1,53 @@
+from typing import Set
+
+import numpy as np
+
+from src.cache.semantic_cache import canonical, unit_vector
+
+# 같은 의도로 보는 표현 -> 대표 표현 (canonical 적용 후 문자열에서 치환, 긴 표현부터)
+PURPOSE_SYNONYMS = {
+    "맛집": ["먹방", "먹거리", "미식", "맛집"],
+    "탐방": ["투어", "탐방", "여행", "순례"],
+    "휴식": ["힐링", "휴식", "쉬고", "쉬기", "쉬며", "쉬는"],
+    "조용히": ["조용하게", "조용한", "한적하게", "한적한", "조용히"],
+    "사진": ["인생샷", "사진찍기", "포토", "사진"],
+    "명소": ["좋은곳", "스팟", "명소"],
+    "아이": ["아이들", "아이랑", "아이와", "아이"],
+}
+# 의미에 영향이 적어 비교에서 빼는 표현
+PURPOSE_FILLERS = ["위주로", "위주", "함께"]
+# 부정/제외 표현: 한쪽에만 있으면 문장이 비슷해도 반대 의도로 봄
+NEGATION_MARKERS = ["제외", "빼고", "없이", "말고", "싫", "않", "안", "못", "피하"]
+
+_REPLACEMENTS = sorted(
+    [(word, rep) for rep, words in PURPOSE_SYNONYMS.items() for word in words]
+    + [(word, "") for word in PURPOSE_FILLERS],
+    key=lambda item: -len(item[0]),
+)
+
+
+def purpose_terms(text: str) -> str:
+    """비교용 목적 문장 ("먹방 여행" / "맛집 투어" -> "맛집탐방")"""
+    text = canonical(text)
+    for word, rep in _REPLACEMENTS:
+        text = text.replace(word, rep)
+    return text
+
+
+def purpose_vector(text: str) -> np.ndarray:
+    """동의어를 대표 표현으로 바꾼 뒤의 문자 바이그램 단위 벡터"""
+    return unit_vector(purpose_terms(text))
+
+
+def negation_markers(text: str) -> Set[str]:
+    return {marker for marker in NEGATION_MARKERS if marker in canonical(text)}
+
+
+def same_polarity(text: str, other: str) -> bool:
+    """
+    두 목적 문장의 부정/제외 표현이 같은지 확인
+
+    "맛집 탐방" / "맛집 탐방 제외", "쉬고 싶어요" / "쉬고 싶지 않아요"처럼 한쪽에만 부정 표현이 있으면
+    유사도와 관계없이 다른 의도로 봅니다. ("편안" 등 부정이 아닌 "안"도 걸리지만 캐시를 덜 쓰는 쪽으로만 틀림)
+    """
+    return negation_markers(text) == negation_markers(other)
@@ -1,58 +1,126 @@
+import os
+
+import numpy as np
 from beanie import PydanticObjectId
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+from beanie.operators import In
 
 from src.chain.recommend.data import PlaceRecommendations
 from src.chain.recommend.prompt import RECOMMEND_PROMPT
+from src.llm.executor import run_chain
 from src.llm.llm_client import get_llm
+from src.llm.structured import StructuredOutput
+from src.llm.tokens import pack_lines
+from src.metrics.registry import span
 from src.model.chat import Recent
 from src.model.place import Place
+from src.search.place_index import place_index
+from src.search.ranker import ngram_order, place_vector, rank_places, tf_vector, tfidf_scores, top_k_indices
+from src.search.text import normalize
+from src.search.trait_matches import trait_match_table
 
-llm = get_llm()
-parser = PydanticOutputParser(pydantic_object=PlaceRecommendations)
-format_instructions = parser.get_format_instructions()
+# LLM에 전달할 후보 장소 수 (유사도 상위 K개)
+RECOMMEND_CANDIDATES = int(os.getenv("RECOMMEND_CANDIDATES", "20"))
+# 인덱스 없이 MongoDB에서 조회할 때 랭킹 대상으로 가져올 최대 장소 수
+RECOMMEND_POOL_SIZE = int(os.getenv("RECOMMEND_POOL_SIZE", "500"))
+# 태그 매칭 표에서 가져와 여행 목적으로 다시 랭킹할 장소 수
+TRAIT_MATCH_POOL = int(os.getenv("TRAIT_MATCH_POOL", "100"))
+# 태그 매칭 점수에 더할 여행 목적 유사도 가중치
+TRAIT_MATCH_PURPOSE_WEIGHT = float(os.getenv("TRAIT_MATCH_PURPOSE_WEIGHT", "0.5"))
+# 후보 장소 목록(places_list)에 쓸 최대 토큰 수
+RECOMMEND_PLACES_TOKEN_BUDGET = int(os.getenv("RECOMMEND_PLACES_TOKEN_BUDGET", "2000"))
 
-prompt = PromptTemplate(
-    template=RECOMMEND_PROMPT,
-    input_variables=["place_name", "keywords", "main_purpose", "places_list", "limit"],
-    partial_variables={"format_instructions": format_instructions},
+recommend_output = StructuredOutput(
+    RECOMMEND_PROMPT,
+    ["place_name", "keywords", "main_purpose", "places_list", "limit"],
+    PlaceRecommendations,
+    get_llm,
 )
 
 
-def format_places_for_prompt(places: list[Place]) -> str:
-    """장소 목록을 프롬프트용 문자열로 포맷팅 (간결하게)"""
-    formatted = []
-    for idx, place in enumerate(places, 1):
-        # 설명을 50자로 줄여서 토큰 절약
-        desc = place.description[:50] if place.description else ""
-        formatted.append(f"{idx}. {place.name} | {place.address or ''} | {desc}")
-    return "\n".join(formatted)
+def format_places_for_prompt(places: list[Place], budget: int = RECOMMEND_PLACES_TOKEN_BUDGET) -> str:
+    """
+    장소 목록을 토큰 예산 안에서 프롬프트용 문자열로 포맷팅
 
+    유사도 순서대로 이름/주소를 먼저 담고, 남은 예산을 설명에 나눠 줍니다.
+    (설명이 짧은 장소가 남긴 예산은 설명이 긴 장소가 사용)
 
-async def recommend_places(recent_id: PydanticObjectId, limit: int = 10) -> PlaceRecommendations:
+    Args:
+        places: 유사도 내림차순 후보 장소 목록
+        budget: 전체 토큰 예산
+
+    Returns:
+        str: "번호. 이름 | 주소 | 설명" 형식의 줄 목록
     """
-    사용자의 여행 선호도를 기반으로 장소를 추천합니다.
-    
+    prefixes = [f"{idx}. {place.name} | {place.address or ''} | " for idx, place in enumerate(places, 1)]
+    descriptions = [(place.description or "").replace("\n", " ").strip() for place in places]
+    return "\n".join(pack_lines(prefixes, descriptions, budget))
+
+
+async def find_matched_places(traits: list[str], place_name: str, main_purpose: str, top_k: int) -> list[Place]:
+    """
+    태그 -> 장소 매칭 표(build_trait_matches로 미리 생성)에서 후보를 가져와 상위 top_k개 반환
+
+    표의 합산 점수(최댓값 1로 정규화)에 여행 목적과의 유사도를 TRAIT_MATCH_PURPOSE_WEIGHT만큼 더해 정렬합니다.
+
     Args:
-        recent_id: Recent 문서 ID
-        limit: 추천할 최대 장소 수 (기본값: 10)
-    
+        traits: 여행지 특징 태그 목록
+        place_name: 지역명 (국내 지역이면 해당 지역 장소 우선)
+        main_purpose: 여행 목적
+        top_k: 반환할 후보 수
+
     Returns:
-        PlaceRecommendations: 추천 장소 목록
+        list[Place]: 점수 내림차순 후보 장소 목록 (표에 있는 태그가 없으면 빈 목록)
     """
-    # 1. Recent 데이터 가져오기
-    recent = await Recent.get(recent_id)
-    if not recent:
-        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
+    matches = trait_match_table.lookup(traits, max(TRAIT_MATCH_POOL, top_k))
+    if not matches:
+        return []
+
+    place_ids = [place_id for place_id, _ in matches]
+    if place_index.loaded:
+        by_id = {place_id: place_index.get(place_id) for place_id in place_ids}
+    else:
+        by_id = {place.id: place for place in await Place.find(In(Place.id, place_ids)).to_list()}
+    candidates = [(by_id[place_id], score) for place_id, score in matches if by_id.get(place_id) is not None]
+
+    # 해외 지명은 보통 일치하지 않으므로, 지역 안 후보가 충분할 때만 지역으로 좁힘
+    region = normalize(place_name)
+    if region:
+        local = [item for item in candidates if region in normalize(item[0].region) + "|" + normalize(item[0].address)]
+        if len(local) >= top_k:
+            candidates = local
+    if not candidates:
+        return []
+
+    places = [place for place, _ in candidates]
+    scores = np.array([score for _, score in candidates], dtype=np.float32)
+    scores /= scores.max()
+    if main_purpose and TRAIT_MATCH_PURPOSE_WEIGHT:
+        n = ngram_order(main_purpose)
+        doc_tf = np.stack([place_vector(place, n) for place in places])
+        scores += TRAIT_MATCH_PURPOSE_WEIGHT * tfidf_scores(doc_tf, tf_vector(main_purpose, n))
+    return [places[i] for i in top_k_indices(scores, top_k)]
+
+
+async def find_candidate_places(place_name: str, relevance_text: str, top_k: int) -> list[Place]:
+    """
+    지역명과 일치하는 관광지(주소가 있는 장소)를 키워드 유사도로 정렬해 상위 top_k개 조회
     
-    # 2. 키워드 및 정보 추출
-    categories = recent.categories
-    place_name = categories.get("place", "")
-    keywords = ", ".join(categories.get("primary_traits", []))
-    main_purpose = recent.main_purpose or "여행 및 관광"
+    Args:
+        place_name: 지역명
+        relevance_text: 랭킹 기준 텍스트 (핵심 태그 + 여행 목적)
+        top_k: 반환할 후보 수
     
-    # 3. MongoDB에서 관광지만 필터링 (빠른 응답을 위해 제한)
-    # 지역 키워드로 필터링 시도
+    Returns:
+        list[Place]: 유사도 내림차순 후보 장소 목록
+    """
+    if place_index.loaded:
+        places = place_index.search_ranked(place_name, relevance_text, top_k, place_type="관광지")
+        if not places:
+            # 지역 필터가 너무 좁으면 전체 관광지에서 랭킹
+            places = place_index.search_ranked("", relevance_text, top_k, place_type="관광지")
+        return places
+
+    # 인덱스가 없으면(스크립트 실행 등) MongoDB에서 직접 조회
     query_filter = {"type": "관광지"}
     
     # 지역명이 포함되어 있으면 필터링
@@ -63,37 +131,72 @@ async def recommend_places(recent_id: PydanticObjectId, limit: int = 10) -> Plac
             {"address": {"$regex": place_name, "$options": "i"}},
         ]
     
-    # 최대 30개로 줄여서 AI 처리 속도 향상 + 주소가 있는 장소만 필터링
+    # 주소가 있는 장소만 (address > "" 조건이어야 type_with_address 부분 인덱스를 사용)
     places = await Place.find(
         query_filter,
-        Place.address != None,
-        Place.address != ""
-    ).limit(30).to_list()
+        Place.address > "",
+    ).limit(RECOMMEND_POOL_SIZE).to_list()
     
     if not places:
         # 지역 필터가 너무 좁으면 전체 관광지에서 샘플링 (주소 있는 것만)
         places = await Place.find(
             {"type": "관광지"},
-            Place.address != None,
-            Place.address != ""
-        ).limit(30).to_list()
+            Place.address > "",
+        ).limit(RECOMMEND_POOL_SIZE).to_list()
+    
+    return rank_places(places, relevance_text, top_k)
+
+
+async def recommend_places(recent_id: PydanticObjectId, limit: int = 10) -> PlaceRecommendations:
+    """
+    사용자의 여행 선호도를 기반으로 장소를 추천합니다.
+    
+    Args:
+        recent_id: Recent 문서 ID
+        limit: 추천할 최대 장소 수 (기본값: 10)
+    
+    Returns:
+        PlaceRecommendations: 추천 장소 목록
+    """
+    # 1. Recent 데이터 가져오기
+    with span("recent_get"):
+        recent = await Recent.get(recent_id)
+    if not recent:
+        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
+    
+    # 2. 키워드 및 정보 추출
+    categories = recent.categories
+    place_name = categories.get("place", "")
+    keywords = ", ".join(categories.get("primary_traits", []))
+    main_purpose = recent.main_purpose or "여행 및 관광"
+    
+    # 3. 키워드/목적과 유사한 후보 장소 상위 K개 조회
+    #    (태그 매칭 표 우선, 표에 없는 태그뿐이면 메모리 인덱스 / MongoDB에서 지역 조회 후 랭킹)
+    traits = categories.get("primary_traits", [])
+    relevance_text = " ".join(traits + [main_purpose])
+    top_k = max(RECOMMEND_CANDIDATES, limit)
+    with span("place_query"):
+        places = await find_matched_places(traits, place_name, recent.main_purpose, top_k)
+        if not places:
+            places = await find_candidate_places(place_name, relevance_text, top_k)
     
     if not places:
         raise ValueError("추천할 수 있는 장소가 없습니다.")
     
     # 4. 프롬프트용 장소 리스트 포맷팅
-    places_list = format_places_for_prompt(places)
+    with span("prompt_format"):
+        places_list = format_places_for_prompt(places)
     
     # 5. AI에게 추천 요청
-    chain = prompt | llm | parser
+    chain = recommend_output.chain()
     
-    result = chain.invoke({
+    result = await run_chain(chain, {
         "place_name": place_name,
         "keywords": keywords,
         "main_purpose": main_purpose,
         "places_list": places_list,
         "limit": limit,
-    })
+    }, name="recommend")
     
     if isinstance(result, PlaceRecommendations):
         recommendations = result
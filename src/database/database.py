@@ -3,10 +3,15 @@ import os
 from beanie import init_beanie
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
 
+from src.model.cache import CachedTraits
 from src.model.chat import Recent
 from src.model.place import Place
 from src.model.planner import Planner
+from src.model.planner_job import PlannerJob
+from src.model.trait_match import TraitMatch
+from src.metrics.mongo import mongo_event_listeners
 
 load_dotenv()
 
@@ -14,12 +19,49 @@ load_dotenv()
 MONGO_URL = os.getenv("MONGO_URL")
 DB_NAME = os.getenv("DB_NAME")
 
+# 워커 프로세스당 연결 풀 설정 (워커 수 x MONGO_MAX_POOL_SIZE가 서버 연결 한도를 넘지 않게 조정)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "2"))
+# 유휴 연결 정리 시간, 풀이 가득 찼을 때 연결 대기 시간, 서버 선택 시간 (ms)
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "10000"))
+
+# 중복 키 오류 코드 (unique 인덱스 생성 실패)
+DUPLICATE_KEY_CODE = 11000
+
+DOCUMENT_MODELS = [Recent, Place, Planner, PlannerJob, CachedTraits, TraitMatch]
+
+client = None
+
 async def app_init():
-    client = AsyncIOMotorClient(MONGO_URL)
+    global client
+    client = AsyncIOMotorClient(
+        MONGO_URL,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        event_listeners=mongo_event_listeners(),
+    )
 
     db = client[DB_NAME]
 
-    await init_beanie(
-        database=db,
-        document_models=[Recent, Place, Planner]
-    )
\ No newline at end of file
+    try:
+        await init_beanie(database=db, document_models=DOCUMENT_MODELS)
+    except OperationFailure as e:
+        if e.code != DUPLICATE_KEY_CODE:
+            raise
+        # 기존 중복 데이터로 unique 인덱스(planners.recent_id 등)를 만들 수 없음: 인덱스 없이 시작
+        # 중복 정리는 사용자 계획을 삭제하므로 시작 시 자동으로 하지 않음 (scripts/dedupe_planners.py로 한 번 실행)
+        print(f"⚠️  index creation failed, starting without new indexes (run scripts/dedupe_planners.py): {e}")
+        await init_beanie(database=db, document_models=DOCUMENT_MODELS, skip_indexes=True)
+
+
+def close_db():
+    """연결 풀 종료 (서버 종료 시)"""
+    global client
+    if client is not None:
+        client.close()
+        client = None
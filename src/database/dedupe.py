@@ -0,0 +1,29 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+
+async def dedupe_planners(db: AsyncIOMotorDatabase) -> int:
+    """
+    planners 컬렉션에서 recent_id별로 가장 최근 계획만 남기고 삭제
+
+    planners.recent_id unique 인덱스는 중복 문서가 있으면 생성되지 않으므로
+    인덱스를 만들기 전에 scripts/dedupe_planners.py로 한 번 실행합니다.
+
+    Args:
+        db: 대상 데이터베이스
+
+    Returns:
+        int: 삭제한 문서 수
+    """
+    planners = db["planners"]
+    duplicates = planners.aggregate([
+        {"$sort": {"updated_at": -1, "_id": -1}},
+        {"$group": {"_id": "$recent_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+
+    removed = 0
+    async for group in duplicates:
+        # 가장 최근 문서(첫 번째)만 남기고 삭제
+        result = await planners.delete_many({"_id": {"$in": group["ids"][1:]}})
+        removed += result.deleted_count
+    return removed
@@ -0,0 +1,122 @@
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+from bson import ObjectId
+
+from src.model.cache import CachedTraits
+from src.model.place import Place
+from src.model.planner import Planner
+from src.model.planner_job import PlannerJob
+from src.search.geo import geo_point
+
+# 시작 시 주요 쿼리 실행 계획 리포트 여부
+MONGO_EXPLAIN_ON_STARTUP = os.getenv("MONGO_EXPLAIN_ON_STARTUP", "1") == "1"
+
+# (이름, 모델, 필터, limit) - 서비스에서 자주 실행되는 쿼리
+HOT_QUERIES = [
+    ("planner.get_travel_plan", Planner, {"recent_id": ObjectId()}, 1),
+    ("recommend.candidates", Place, {"type": "관광지", "address": {"$gt": ""}}, 500),
+    (
+        "recommend.candidates_by_region",
+        Place,
+        {
+            "type": "관광지",
+            "$or": [
+                {"region": {"$regex": "서울", "$options": "i"}},
+                {"address": {"$regex": "서울", "$options": "i"}},
+            ],
+            "address": {"$gt": ""},
+        },
+        500,
+    ),
+    ("places.type_region", Place, {"type": "관광지", "region": "서울특별시"}, 100),
+    (
+        "places.nearby",
+        Place,
+        {
+            "location": {"$nearSphere": {"$geometry": geo_point(37.5665, 126.9780), "$maxDistance": 30000}},
+            "type": "관광지",
+        },
+        20,
+    ),
+    (
+        "places.index_refresh",
+        Place,
+        {"$or": [{"_id": {"$gt": ObjectId()}}, {"updated_at": {"$gte": datetime.now()}}]},
+        0,
+    ),
+    ("traits.cache_lookup", CachedTraits, {"key": "explain"}, 1),
+    ("planner_jobs.status", PlannerJob, {"recent_id": ObjectId()}, 1),
+    ("planner_jobs.recover", PlannerJob, {"status": "running", "updated_at": {"$lt": datetime.now()}}, 0),
+]
+
+
+def _winning_plan(explain: dict) -> dict:
+    """explain 결과에서 최종 실행 계획 추출 (SBE 형식 포함)"""
+    winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+    return winning.get("queryPlan", winning)
+
+
+def _plan_stages(plan: dict) -> List[str]:
+    """실행 계획 트리를 따라가며 단계 목록 생성 (예: LIMIT > FETCH > IXSCAN(type_with_address))"""
+    stages = []
+    node = plan
+    while node:
+        stage = node.get("stage", "?")
+        if node.get("indexName"):
+            stage += f"({node['indexName']})"
+        stages.append(stage)
+        children = node.get("inputStages") or []
+        node = node.get("inputStage") or (children[0] if children else None)
+        if len(children) > 1:
+            stages.append(f"+{len(children) - 1}")
+    return stages
+
+
+def summarize_explain(explain: dict) -> Dict[str, Any]:
+    """
+    explain 결과 요약
+
+    Returns:
+        Dict[str, Any]: stages, collscan 여부, 검사/반환 문서 수, 실행 시간(ms)
+    """
+    stages = _plan_stages(_winning_plan(explain))
+    stats = explain.get("executionStats", {})
+    return {
+        "stages": stages,
+        "collscan": any(stage.startswith("COLLSCAN") for stage in stages),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "returned": stats.get("nReturned"),
+        "millis": stats.get("executionTimeMillis"),
+    }
+
+
+async def report_query_plans() -> List[Dict[str, Any]]:
+    """
+    주요 쿼리의 explain() 결과를 로그로 출력
+
+    인덱스가 누락되거나 쿼리 형태가 바뀌어 COLLSCAN이 되면 경고로 표시됩니다.
+
+    Returns:
+        List[Dict[str, Any]]: 쿼리별 요약
+    """
+    reports = []
+    for name, model, query, limit in HOT_QUERIES:
+        try:
+            explain = await model.get_pymongo_collection().find(query).limit(limit).explain()
+        except Exception as e:
+            print(f"  ⚠️  {name}: explain 실패 ({e})")
+            continue
+
+        summary = {"name": name, **summarize_explain(explain)}
+        reports.append(summary)
+
+        mark = "❌ COLLSCAN" if summary["collscan"] else "✅"
+        print(
+            f"  {mark} {name}: {' > '.join(summary['stages'])} "
+            f"(keys {summary['keys_examined']}, docs {summary['docs_examined']}, "
+            f"returned {summary['returned']}, {summary['millis']}ms)"
+        )
+    return reports
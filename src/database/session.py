@@ -0,0 +1,68 @@
+from typing import Any, Dict
+
+from beanie import PydanticObjectId, UpdateResponse
+
+from src.model.chat import Recent
+
+# 추가 옵션이 없다는 응답으로 볼 키워드
+NEGATIVE_KEYWORDS = ["없어", "없음", "없습니다", "없다", "아니", "아니요", "no", "none"]
+
+
+async def _update_session(
+    recent_id: PydanticObjectId,
+    update: Dict[str, Any],
+    finished_message: str = "이미 완료된 설정입니다.",
+) -> Recent:
+    """
+    완료되지 않은 Recent 문서를 한 번의 find_one_and_update로 갱신
+
+    Args:
+        recent_id: Recent 문서 ID
+        update: MongoDB 업데이트 연산 ($set, $push 등)
+        finished_message: 이미 완료된 문서일 때의 오류 메시지
+
+    Returns:
+        Recent: 갱신된 문서
+    """
+    recent = await Recent.find_one(
+        Recent.id == recent_id,
+        Recent.finished == False,
+    ).update(update, response_type=UpdateResponse.NEW_DOCUMENT)
+    if recent:
+        return recent
+
+    # 갱신 실패 시에만 원인 확인용으로 한 번 더 조회
+    if await Recent.get(recent_id):
+        raise ValueError(finished_message)
+    raise ValueError("Recent 데이터를 찾을 수 없습니다.")
+
+
+async def set_people(recent_id: PydanticObjectId, people: str) -> Recent:
+    """인원 정보 저장"""
+    return await _update_session(recent_id, {"$set": {"people": people}})
+
+
+async def set_day(recent_id: PydanticObjectId, day: str) -> Recent:
+    """여행 일정(기간) 저장"""
+    return await _update_session(recent_id, {"$set": {"day": day}})
+
+
+async def add_option(recent_id: PydanticObjectId, option: str) -> Recent:
+    """
+    고려사항 옵션 추가
+
+    "없어" 등 부정 응답이면 옵션 입력을 완료(finished) 처리하고,
+    그 외에는 $push로 배열에 추가하므로 동시 요청에도 옵션이 유실되지 않습니다.
+
+    Args:
+        recent_id: Recent 문서 ID
+        option: 사용자 입력 옵션
+
+    Returns:
+        Recent: 갱신된 문서
+    """
+    finished_message = "이미 완료된 설정입니다. 더 이상 옵션을 추가할 수 없습니다."
+    option_lower = option.lower().strip()
+    if any(keyword in option_lower for keyword in NEGATIVE_KEYWORDS):
+        return await _update_session(recent_id, {"$set": {"finished": True}}, finished_message)
+    return await _update_session(recent_id, {"$push": {"options": option}}, finished_message)
@@ -0,0 +1,137 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+from dotenv import load_dotenv
+
+from src.cache.singleflight import SingleFlight
+from src.llm.tokens import TokenCounter
+from src.metrics.llm import LLMTimer
+from src.metrics.registry import observe_stage
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
+load_dotenv()
+
+# 모델별 동시 LLM 호출 수 제한 (환경 변수로 조정 가능)
+CONCURRENCY_LIMITS = {
+    "default": int(os.getenv("LLM_CONCURRENCY", "16")),
+    "planner": int(os.getenv("LLM_PLANNER_CONCURRENCY", "4")),
+}
+
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# 같은 체인 + 같은 입력의 동시 호출을 하나의 LLM 호출로 합칠지 여부 (기본값: 사용)
+# 워커 프로세스 안에서만 합쳐지는 최선 노력 방식 (다른 워커로 간 같은 요청은 따로 호출됨)
+LLM_SINGLE_FLIGHT = os.getenv("LLM_SINGLE_FLIGHT", "1") == "1"
+
+llm_flight = SingleFlight("llm")
+
+
+def get_semaphore(model: str) -> asyncio.Semaphore:
+    """모델별 세마포어 (최초 사용 시 생성)"""
+    semaphore = _semaphores.get(model)
+    if semaphore is None:
+        limit = CONCURRENCY_LIMITS.get(model, CONCURRENCY_LIMITS["default"])
+        semaphore = asyncio.Semaphore(limit)
+        _semaphores[model] = semaphore
+    return semaphore
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def flight_key(inputs: Dict[str, Any], name: str) -> tuple:
+    """
+    single-flight 키: (체인 이름, 공백을 정규화한 입력값 해시)
+
+    체인 이름(name)은 프롬프트/스키마별로 다르게 쓰이므로(categories, purpose, planner.day 등)
+    같은 이름 + 같은 입력이면 같은 호출로 봅니다. 요청마다 체인 객체를 새로 만들어도 합쳐지고,
+    해제된 객체의 id가 재사용되어 다른 체인과 섞이는 일도 없습니다.
+    """
+    payload = json.dumps(_normalize(inputs), sort_keys=True, ensure_ascii=False, default=str)
+    return name, hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+async def run_chain(
+    chain: "Runnable",
+    inputs: Dict[str, Any],
+    model: str = "default",
+    name: Optional[str] = None,
+) -> Any:
+    """
+    LangChain 체인을 이벤트 루프를 막지 않고 실행합니다.
+
+    동기 invoke 대신 ainvoke를 사용하고, 모델별 동시 실행 수를 세마포어로 제한합니다.
+    같은 체인에 같은 입력으로 이미 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 함께 받습니다.
+
+    Args:
+        chain: 실행할 체인
+        inputs: 체인 입력값
+        model: 동시성 제한 키 ("default" 또는 "planner")
+        name: 토큰 사용량 / 단계 시간 집계 키, single-flight 키 (체인마다 다른 이름 사용, 기본값: model)
+
+    Returns:
+        체인 실행 결과
+    """
+    name = name or model
+    if not LLM_SINGLE_FLIGHT:
+        return await _run_chain(chain, inputs, model, name)
+
+    result, _ = await llm_flight.do(
+        flight_key(inputs, name),
+        lambda: _run_chain(chain, inputs, model, name),
+    )
+    # 호출자가 결과를 수정하므로(예: 추천 장소에 좌표 추가) 공유된 원본 대신 각자 복사본 사용
+    return copy.deepcopy(result)
+
+
+async def _run_chain(chain: "Runnable", inputs: Dict[str, Any], model: str, name: str) -> Any:
+    timer = LLMTimer()
+    config = {"callbacks": [TokenCounter(name), timer]}
+    start = time.perf_counter()
+    async with get_semaphore(model):
+        # 동시 실행 제한으로 대기한 시간
+        observe_stage(f"llm_wait.{name}", time.perf_counter() - start)
+        start = time.perf_counter()
+        try:
+            return await chain.ainvoke(inputs, config=config)
+        finally:
+            # 모델 호출 시간과 나머지(프롬프트 구성 + 출력 파싱) 시간을 나눠 기록
+            elapsed = time.perf_counter() - start
+            observe_stage(f"llm.{name}", timer.seconds)
+            observe_stage(f"parse.{name}", max(0.0, elapsed - timer.seconds))
+
+
+async def stream_chain(
+    chain: "Runnable",
+    inputs: Dict[str, Any],
+    model: str = "default",
+    name: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """
+    체인 출력을 스트리밍으로 전달합니다.
+
+    스트림이 끝날 때까지 모델별 세마포어를 점유합니다.
+    """
+    name = name or model
+    timer = LLMTimer()
+    config = {"callbacks": [TokenCounter(name), timer]}
+    async with get_semaphore(model):
+        try:
+            async for chunk in chain.astream(inputs, config=config):
+                yield chunk
+        finally:
+            observe_stage(f"llm.{name}", timer.seconds)
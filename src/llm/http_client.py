@@ -0,0 +1,90 @@
+import importlib.util
+import os
+from typing import Callable, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# OpenAI 호출용 HTTP 연결 설정 (워커 프로세스마다 하나의 클라이언트를 모든 LLM이 공유)
+OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "1") == "1"
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+# 유휴 연결 유지 시간 (초)
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+# 연결 수립 제한 시간 (초), 응답 제한 시간은 LLM별 request_timeout 사용
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "10"))
+
+
+
+class ReopenableTransport(httpx.AsyncBaseTransport):
+    """
+    닫힌 뒤 다음 요청에서 연결 풀을 다시 만드는 전송 계층
+
+    LLM 클라이언트(ChatOpenAI)는 생성 시 받은 httpx 클라이언트를 계속 들고 있으므로,
+    서버 종료 시 클라이언트 자체를 닫으면 같은 프로세스에서 lifespan을 다시 시작했을 때
+    모든 호출이 "client has been closed"로 실패합니다. 그래서 클라이언트는 유지하고 연결 풀만 닫습니다.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = self._factory()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            await transport.aclose()
+
+
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[ReopenableTransport] = None
+
+
+def http2_available() -> bool:
+    """HTTP/2 사용 가능 여부 (httpx[http2]의 h2 패키지 필요)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    OpenAI 호출에 공유하는 비동기 HTTP 클라이언트 (최초 사용 시 생성)
+
+    keep-alive 연결 풀을 재사용하고, h2가 설치되어 있으면 HTTP/2로 하나의 연결에서
+    여러 요청을 동시에 보냅니다.
+
+    Returns:
+        httpx.AsyncClient: 공유 클라이언트
+    """
+    global _client, _transport
+    if _client is None:
+        http2 = OPENAI_HTTP2 and http2_available()
+        if OPENAI_HTTP2 and not http2:
+            print("⚠️  h2 패키지가 없어 OpenAI 호출에 HTTP/1.1을 사용합니다 (pip install 'httpx[http2]')")
+        limits = httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+        )
+        _transport = ReopenableTransport(lambda: httpx.AsyncHTTPTransport(http2=http2, limits=limits))
+        _client = httpx.AsyncClient(
+            transport=_transport,
+            timeout=httpx.Timeout(None, connect=OPENAI_CONNECT_TIMEOUT),
+        )
+    return _client
+
+
+async def close_http_client():
+    """
+    공유 클라이언트의 연결 풀 종료 (서버 종료 시)
+
+    클라이언트 객체는 LLM 클라이언트가 계속 참조하므로 닫지 않고 유지하며,
+    다음 요청에서 새 연결 풀을 만듭니다.
+    """
+    if _transport is not None:
+        await _transport.aclose()
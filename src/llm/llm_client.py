@@ -1,33 +1,45 @@
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from typing import TYPE_CHECKING
 import os
 
+from src.llm.http_client import get_http_client
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 load_dotenv()
 
 _llm = None
 _llm_planner = None
 
-def get_llm() -> ChatOpenAI:
+def get_llm() -> "ChatOpenAI":
     global _llm
     if _llm is None:
+        # langchain_openai / openai는 import 비용이 커서 처음 사용할 때 불러옴
+        from langchain_openai import ChatOpenAI
+
         _llm = ChatOpenAI(
             model="gpt-4o-mini",
             temperature=0,
             api_key=os.getenv("OPENAI_KEY"),
             streaming=False,
             request_timeout=30,
+            http_async_client=get_http_client(),
         )
     return _llm
 
-def get_llm_for_planner() -> ChatOpenAI:
+def get_llm_for_planner() -> "ChatOpenAI":
     """Planner용 LLM 클라이언트 (긴 응답 처리)"""
     global _llm_planner
     if _llm_planner is None:
+        from langchain_openai import ChatOpenAI
+
         _llm_planner = ChatOpenAI(
             model="gpt-4o-mini",
             temperature=0.3,
             api_key=os.getenv("OPENAI_KEY"),
             streaming=False,
             request_timeout=180,  # 3분으로 증가
+            http_async_client=get_http_client(),
         )
     return _llm_planner
\ No newline at end of file
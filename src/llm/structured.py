@@ -0,0 +1,151 @@
+import json
+import os
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.output_parsers import PydanticOutputParser
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.runnables import Runnable
+
+STRUCTURED_OUTPUT_MODES = ("native", "parser")
+# 구조화 출력 방식
+#   native: 모델의 JSON 스키마 출력(with_structured_output) 사용, 스키마 검증 실패 시 같은 응답 원문을 파서로 다시 파싱
+#   parser: format_instructions를 프롬프트에 넣고 응답 텍스트를 PydanticOutputParser로 파싱
+STRUCTURED_OUTPUT_MODE = os.getenv("STRUCTURED_OUTPUT_MODE", "native")
+
+# native 모드에서 {format_instructions} 자리에 들어갈 문구 (스키마는 API로 전달)
+NATIVE_FORMAT_INSTRUCTIONS = "응답 JSON 스키마는 별도로 지정됩니다. 스키마의 모든 필수 필드를 채워주세요."
+
+
+class StructuredOutput:
+    """
+    프롬프트 템플릿 + Pydantic 스키마로 구조화 출력 체인을 구성
+
+    같은 템플릿으로 native/parser 두 방식의 프롬프트와 체인을 만들고,
+    모델이 네이티브 구조화 출력을 지원하지 않으면 parser 방식을 사용합니다.
+    native 방식이 실패해도 LLM을 다시 호출하지 않고 받은 응답 원문만 파서로 다시 파싱하므로
+    요청당 LLM 호출은 항상 한 번입니다.
+
+    LLM 클라이언트, 파서, 프롬프트는 처음 사용할 때 만들어지므로 모듈 import 시점에는
+    langchain / OpenAI 클라이언트를 불러오지 않습니다.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        input_variables: List[str],
+        schema: Type[BaseModel],
+        get_llm: Callable[[], "BaseChatModel"],
+    ):
+        self.template = template
+        self.input_variables = input_variables
+        self.schema = schema
+        self._get_llm = get_llm
+        self._chains: Dict[str, "Runnable"] = {}
+
+    @cached_property
+    def llm(self) -> "BaseChatModel":
+        return self._get_llm()
+
+    @cached_property
+    def parser(self) -> "PydanticOutputParser":
+        from langchain_core.output_parsers import PydanticOutputParser
+
+        return PydanticOutputParser(pydantic_object=self.schema)
+
+    @cached_property
+    def format_instructions(self) -> str:
+        return self.parser.get_format_instructions()
+
+    @cached_property
+    def parser_prompt(self) -> "PromptTemplate":
+        from langchain_core.prompts import PromptTemplate
+
+        return PromptTemplate(
+            template=self.template,
+            input_variables=self.input_variables,
+            partial_variables={"format_instructions": self.format_instructions},
+        )
+
+    @cached_property
+    def native_prompt(self) -> "PromptTemplate":
+        from langchain_core.prompts import PromptTemplate
+
+        return PromptTemplate(
+            template=self.template,
+            input_variables=self.input_variables,
+            partial_variables={"format_instructions": NATIVE_FORMAT_INSTRUCTIONS},
+        )
+
+    def parser_chain(self) -> "Runnable":
+        """format_instructions + 텍스트 파싱 체인"""
+        return self.parser_prompt | self.llm | self.parser
+
+    def native_chain(self) -> Optional["Runnable"]:
+        """네이티브 JSON 스키마 출력 체인 (모델이 지원하지 않으면 None)"""
+        from langchain_core.runnables import RunnableLambda
+
+        try:
+            structured_llm = self.llm.with_structured_output(self.schema, include_raw=True)
+        except NotImplementedError:
+            return None
+        return self.native_prompt | structured_llm | RunnableLambda(self.parse_native)
+
+    def parse_native(self, output: Dict[str, Any]) -> BaseModel:
+        """
+        with_structured_output(include_raw=True) 결과에서 스키마 객체 추출
+
+        스키마 검증에 실패하면 응답 원문(본문 또는 tool call 인자)을 PydanticOutputParser로
+        한 번 더 파싱합니다 (코드 블록, 주석 등 파서가 허용하는 형식 차이 복구).
+
+        Raises:
+            Exception: 원문도 파싱할 수 없으면 파서 오류
+        """
+        if output.get("parsed") is not None:
+            return output["parsed"]
+        raw = output.get("raw")
+        tool_calls = getattr(raw, "tool_calls", None)
+        if tool_calls:
+            text = json.dumps(tool_calls[0].get("args", {}), ensure_ascii=False)
+        else:
+            text = getattr(raw, "content", "") or ""
+        return self.parser.parse(text if isinstance(text, str) else str(text))
+
+    def resolve_mode(self, mode: Optional[str] = None) -> str:
+        mode = mode or STRUCTURED_OUTPUT_MODE
+        if mode not in STRUCTURED_OUTPUT_MODES:
+            raise ValueError(f"지원하지 않는 structured output 모드입니다: {mode} (native, parser 중 선택)")
+        return mode
+
+    def prompt(self, mode: Optional[str] = None) -> "PromptTemplate":
+        """모드에 맞는 프롬프트"""
+        return self.native_prompt if self.resolve_mode(mode) == "native" else self.parser_prompt
+
+    def chain(self, mode: Optional[str] = None) -> "Runnable":
+        """
+        모드에 맞는 실행 체인 (모드별로 한 번만 생성)
+
+        native 모드는 스키마 출력 검증에 실패하면 parser 체인을 다시 호출하지 않고
+        같은 응답 원문을 파서로 파싱합니다 (parse_native).
+
+        Args:
+            mode: "native" 또는 "parser" (기본값: STRUCTURED_OUTPUT_MODE)
+
+        Returns:
+            Runnable: 입력 dict를 받아 스키마 객체를 반환하는 체인
+        """
+        mode = self.resolve_mode(mode)
+        chain = self._chains.get(mode)
+        if chain is None:
+            native = self.native_chain() if mode == "native" else None
+            chain = native if native is not None else self.parser_chain()
+            self._chains[mode] = chain
+        return chain
+
+    def prewarm(self):
+        """기본 모드의 체인을 미리 생성 (LLM 클라이언트, 파서, 프롬프트 포함)"""
+        self.chain()
@@ -0,0 +1,181 @@
+import math
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_core.outputs import LLMResult
+
+# 토큰 계산 기준 모델 (llm_client와 동일)
+TOKENIZER_MODEL = os.getenv("TOKENIZER_MODEL", "gpt-4o-mini")
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def get_encoding():
+    """
+    tiktoken 인코딩 (최초 사용 시 로드)
+
+    인코딩 파일을 받을 수 없는 환경(오프라인 등)에서는 None을 반환하고
+    바이트 길이 기반 근사치로 계산합니다.
+    """
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                try:
+                    import tiktoken
+                    try:
+                        _encoding = tiktoken.encoding_for_model(TOKENIZER_MODEL)
+                    except KeyError:
+                        _encoding = tiktoken.get_encoding("o200k_base")
+                except Exception as e:
+                    print(f"⚠️  tiktoken 인코딩 로드 실패, 근사치로 토큰 계산: {e}")
+                    _encoding = None
+                _encoding_loaded = True
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """텍스트의 토큰 수"""
+    if not text:
+        return 0
+    encoding = get_encoding()
+    if encoding is None:
+        # 한글 1자(3바이트) ≈ 1토큰, 영문 약 3~4자 ≈ 1토큰 (넉넉하게 계산)
+        return math.ceil(len(text.encode("utf-8")) / 3)
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """텍스트를 최대 max_tokens 토큰까지 자름"""
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = get_encoding()
+    if encoding is None:
+        # 근사치 기준: 앞에서부터 바이트 예산 안에 들어가는 글자까지
+        budget, end = max_tokens * 3, 0
+        for char in text:
+            budget -= len(char.encode("utf-8"))
+            if budget < 0:
+                break
+            end += 1
+        return text[:end]
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    # 토큰 경계에서 잘린 한글 바이트 조각 제거
+    return encoding.decode(tokens[:max_tokens]).rstrip("�")
+
+
+def pack_lines(prefixes: Sequence[str], details: Sequence[str], budget: int) -> List[str]:
+    """
+    순위대로 정렬된 항목을 토큰 예산 안에 담음
+
+    먼저 각 항목의 기본 정보(prefix)를 순서대로 예산이 허용하는 만큼 담고,
+    남은 예산을 상세 설명(detail)에 고르게 나눠 줍니다. 짧은 설명이 쓰지 않은 몫은
+    긴 설명에 다시 배분됩니다.
+
+    Args:
+        prefixes: 항목별 필수 문자열 (예: "1. 이름 | 주소 | ")
+        details: 항목별 상세 설명 (예산에 맞춰 잘림)
+        budget: 전체 토큰 예산
+
+    Returns:
+        List[str]: 예산 안에 들어간 항목 문자열 목록
+    """
+    # 줄바꿈 1토큰 포함
+    prefix_tokens = [count_tokens(prefix) + 1 for prefix in prefixes]
+    remaining = budget
+    count = 0
+    for tokens in prefix_tokens:
+        if tokens > remaining:
+            break
+        remaining -= tokens
+        count += 1
+
+    detail_tokens = [count_tokens(detail) for detail in details[:count]]
+    allowance = [0] * count
+    for rank, idx in enumerate(sorted(range(count), key=lambda i: detail_tokens[i])):
+        share = remaining // (count - rank)
+        allowance[idx] = min(detail_tokens[idx], share)
+        remaining -= allowance[idx]
+
+    return [
+        prefixes[idx] + truncate_tokens(details[idx], allowance[idx]).rstrip()
+        for idx in range(count)
+    ]
+
+
+class TokenUsage:
+    """체인별 누적 토큰 사용량 (프롬프트/응답)"""
+
+    def __init__(self):
+        self._usage: Dict[str, Dict[str, int]] = {}
+
+    def record(self, chain: str, prompt_tokens: int, completion_tokens: int):
+        usage = self._usage.setdefault(chain, {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0})
+        usage["calls"] += 1
+        usage["prompt_tokens"] += prompt_tokens
+        usage["completion_tokens"] += completion_tokens
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """체인별 호출 수, 누적/평균 토큰 수"""
+        result = {}
+        for chain, usage in self._usage.items():
+            calls = usage["calls"] or 1
+            result[chain] = {
+                **usage,
+                "avg_prompt_tokens": round(usage["prompt_tokens"] / calls, 1),
+                "avg_completion_tokens": round(usage["completion_tokens"] / calls, 1),
+            }
+        return result
+
+    def reset(self):
+        self._usage.clear()
+
+
+token_usage = TokenUsage()
+
+
+class TokenCounter(BaseCallbackHandler):
+    """
+    LLM 호출 한 번의 프롬프트/응답 토큰 수를 token_usage에 기록하는 콜백
+
+    API 응답에 usage가 있으면 그 값을, 없으면(스트리밍, 가짜 모델 등) tiktoken으로 계산한 값을 사용합니다.
+    """
+    run_inline = True
+
+    def __init__(self, chain: str):
+        self.chain = chain
+        self._prompt_tokens: Dict[Any, int] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List["BaseMessage"]], *, run_id, **kwargs: Any):
+        self._prompt_tokens[run_id] = sum(
+            count_tokens(str(message.content)) for batch in messages for message in batch
+        )
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id, **kwargs: Any):
+        self._prompt_tokens[run_id] = sum(count_tokens(prompt) for prompt in prompts)
+
+    def on_llm_end(self, response: "LLMResult", *, run_id, **kwargs: Any):
+        prompt_tokens = self._prompt_tokens.pop(run_id, 0)
+        completion_tokens = 0
+        usage: Optional[dict] = None
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or usage
+                completion_tokens += count_tokens(generation.text)
+        if usage:
+            prompt_tokens = usage.get("input_tokens", prompt_tokens)
+            completion_tokens = usage.get("output_tokens", completion_tokens)
+        token_usage.record(self.chain, prompt_tokens, completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id, **kwargs: Any):
+        self._prompt_tokens.pop(run_id, None)
@@ -1,22 +1,73 @@
+import asyncio
+import json
+import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from beanie import PydanticObjectId
-from fastapi import FastAPI
+from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
-from src.chain.categories.extractor import extract_place_traits
-from src.chain.purpose.extractor import respond_to_purpose
+from src.chain.categories.extractor import extract_place_traits, mongo_cache_stats, traits_cache
+from src.chain.purpose.extractor import purpose_cache, respond_to_purpose
 from src.chain.recommend.extractor import recommend_places
-from src.chain.planner.extractor import create_travel_plan, get_travel_plan
-from src.database.database import app_init
-from src.model.chat import Recent
+from src.chain.planner.cache import etag_matches, get_cached_plan, not_modified_stats, planner_cache
+from src.chain.planner.extractor import create_travel_plan, day_flight, load_serialized_plan, planner_flight, regenerate_day, stream_travel_plan
+from src.chain.planner.jobs import ACTIVE_STATUSES, PLANNER_BACKGROUND, get_job_status, job_status, planner_jobs, submit_planner_job
+from src.chain.planner.verify import verification_stats
+from src.chain.prewarm import CHAIN_PREWARM, prewarm_chains
+from src.database.database import app_init, close_db
+from src.database.explain import MONGO_EXPLAIN_ON_STARTUP, report_query_plans
+from src.database.session import add_option, set_day, set_people
+from src.llm.executor import llm_flight
+from src.llm.http_client import close_http_client
+from src.llm.tokens import token_usage
+from src.metrics.middleware import MetricsMiddleware
+from src.metrics.registry import counter_lines, registry
+from src.search.place_index import place_index
+from src.search.trait_matches import trait_match_table
+
+# 장소 인덱스 증분 갱신 주기 (초)
+PLACE_INDEX_REFRESH_SECONDS = float(os.getenv("PLACE_INDEX_REFRESH_SECONDS", "300"))
+# 태그 매칭 표 다시 읽는 주기 (초, 배치 작업 결과 반영)
+TRAIT_MATCH_RELOAD_SECONDS = float(os.getenv("TRAIT_MATCH_RELOAD_SECONDS", "3600"))
+
+
+async def prewarm():
+    try:
+        elapsed = await asyncio.to_thread(prewarm_chains)
+        print(f"chains prewarmed! ({elapsed:.2f}s)")
+    except Exception as e:
+        print(f"chain prewarm failed: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await app_init()
     print("database connected!")
+    if MONGO_EXPLAIN_ON_STARTUP:
+        print("query plans:")
+        await report_query_plans()
+    await place_index.load()
+    print(f"place index loaded! ({len(place_index)} places)")
+    await trait_match_table.load()
+    print(f"trait match table loaded! ({len(trait_match_table)} traits)")
+    # 체인(langchain / openai import 포함)과 tiktoken 인코딩은 요청을 받기 시작한 뒤 별도 스레드에서 미리 생성
+    prewarm_task = asyncio.create_task(prewarm()) if CHAIN_PREWARM else None
+    refresh_task = asyncio.create_task(place_index.refresh_periodically(PLACE_INDEX_REFRESH_SECONDS))
+    reload_task = asyncio.create_task(trait_match_table.reload_periodically(TRAIT_MATCH_RELOAD_SECONDS))
+    # 백그라운드 planner 작업 워커 시작 (이전 실행에서 끝나지 않은 작업 복구)
+    await planner_jobs.start()
     yield
+    # 종료: 진행 중인 작업을 되돌린 뒤(DB 필요) 백그라운드 태스크와 연결 풀 정리
+    await planner_jobs.stop()
+    refresh_task.cancel()
+    reload_task.cancel()
+    await asyncio.gather(*(task for task in (refresh_task, reload_task, prewarm_task) if task), return_exceptions=True)
+    await close_http_client()
+    close_db()
+    print("connections closed!")
 
 app = FastAPI(lifespan=lifespan)
 
@@ -33,6 +84,75 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+
+
+def token_metrics():
+    values = {}
+    for chain, usage in token_usage.stats().items():
+        values[(chain, "prompt")] = usage["prompt_tokens"]
+        values[(chain, "completion")] = usage["completion_tokens"]
+    return counter_lines("odegano_llm_tokens_total", "체인별 누적 LLM 토큰 수", ["chain", "kind"], values)
+
+
+def traits_cache_metrics():
+    memory = traits_cache.stats()
+    values = {
+        ("memory", "hit"): memory["hits"],
+        ("memory", "miss"): memory["misses"],
+        ("mongo", "hit"): mongo_cache_stats["hits"],
+        ("mongo", "miss"): mongo_cache_stats["misses"],
+    }
+    return counter_lines("odegano_traits_cache_total", "/traits 캐시 조회 결과", ["layer", "result"], values)
+
+
+def singleflight_metrics():
+    values = {}
+    for flight in (llm_flight, planner_flight, day_flight):
+        stats = flight.stats()
+        values[(flight.name, "started")] = stats["started"]
+        values[(flight.name, "shared")] = stats["shared"]
+    return counter_lines("odegano_singleflight_total", "중복 요청 합치기 결과 (새로 실행/진행 중인 작업에 합류)", ["flight", "result"], values)
+
+
+def planner_job_metrics():
+    stats = planner_jobs.stats()
+    lines = ["# HELP odegano_planner_jobs 프로세스 내 백그라운드 planner 작업 수", "# TYPE odegano_planner_jobs gauge"]
+    lines += [f'odegano_planner_jobs{{state="{state}"}} {stats[state]}' for state in ("queued", "running")]
+    return lines
+
+
+def purpose_cache_metrics():
+    stats = purpose_cache.stats()
+    values = {("exact",): stats["hits"], ("similar",): stats["similar_hits"], ("miss",): stats["misses"]}
+    return counter_lines("odegano_purpose_cache_total", "/perpose 유사 목적 캐시 조회 결과", ["result"], values)
+
+
+def trait_match_metrics():
+    stats = trait_match_table.stats()
+    values = {("hit",): stats["hits"], ("miss",): stats["misses"]}
+    return counter_lines("odegano_trait_match_total", "/recommend 태그 매칭 표 조회 결과 (miss면 지역 조회로 대체)", ["result"], values)
+
+
+def place_verification_metrics():
+    values = {(result,): count for result, count in verification_stats.items()}
+    return counter_lines("odegano_planner_places_total", "생성된 일정 관광지의 장소 데이터 검증 결과", ["result"], values)
+
+
+def planner_cache_metrics():
+    stats = planner_cache.stats()
+    values = {("hit",): stats["hits"], ("miss",): stats["misses"], ("not_modified",): not_modified_stats["count"]}
+    return counter_lines("odegano_planner_cache_total", "GET /planner 응답 캐시 조회 결과 (not_modified: 304 응답)", ["result"], values)
+
+
+registry.register_collector(token_metrics)
+registry.register_collector(traits_cache_metrics)
+registry.register_collector(singleflight_metrics)
+registry.register_collector(planner_job_metrics)
+registry.register_collector(purpose_cache_metrics)
+registry.register_collector(trait_match_metrics)
+registry.register_collector(place_verification_metrics)
+registry.register_collector(planner_cache_metrics)
 
 @app.post("/traits")
 async def traits(places: str):
@@ -49,48 +169,30 @@ async def recommend(id: PydanticObjectId, limit: int = 10):
 
 @app.post("/people")
 async def people(id: PydanticObjectId, people: str):
-    recent = await Recent.get(id)
-    if not recent:
-        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
-    await recent.set({Recent.people: people})
-    return recent
+    return await set_people(id, people)
 
 @app.post("/day")
 async def day(id: PydanticObjectId, day: str):
-    recent = await Recent.get(id)
-    if not recent:
-        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
-    await recent.set({Recent.day: day})
-    return recent
+    return await set_day(id, day)
 
 @app.post("/options")
 async def options(id: PydanticObjectId, options: str):
-    recent = await Recent.get(id)
-    if not recent:
-        raise ValueError("Recent 데이터를 찾을 수 없습니다.")
-    
-    # 이미 완료된 상태면 추가 불가
-    if recent.finished:
-        raise ValueError("이미 완료된 설정입니다. 더 이상 옵션을 추가할 수 없습니다.")
-    
-    # "없어", "없음", "없습니다" 등의 응답 체크
-    negative_keywords = ["없어", "없음", "없습니다", "없다", "아니", "아니요", "no", "none"]
-    options_lower = options.lower().strip()
-    
-    if any(keyword in options_lower for keyword in negative_keywords):
-        # 추가할 옵션이 없다고 답한 경우 finished를 true로 설정
-        await recent.set({Recent.finished: True})
-    else:
-        # 옵션 추가
-        await recent.set({Recent.options: recent.options + [options]})
-    
-    return recent
+    # "없어", "없음" 등 부정 응답이면 finished를 true로 설정, 그 외에는 옵션 추가
+    return await add_option(id, options)
 
 @app.post("/planner")
-async def planner(id: PydanticObjectId, main_place: dict):
+async def planner(
+    id: PydanticObjectId,
+    main_place: dict,
+    mode: Optional[str] = None,
+    background: Optional[bool] = None
+):
     """
     메인 여행지를 기반으로 전체 여행 계획 생성 및 저장
     
+    백그라운드 모드에서는 작업을 등록하고 바로 202와 작업 상태를 반환하며,
+    진행 상황과 결과는 GET /planner/{recent_id}로 조회합니다.
+    
     Args:
         id: Recent 문서 ID
         main_place: 메인 여행지 정보
@@ -99,21 +201,112 @@ async def planner(id: PydanticObjectId, main_place: dict):
             - latitude: 위도
             - longitude: 경도
             - reason: 선택 이유
+        mode: 생성 모드 ("single": 한 번에 생성, "parallel": 일별 병렬 생성)
+        background: 백그라운드 작업 여부 (기본값: PLANNER_BACKGROUND 환경 변수)
     
     Returns:
         Planner: 저장된 여행 계획 (recent_id로 참조)
+        또는 백그라운드 모드에서 작업 상태 (job_id, status, ...)
+    """
+    if background is None:
+        background = PLANNER_BACKGROUND
+    if background:
+        job = await submit_planner_job(id, main_place, mode)
+        return JSONResponse(job_status(job), status_code=202)
+    return await create_travel_plan(id, main_place, mode)
+
+@app.post("/planner/stream")
+async def planner_stream(id: PydanticObjectId, main_place: dict):
+    """
+    여행 계획을 NDJSON 스트림으로 생성 (하루 일정이 완성될 때마다 전송)
+    
+    각 줄은 다음 중 하나입니다.
+        - {"event": "day", "data": DayPlan}
+        - {"event": "done", "data": Planner}
+        - {"event": "error", "message": 오류 메시지}
+    
+    day 이벤트는 장소 검증/동선 최적화 전 일정이므로 done을 받으면 done의 daily_plans로 교체해야 합니다.
+    같은 Recent의 백그라운드 작업이 진행 중이면 새로 생성하지 않고 409와 작업 상태를 반환합니다
+    (진행 상황은 GET /planner/{recent_id}로 조회).
     """
-    return await create_travel_plan(id, main_place)
+    status = await get_job_status(id)
+    if status and status["status"] in ACTIVE_STATUSES:
+        return JSONResponse(status, status_code=409)
+    events = await stream_travel_plan(id, main_place)
+    
+    async def ndjson():
+        async for event in events:
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    # nginx 프록시 버퍼링을 끄고 바로 전송
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson", headers={"X-Accel-Buffering": "no"})
 
 @app.get("/planner/{recent_id}")
-async def get_planner(recent_id: PydanticObjectId):
+async def get_planner(recent_id: PydanticObjectId, if_none_match: Optional[str] = Header(None)):
     """
     Recent ID로 저장된 여행 계획 조회
     
+    백그라운드 작업이 진행 중이면 202와 작업 상태(완성된 일별 일정 포함)를,
+    실패했으면 status가 "failed"인 작업 상태를 반환합니다.
+    저장된 계획은 직렬화한 JSON을 캐시해 계획 DB 조회 없이 응답하고,
+    If-None-Match가 ETag(updated_at 기반)와 같으면 본문 없이 304를 반환합니다.
+    
+    작업 상태는 캐시보다 먼저 매번 DB에서 확인하므로, 다른 워커에서 재생성 작업이 등록되어도
+    이전 계획 대신 바로 작업 상태를 응답합니다. 캐시 무효화는 쓰기가 일어난 워커에만 적용되므로,
+    다른 워커에서 하루 일정을 수정(PATCH)한 경우에는 최대 PLANNER_CACHE_TTL초 동안 이전 계획이 응답될 수 있습니다.
+    
+    Args:
+        recent_id: Recent 문서 ID
+        if_none_match: 이전 응답의 ETag
+    
+    Returns:
+        Planner: 저장된 여행 계획 (또는 작업 상태)
+    """
+    status = await get_job_status(recent_id)
+    if status:
+        return JSONResponse(status, status_code=202 if status["status"] != "failed" else 200)
+    cached = get_cached_plan(recent_id)
+    if cached is None:
+        cached = await load_serialized_plan(recent_id)
+    
+    # 브라우저도 매번 ETag로 다시 확인하도록 no-cache
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        not_modified_stats["count"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
+
+@app.patch("/planner/{recent_id}/days/{day}")
+async def patch_planner_day(
+    recent_id: PydanticObjectId,
+    day: int,
+    theme: Optional[str] = None,
+    area: Optional[str] = None
+):
+    """
+    저장된 여행 계획의 하루 일정만 다시 생성 (앞뒤 날 일정을 참고)
+    
     Args:
         recent_id: Recent 문서 ID
+        day: 다시 생성할 일차 (1부터 시작)
+        theme: 새 테마 (없으면 기존 하루 요약)
+        area: 새 지역 (없으면 기존 일정의 지역)
     
     Returns:
-        Planner: 저장된 여행 계획
+        DayPlan: 새로 저장된 하루 일정
+    """
+    return await regenerate_day(recent_id, day, theme, area)
+
+@app.get("/tokens")
+async def tokens():
+    """체인별 누적 LLM 토큰 사용량 (프롬프트/응답)"""
+    return token_usage.stats()
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Prometheus 텍스트 형식의 계측 값
+
+    요청/단계별/MongoDB 명령 처리 시간 히스토그램과 토큰, 캐시 카운터를 반환합니다.
     """
-    return await get_travel_plan(recent_id)
\ No newline at end of file
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,34 @@
+import time
+from typing import Any, Dict
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class LLMTimer(BaseCallbackHandler):
+    """
+    체인 실행 중 실제 모델 호출에 걸린 시간을 누적하는 콜백
+
+    체인 전체 시간에서 이 값을 빼면 프롬프트 구성 + 출력 파싱 시간이 됩니다.
+    """
+    run_inline = True
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._started: Dict[Any, float] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs: Any):
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs: Any):
+        self._started[run_id] = time.perf_counter()
+
+    def _finish(self, run_id):
+        start = self._started.pop(run_id, None)
+        if start is not None:
+            self.seconds += time.perf_counter() - start
+
+    def on_llm_end(self, response, *, run_id, **kwargs: Any):
+        self._finish(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id, **kwargs: Any):
+        self._finish(run_id)
@@ -0,0 +1,47 @@
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.metrics.registry import METRICS_ENABLED, REQUEST_SECONDS, current_endpoint
+
+
+class MetricsMiddleware:
+    """
+    요청별 처리 시간을 라우트 경로 템플릿(예: /planner/{recent_id}) 기준으로 기록
+
+    처리 중에는 current_endpoint에 엔드포인트를 설정해 단계별 span이 같은 라벨로 기록되게 합니다.
+    스트리밍 응답은 본문 전송이 끝날 때까지의 시간을 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _endpoint(self, scope: Scope) -> str:
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return "unmatched"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = self._endpoint(scope)
+        token = current_endpoint.set(endpoint)
+        status = "500"
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint, scope["method"], status)
+            current_endpoint.reset(token)
@@ -0,0 +1,40 @@
+from typing import Dict, Tuple
+
+from pymongo import monitoring
+
+from src.metrics.registry import METRICS_ENABLED, MONGO_SECONDS
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """
+    MongoDB 명령 처리 시간을 명령/컬렉션별로 기록하는 pymongo 리스너
+
+    완료 이벤트에는 컬렉션 정보가 없으므로 시작 이벤트에서 request_id별로 보관합니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple, Tuple[str, str]] = {}
+
+    def _key(self, event) -> Tuple:
+        return event.connection_id, event.request_id
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = "-"
+        self._pending[self._key(event)] = (event.command_name, collection)
+
+    def _finish(self, event, status: str):
+        command, collection = self._pending.pop(self._key(event), (event.command_name, "-"))
+        MONGO_SECONDS.observe(event.duration_micros / 1_000_000, command, collection, status)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finish(event, "ok")
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finish(event, "error")
+
+
+def mongo_event_listeners() -> list:
+    """AsyncIOMotorClient에 전달할 리스너 목록 (계측을 끄면 빈 목록)"""
+    return [MongoCommandTimer()] if METRICS_ENABLED else []
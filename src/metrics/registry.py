@@ -0,0 +1,163 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# 계측 사용 여부 (기본값: 사용)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+# 모든 시계열에 worker(프로세스 ID) 라벨 추가 여부 (기본값: 사용)
+# 계측 값은 워커 프로세스마다 따로 누적되고 /metrics는 요청을 받은 워커의 값만 반환하므로,
+# 라벨이 없으면 nginx 뒤에서 수집할 때마다 다른 워커의 값이 섞여 카운터가 줄어든 것처럼 보입니다.
+# 워커별 시계열은 sum by (...) (rate(...))처럼 워커 라벨을 합쳐서 조회합니다.
+METRICS_WORKER_LABEL = os.getenv("METRICS_WORKER_LABEL", "1") == "1"
+
+# 지연 시간 히스토그램 버킷 (초) - 수 ms의 DB 조회부터 수십 초의 planner LLM 호출까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# 현재 처리 중인 엔드포인트 (라우트 경로 템플릿, 요청 밖에서는 "-")
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="-")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+class Histogram:
+    """
+    Prometheus 형식 히스토그램
+
+    라벨 조합별로 버킷 카운트, 합계, 개수를 누적합니다.
+    pymongo 리스너처럼 다른 스레드에서도 기록되므로 lock으로 보호합니다.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                # [버킷별 카운트 (+Inf 포함), 합계, 개수]
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(s[0]), s[1], s[2]) for labels, s in self._series.items()]
+        for labelvalues, counts, total, count in sorted(snapshot):
+            labels = _format_labels(self.labelnames, labelvalues)
+            prefix = labels + "," if labels else ""
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {count}")
+        return lines
+
+
+class Registry:
+    """히스토그램과 외부 카운터(콜백)를 모아 /metrics 텍스트로 출력"""
+
+    def __init__(self):
+        self._histograms: List[Histogram] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str], buckets=DEFAULT_BUCKETS) -> Histogram:
+        histogram = Histogram(name, documentation, labelnames, buckets)
+        self._histograms.append(histogram)
+        return histogram
+
+    def register_collector(self, collector: Callable[[], List[str]]):
+        """출력 시점에 호출되어 Prometheus 텍스트 줄 목록을 반환하는 함수 등록"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for histogram in self._histograms:
+            lines.extend(histogram.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        if METRICS_WORKER_LABEL:
+            lines = [with_worker_label(line) for line in lines]
+        return "\n".join(lines) + "\n"
+
+
+def with_worker_label(line: str, worker: str = None) -> str:
+    """시계열 줄에 worker 라벨 추가 (# HELP/# TYPE 줄은 그대로)"""
+    if not line or line.startswith("#"):
+        return line
+    label = f'worker="{worker or os.getpid()}"'
+    name, sep, rest = line.partition("{")
+    if not sep:
+        name, _, value = line.partition(" ")
+        return f"{name}{{{label}}} {value}"
+    if rest.startswith("}"):
+        return f"{name}{{{label}{rest}"
+    return f"{name}{{{label},{rest}"
+
+
+registry = Registry()
+
+REQUEST_SECONDS = registry.histogram(
+    "odegano_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["endpoint", "method", "status"],
+)
+STAGE_SECONDS = registry.histogram(
+    "odegano_stage_duration_seconds",
+    "엔드포인트 내부 단계별 처리 시간",
+    ["endpoint", "stage"],
+)
+MONGO_SECONDS = registry.histogram(
+    "odegano_mongo_command_duration_seconds",
+    "MongoDB 명령 처리 시간",
+    ["command", "collection", "status"],
+)
+
+
+def observe_stage(stage: str, seconds: float):
+    """현재 엔드포인트의 단계 처리 시간 기록"""
+    if METRICS_ENABLED:
+        STAGE_SECONDS.observe(seconds, current_endpoint.get(), stage)
+
+
+@contextmanager
+def span(stage: str):
+    """
+    with 블록의 실행 시간을 현재 엔드포인트의 stage 시간으로 기록
+
+    예:
+        with span("recent_get"):
+            recent = await Recent.get(recent_id)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def counter_lines(name: str, documentation: str, labelnames: Sequence[str], values: Dict[Tuple[str, ...], float]) -> List[str]:
+    """카운터 값 dict를 Prometheus 텍스트 줄로 변환"""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} counter"]
+    for labelvalues, value in sorted(values.items()):
+        lines.append(f"{name}{{{_format_labels(labelnames, labelvalues)}}} {value}")
+    return lines
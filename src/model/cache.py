@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class CachedTraits(Document):
+    """/traits 응답 캐시 (재배포 후에도 유지되는 2차 캐시)"""
+    key: str = Field(..., description="정규화된 여행지 + 프롬프트/모델 버전 해시")
+    features: dict = Field(..., description="PlaceFeatures 결과")
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "cached_traits"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            # 30일 후 자동 만료
+            IndexModel([("created_at", ASCENDING)], expireAfterSeconds=60 * 60 * 24 * 30),
+        ]
@@ -1,5 +1,10 @@
 from beanie import Document
+from datetime import datetime
 from typing import Optional
+from pydantic import model_validator
+from pymongo import ASCENDING, GEOSPHERE, IndexModel
+
+from src.search.geo import geo_point
 
 class Place(Document):
     """관광지/유적지 모델"""
@@ -10,6 +15,33 @@ class Place(Document):
     latitude: Optional[float] = None  # 위도
     longitude: Optional[float] = None  # 경도
     region: Optional[str] = None  # 지역
+    location: Optional[dict] = None  # GeoJSON Point (위도/경도로 자동 생성)
+    source_key: Optional[str] = None  # 원본 데이터 기준 고유 키 (재적재 시 upsert 기준)
+    updated_at: Optional[datetime] = None  # 마지막 적재/수정 시각 (PlaceIndex 증분 갱신 기준)
+
+    @model_validator(mode="after")
+    def fill_location(self):
+        if self.location is None and self.latitude is not None and self.longitude is not None:
+            self.location = geo_point(self.latitude, self.longitude)
+        return self
     
     class Settings:
         name = "places"  # MongoDB 컬렉션 이름
+        indexes = [
+            IndexModel([("location", GEOSPHERE)]),
+            # 유형 + 지역 필터
+            IndexModel([("type", ASCENDING), ("region", ASCENDING)], name="type_region"),
+            # 주소가 있는 장소만 담는 부분 인덱스 (추천 후보 조회용, address > "" 조건과 함께 사용)
+            IndexModel(
+                [("type", ASCENDING)],
+                name="type_with_address",
+                partialFilterExpression={"address": {"$gt": ""}},
+            ),
+            # PlaceIndex 증분 갱신 (updated_at >= 마지막 반영 시각)
+            IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+            IndexModel(
+                [("source_key", ASCENDING)],
+                unique=True,
+                partialFilterExpression={"source_key": {"$type": "string"}},
+            ),
+        ]
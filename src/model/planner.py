@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional, List
 from beanie import Document, PydanticObjectId
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 
 
 class Planner(Document):
@@ -14,8 +15,14 @@ class Planner(Document):
     total_days: int = Field(..., description="전체 여행 일수")
     daily_plans: List[dict] = Field(..., description="일별 여행 계획")
     overview: str = Field(..., description="전체 여행 개요")
+    verification: Optional[dict] = Field(None, description="장소 데이터 검증 결과 (matched/unverified 관광지 수)")
+    route: Optional[dict] = Field(None, description="동선 최적화 결과 (일별/전체 이동 거리 km 전후)")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
     class Settings:
         name = "planners"
+        indexes = [
+            # Recent 하나당 여행 계획 하나
+            IndexModel([("recent_id", ASCENDING)], unique=True),
+        ]
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class PlannerJob(Document):
+    """백그라운드 여행 계획 생성 작업"""
+    recent_id: PydanticObjectId = Field(..., description="참조하는 Recent 문서 ID")
+    main_place: dict = Field(..., description="메인 여행지 정보")
+    mode: Optional[str] = Field(None, description="생성 모드 (single/parallel, 없으면 PLANNER_MODE)")
+    status: str = Field("queued", description="queued, running, done, failed")
+    days: List[dict] = Field(default_factory=list, description="생성이 끝난 일별 일정 (parallel 모드 진행 상황)")
+    planner_id: Optional[PydanticObjectId] = Field(None, description="완료 후 저장된 Planner 문서 ID")
+    error: Optional[str] = Field(None, description="실패 사유")
+    attempts: int = Field(0, description="실행 시도 횟수")
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Settings:
+        name = "planner_jobs"
+        indexes = [
+            # Recent 하나당 작업 하나 (다시 요청하면 같은 문서를 재사용)
+            IndexModel([("recent_id", ASCENDING)], unique=True),
+            # 재시작 시 미완료 작업 복구 조회
+            IndexModel([("status", ASCENDING), ("updated_at", ASCENDING)]),
+        ]
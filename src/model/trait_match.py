@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import List
+
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class TraitMatch(Document):
+    """여행지 특징 태그 -> 어울리는 국내 관광지 순위 (오프라인 배치로 생성)"""
+    trait: str = Field(..., description="정규화된 태그 (normalize 결과)")
+    label: str = Field(..., description="원래 태그 표기")
+    place_ids: List[PydanticObjectId] = Field(default_factory=list, description="유사도 내림차순 장소 ID")
+    scores: List[float] = Field(default_factory=list, description="place_ids와 같은 순서의 유사도 점수")
+    built_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "trait_matches"
+        indexes = [
+            IndexModel([("trait", ASCENDING)], unique=True),
+        ]
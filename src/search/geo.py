@@ -0,0 +1,93 @@
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# 대한민국 영역 (마라도 ~ 북한 접경, 백령도 ~ 독도)
+KOREA_LAT_RANGE = (33.0, 38.9)
+KOREA_LON_RANGE = (124.5, 132.0)
+
+
+def in_korea(latitude: float, longitude: float) -> bool:
+    """좌표가 대한민국 영역 안에 있는지 확인"""
+    return (
+        KOREA_LAT_RANGE[0] <= latitude <= KOREA_LAT_RANGE[1]
+        and KOREA_LON_RANGE[0] <= longitude <= KOREA_LON_RANGE[1]
+    )
+
+
+def haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """한 지점에서 여러 지점까지의 대원 거리(km)"""
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """여러 지점 사이의 대원 거리 행렬(km), (N, N)"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    return haversine_km(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+
+
+def geo_point(latitude: float, longitude: float) -> dict:
+    """GeoJSON Point (좌표 순서는 [경도, 위도])"""
+    return {"type": "Point", "coordinates": [longitude, latitude]}
+
+
+class GeoGrid:
+    """
+    위경도 격자 기반 근접 검색 (2dsphere 인덱스가 없는 환경용)
+
+    cell_deg 크기의 격자 칸에 위치를 나눠 담고, 반경에 걸치는 칸만 거리 계산합니다.
+    """
+
+    def __init__(self, cell_deg: float = 0.1):
+        self.cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._lats: List[float] = []
+        self._lons: List[float] = []
+        self._keys: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def add(self, key: int, lat: float, lon: float):
+        idx = len(self._keys)
+        self._keys.append(key)
+        self._lats.append(lat)
+        self._lons.append(lon)
+        self._cells.setdefault(self._cell(lat, lon), []).append(idx)
+
+    def nearby(self, lat: float, lon: float, radius_km: float) -> List[Tuple[int, float]]:
+        """
+        반경 내 항목을 가까운 순으로 반환
+
+        Returns:
+            List[Tuple[int, float]]: (키, 거리 km) 목록
+        """
+        lat_span = math.ceil(radius_km / 111.0 / self.cell_deg)
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        lon_span = math.ceil(radius_km / (111.0 * cos_lat) / self.cell_deg)
+        cy, cx = self._cell(lat, lon)
+
+        candidates = []
+        for dy in range(-lat_span, lat_span + 1):
+            for dx in range(-lon_span, lon_span + 1):
+                candidates.extend(self._cells.get((cy + dy, cx + dx), ()))
+        if not candidates:
+            return []
+
+        idx = np.asarray(candidates)
+        lats = np.asarray(self._lats)[idx]
+        lons = np.asarray(self._lons)[idx]
+        distances = haversine_km(lat, lon, lats, lons)
+        within = np.nonzero(distances <= radius_km)[0]
+        order = within[np.argsort(distances[within], kind="stable")]
+        return [(self._keys[idx[i]], float(distances[i])) for i in order]
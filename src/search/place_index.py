@@ -0,0 +1,385 @@
+import asyncio
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from beanie import PydanticObjectId
+from pymongo.errors import PyMongoError
+
+from src.model.place import Place
+from src.search.geo import GeoGrid, geo_point, haversine_km
+from src.search.ranker import ngram_order, place_vector, tf_vector, tfidf_scores, top_k_indices
+from src.search.text import bigrams, normalize
+
+# 시도 정식 명칭 -> 약칭 (예: "전라남도" -> "전남")
+SIDO_ALIASES = {
+    "서울특별시": ["서울"],
+    "부산광역시": ["부산"],
+    "대구광역시": ["대구"],
+    "인천광역시": ["인천"],
+    "광주광역시": ["광주"],
+    "대전광역시": ["대전"],
+    "울산광역시": ["울산"],
+    "세종특별자치시": ["세종"],
+    "경기도": ["경기"],
+    "강원도": ["강원"],
+    "강원특별자치도": ["강원"],
+    "충청북도": ["충북"],
+    "충청남도": ["충남"],
+    "전라북도": ["전북"],
+    "전북특별자치도": ["전북"],
+    "전라남도": ["전남"],
+    "경상북도": ["경북"],
+    "경상남도": ["경남"],
+    "제주특별자치도": ["제주"],
+}
+
+
+def region_tokens(address: Optional[str], region: Optional[str] = None) -> set:
+    """지역명과 주소 앞 두 단어(시도, 시군구)의 정규화 토큰 + 시도 약칭"""
+    tokens = set()
+    words = (address or "").split()
+    for word in [region] + words[:2]:
+        token = normalize(word)
+        if token:
+            tokens.add(token)
+            tokens.update(SIDO_ALIASES.get(token, []))
+    return tokens
+
+
+class PlaceIndex:
+    """
+    지역/주소 기반 장소 후보 검색용 메모리 인덱스
+
+    - 지역 토큰(시도, 시군구, 약칭) -> 장소 위치 배열
+    - 주소/지역 문자 바이그램 -> 장소 위치 배열
+    정규식 풀스캔 대신 메모리에서 후보를 바로 찾습니다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.places: List[Place] = []
+        self._texts: List[str] = []
+        self._by_id: Dict[PydanticObjectId, Place] = {}
+        self._tokens: Dict[str, array] = {}
+        self._bigrams: Dict[str, array] = {}
+        # 장소 이름 검색용 (정규화 이름 -> 위치, 이름 바이그램 -> 위치)
+        self._names: Dict[str, array] = {}
+        self._name_bigrams: Dict[str, array] = {}
+        # 랭킹용 n-gram 벡터 (처음 랭킹에 쓰일 때 계산)
+        self._vectors: Dict[Tuple[int, int], np.ndarray] = {}
+        # 좌표가 있는 장소의 격자 인덱스
+        self._grid = GeoGrid()
+        self._last_id: Optional[PydanticObjectId] = None
+        # 인덱스에 반영한 장소의 최대 updated_at (증분 갱신 기준)
+        self._updated_at: Optional[datetime] = None
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    @staticmethod
+    def _region_tokens(place: Place) -> set:
+        return region_tokens(place.address, place.region)
+
+    def _add(self, place: Place):
+        pos = len(self.places)
+        text = normalize(place.region) + "|" + normalize(place.address)
+        self.places.append(place)
+        self._texts.append(text)
+        self._by_id[place.id] = place
+        for token in self._region_tokens(place):
+            self._tokens.setdefault(token, array("I")).append(pos)
+        for gram in bigrams(text):
+            self._bigrams.setdefault(gram, array("I")).append(pos)
+        name = normalize(place.name)
+        self._names.setdefault(name, array("I")).append(pos)
+        for gram in bigrams(name):
+            self._name_bigrams.setdefault(gram, array("I")).append(pos)
+        if place.latitude is not None and place.longitude is not None:
+            self._grid.add(pos, place.latitude, place.longitude)
+
+    def add_places(self, places: Iterable[Place]):
+        for place in places:
+            self._add(place)
+            if self._last_id is None or place.id > self._last_id:
+                self._last_id = place.id
+            if place.updated_at is not None and (self._updated_at is None or place.updated_at > self._updated_at):
+                self._updated_at = place.updated_at
+
+    def _rebuild(self, places: List[Place]):
+        # 조회 후 한 번에 교체 (await 없이 진행되므로 요청이 빈 인덱스를 보지 않음)
+        self._reset()
+        self.add_places(places)
+        self.loaded = True
+
+    async def load(self):
+        """전체 장소를 다시 읽어 인덱스를 구성"""
+        async with self._lock:
+            self._rebuild(await Place.find_all().sort(+Place.id).to_list())
+
+    async def refresh(self) -> int:
+        """
+        마지막으로 읽은 이후 추가/수정/삭제된 장소를 인덱스에 반영
+
+        새 문서(_id 증가)는 인덱스에 덧붙이고, 같은 _id로 수정된 문서(upsert 재적재, 좌표 보정 등,
+        updated_at 기준)나 삭제된 문서(컬렉션 문서 수 불일치)가 있으면 전체를 다시 읽습니다.
+
+        Returns:
+            int: 반영한 문서 수 (다시 읽었으면 전체 문서 수)
+        """
+        async with self._lock:
+            if self._last_id is None:
+                self._rebuild(await Place.find_all().sort(+Place.id).to_list())
+                return len(self.places)
+
+            conditions = [{"_id": {"$gt": self._last_id}}]
+            if self._updated_at is not None:
+                # 같은 시각에 쓰인 문서를 놓치지 않도록 경계 포함 (이미 반영한 문서는 아래에서 비교)
+                conditions.append({"updated_at": {"$gte": self._updated_at}})
+            else:
+                conditions.append({"updated_at": {"$type": "date"}})
+            changed = await Place.find({"$or": conditions}).sort(+Place.id).to_list()
+
+            new_places = [place for place in changed if place.id not in self._by_id]
+            modified = [
+                place for place in changed
+                if place.id in self._by_id and place.model_dump() != self._by_id[place.id].model_dump()
+            ]
+            if not modified:
+                self.add_places(new_places)
+                if await Place.find_all().count() == len(self.places):
+                    return len(new_places)
+            self._rebuild(await Place.find_all().sort(+Place.id).to_list())
+            return len(self.places)
+
+    async def refresh_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"place index refresh failed: {e}")
+
+    def get(self, place_id: PydanticObjectId) -> Optional[Place]:
+        """ID로 장소 조회 (인덱스에 없으면 None)"""
+        return self._by_id.get(place_id)
+
+    def match_name(self, name: str, min_score: float, limit: int = 20) -> List[Tuple[Place, float]]:
+        """
+        이름이 비슷한 장소 검색 (정규화 이름의 바이그램 Dice 계수)
+
+        한쪽 이름이 다른 쪽에 통째로 포함되면("담양 죽녹원" / "죽녹원") 짧은 이름이 3자 이상일 때 0.9점으로 봅니다.
+
+        Args:
+            name: 장소 이름
+            min_score: 최소 점수 (0~1)
+            limit: 최대 반환 수
+
+        Returns:
+            List[Tuple[Place, float]]: (장소, 점수) 점수 내림차순
+        """
+        q = normalize(name)
+        if not q:
+            return []
+        scores: Dict[int, float] = {pos: 1.0 for pos in self._names.get(q, ())}
+
+        grams = bigrams(q)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for pos in self._name_bigrams.get(gram, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+        for pos, count in shared.items():
+            if pos in scores:
+                continue
+            other = normalize(self.places[pos].name)
+            score = 2 * count / (len(grams) + len(bigrams(other)))
+            shorter, longer = sorted((q, other), key=len)
+            if len(shorter) >= 3 and shorter in longer:
+                score = max(score, 0.9)
+            if score >= min_score:
+                scores[pos] = score
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [(self.places[pos], score) for pos, score in ranked]
+
+    def _match_positions(self, query: str) -> Iterable[int]:
+        q = normalize(query)
+        if not q:
+            return range(len(self.places))
+        if q in self._tokens:
+            return self._tokens[q]
+        if len(q) == 1:
+            return [pos for pos, text in enumerate(self._texts) if q in text]
+
+        # 가장 짧은 바이그램 목록에서 시작해 부분 문자열로 검증 (정규식과 동일한 의미)
+        postings = [self._bigrams.get(gram) for gram in bigrams(q)]
+        if any(p is None for p in postings):
+            return []
+        smallest = min(postings, key=len)
+        return [pos for pos in smallest if q in self._texts[pos]]
+
+    def _filter_positions(
+        self,
+        query: str,
+        place_type: Optional[str],
+        require_address: bool,
+    ) -> Iterable[int]:
+        for pos in self._match_positions(query):
+            place = self.places[pos]
+            if place_type and place.type != place_type:
+                continue
+            if require_address and not place.address:
+                continue
+            yield pos
+
+    def search(
+        self,
+        query: str,
+        place_type: Optional[str] = None,
+        require_address: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Place]:
+        """
+        지역명/주소로 장소 후보 검색
+
+        Args:
+            query: 지역명 또는 주소 일부 (빈 문자열이면 전체)
+            place_type: 장소 유형 필터 (관광지/유적지)
+            require_address: 주소가 있는 장소만 반환
+            limit: 최대 반환 수
+
+        Returns:
+            List[Place]: 인덱스 순서대로 정렬된 장소 목록
+        """
+        results = []
+        for pos in self._filter_positions(query, place_type, require_address):
+            results.append(self.places[pos])
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def _vector(self, pos: int, n: int = 2) -> np.ndarray:
+        vector = self._vectors.get((pos, n))
+        if vector is None:
+            vector = place_vector(self.places[pos], n)
+            self._vectors[(pos, n)] = vector
+        return vector
+
+    def search_ranked(
+        self,
+        query: str,
+        relevance_text: str,
+        top_k: int,
+        place_type: Optional[str] = None,
+        require_address: bool = True,
+    ) -> List[Place]:
+        """
+        지역 조건에 맞는 모든 장소를 relevance_text와의 TF-IDF 유사도로 정렬해 상위 top_k개 반환
+
+        Args:
+            query: 지역명 또는 주소 일부 (빈 문자열이면 전체)
+            relevance_text: 랭킹 기준 텍스트 (키워드, 여행 목적 등)
+            top_k: 반환할 장소 수
+            place_type: 장소 유형 필터
+            require_address: 주소가 있는 장소만 반환
+
+        Returns:
+            List[Place]: 유사도 내림차순 장소 목록
+        """
+        positions = list(self._filter_positions(query, place_type, require_address))
+        if not positions or top_k <= 0:
+            return []
+        n = ngram_order(relevance_text)
+        doc_tf = np.stack([self._vector(pos, n) for pos in positions])
+        scores = tfidf_scores(doc_tf, tf_vector(relevance_text, n))
+        return [self.places[positions[i]] for i in top_k_indices(scores, top_k)]
+
+    def nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        place_type: Optional[str] = None,
+    ) -> List[Tuple[Place, float]]:
+        """
+        좌표 반경 내 장소를 가까운 순으로 조회
+
+        Returns:
+            List[Tuple[Place, float]]: (장소, 거리 km) 목록
+        """
+        results = []
+        for pos, distance in self._grid.nearby(latitude, longitude, radius_km):
+            place = self.places[pos]
+            if place_type and place.type != place_type:
+                continue
+            results.append((place, distance))
+            if len(results) >= limit:
+                break
+        return results
+
+place_index = PlaceIndex()
+
+
+# $nearSphere 조회 실패로 메모리 인덱스를 사용한 횟수 (첫 실패만 로그)
+_nearby_fallbacks = 0
+
+
+async def find_nearby_places(
+    latitude: float,
+    longitude: float,
+    radius_km: float = 30.0,
+    limit: int = 20,
+    place_type: Optional[str] = None,
+) -> List[Tuple[Place, float]]:
+    """
+    좌표 반경 내 실제 장소를 가까운 순으로 조회 (2dsphere 인덱스 우선, 실패 시 메모리 인덱스)
+
+    DB 조회가 기준이고, 메모리 인덱스의 격자 검색은 DB나 2dsphere 인덱스를 쓸 수 없을 때
+    (연결 실패, 인덱스 미생성, geo 쿼리를 지원하지 않는 DB) 대신 응답하는 용도입니다.
+    메모리 인덱스는 마지막 갱신 시점의 장소 데이터이므로 결과가 DB보다 늦을 수 있습니다.
+
+    Args:
+        latitude: 위도
+        longitude: 경도
+        radius_km: 검색 반경 (km)
+        limit: 최대 반환 수
+        place_type: 장소 유형 필터 (관광지/유적지)
+
+    Returns:
+        List[Tuple[Place, float]]: (장소, 거리 km) 목록
+    """
+    query = {
+        "location": {
+            "$nearSphere": {
+                "$geometry": geo_point(latitude, longitude),
+                "$maxDistance": radius_km * 1000,
+            }
+        }
+    }
+    if place_type:
+        query["type"] = place_type
+    try:
+        places = await Place.find(query).limit(limit).to_list()
+    except (PyMongoError, NotImplementedError) as e:
+        if not place_index.loaded:
+            raise
+        global _nearby_fallbacks
+        if not _nearby_fallbacks:
+            print(f"⚠️ $nearSphere 조회 실패, 메모리 장소 인덱스로 대신 조회: {e}")
+        _nearby_fallbacks += 1
+        return place_index.nearby(latitude, longitude, radius_km, limit, place_type)
+    if not places:
+        return []
+    distances = haversine_km(
+        latitude,
+        longitude,
+        np.array([p.latitude for p in places]),
+        np.array([p.longitude for p in places]),
+    )
+    return list(zip(places, distances.tolist()))
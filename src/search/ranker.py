@@ -0,0 +1,112 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.model.place import Place
+from src.search.text import normalize
+
+# 문자 n-gram 해시 벡터 차원
+NGRAM_DIM = 2048
+# 이름은 설명보다 가중치를 높게 반영
+NAME_WEIGHT = 2.0
+
+
+def ngram_vector(text: Optional[str], dim: int = NGRAM_DIM, n: int = 2) -> np.ndarray:
+    """
+    문자 n-gram 빈도를 해시 버킷에 누적한 벡터
+
+    유니그램(n=1)과 바이그램(n=2)은 서로 다른 특징 공간이므로 같은 벡터에 섞지 않습니다.
+    (한 글자 질의를 바이그램 공간에 넣으면 해시 충돌한 무관한 바이그램과 일치함)
+
+    Args:
+        text: 대상 텍스트
+        dim: 해시 버킷 수
+        n: 1(유니그램) 또는 2(바이그램), 글자 수가 n보다 적으면 0 벡터
+
+    Returns:
+        np.ndarray: (dim,) 빈도 벡터
+    """
+    codes = np.frombuffer(normalize(text).encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    if codes.size < n:
+        return np.zeros(dim, dtype=np.float32)
+    if n == 1:
+        grams = codes % dim
+    else:
+        grams = (codes[:-1] * 1_000_003 + codes[1:]) % dim
+    return np.bincount(grams, minlength=dim).astype(np.float32)
+
+
+def ngram_order(text: Optional[str]) -> int:
+    """질의에 맞는 n-gram 크기 (정규화 후 한 글자면 유니그램, 그 외 바이그램)"""
+    return 1 if len(normalize(text)) == 1 else 2
+
+
+def tf_vector(text: Optional[str], n: int = 2) -> np.ndarray:
+    """로그 스케일 n-gram 빈도 벡터 (sublinear TF)"""
+    return np.log1p(ngram_vector(text, n=n))
+
+
+def place_vector(place: Place, n: int = 2) -> np.ndarray:
+    """장소 이름/설명의 로그 스케일 n-gram 빈도 벡터 (질의와 같은 n 사용)"""
+    return np.log1p(NAME_WEIGHT * ngram_vector(place.name, n=n) + ngram_vector(place.description, n=n))
+
+
+def tfidf_scores(doc_tf: np.ndarray, query_tf: np.ndarray) -> np.ndarray:
+    """
+    후보 집합 기준 TF-IDF 코사인 유사도
+
+    Args:
+        doc_tf: (후보 수, 차원) TF 행렬
+        query_tf: (차원,) 질의 TF 벡터
+
+    Returns:
+        np.ndarray: 후보별 유사도 점수
+    """
+    n_docs = doc_tf.shape[0]
+    df = np.count_nonzero(doc_tf, axis=0)
+    idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+    # ||doc * idf|| 로 나누는 대신 점수에 역수를 곱해 큰 행렬 복사를 줄임
+    query = query_tf * idf
+    query /= np.linalg.norm(query) + 1e-9
+    doc_norms = np.sqrt((doc_tf * doc_tf) @ (idf * idf))
+    return (doc_tf @ (query * idf)) / (doc_norms + 1e-9)
+
+
+def tfidf_score_matrix(doc_tf: np.ndarray, query_tf: np.ndarray) -> np.ndarray:
+    """
+    여러 질의를 한 번에 계산하는 tfidf_scores (IDF, 문서 노름을 한 번만 계산)
+
+    Args:
+        doc_tf: (문서 수, 차원) TF 행렬
+        query_tf: (질의 수, 차원) 질의 TF 행렬
+
+    Returns:
+        np.ndarray: (질의 수, 문서 수) 유사도 점수
+    """
+    n_docs = doc_tf.shape[0]
+    df = np.count_nonzero(doc_tf, axis=0)
+    idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+    queries = query_tf * idf
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True) + 1e-9
+    doc_norms = np.sqrt((doc_tf * doc_tf) @ (idf * idf))
+    return ((queries * idf) @ doc_tf.T) / (doc_norms + 1e-9)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 인덱스 (점수 내림차순)"""
+    if k >= scores.size:
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def rank_places(places: Sequence[Place], query: str, top_k: int) -> List[Place]:
+    """장소 목록을 질의와의 유사도 순으로 정렬해 상위 top_k개 반환"""
+    if not places or top_k <= 0:
+        return []
+    n = ngram_order(query)
+    doc_tf = np.stack([place_vector(place, n) for place in places])
+    scores = tfidf_scores(doc_tf, tf_vector(query, n))
+    return [places[i] for i in top_k_indices(scores, top_k)]
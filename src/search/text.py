@@ -0,0 +1,13 @@
+import unicodedata
+from typing import Optional
+
+
+def normalize(text: Optional[str]) -> str:
+    """비교용 정규화 (NFKC, 소문자, 공백 제거)"""
+    if not text:
+        return ""
+    return "".join(unicodedata.normalize("NFKC", text).lower().split())
+
+
+def bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
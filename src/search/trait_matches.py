@@ -0,0 +1,211 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from src.model.cache import CachedTraits
+from src.model.chat import Recent
+from src.model.place import Place
+from src.model.trait_match import TraitMatch
+from src.search.ranker import ngram_order, place_vector, tf_vector, tfidf_score_matrix, top_k_indices
+from src.search.text import bigrams, normalize
+
+# 태그별로 저장할 장소 수
+TRAIT_MATCH_TOP_N = int(os.getenv("TRAIT_MATCH_TOP_N", "200"))
+# 한 번에 점수를 계산할 태그 수 (태그 수 x 장소 수 점수 행렬 크기 제한)
+TRAIT_MATCH_BATCH = 64
+
+# 캐시/대화 기록이 없어도 표를 만들 수 있도록 categories 체인이 자주 만드는 태그
+BASE_TRAITS = [
+    "자연", "풍경", "해변", "바다", "섬", "산", "등산", "트레킹", "숲", "호수", "계곡", "폭포", "동굴",
+    "온천", "힐링", "휴양", "정원", "공원", "꽃", "벚꽃", "단풍", "일출", "일몰", "야경", "드라이브", "캠핑",
+    "역사", "전통", "문화", "유적", "사찰", "궁궐", "성곽", "한옥", "박물관", "미술관", "예술", "건축",
+    "미식", "맛집", "시장", "카페", "쇼핑", "거리", "축제", "체험", "레저",
+]
+
+
+async def collect_trait_vocabulary() -> Dict[str, str]:
+    """
+    categories 체인이 만든 primary_traits 태그 수집 (캐시된 /traits 결과 + 대화 기록 + 기본 태그)
+
+    Returns:
+        Dict[str, str]: {정규화 태그: 원래 표기}
+    """
+    labels: List[str] = list(BASE_TRAITS)
+    labels += await CachedTraits.get_pymongo_collection().distinct("features.primary_traits")
+    labels += await Recent.get_pymongo_collection().distinct("categories.primary_traits")
+
+    vocabulary = {}
+    for label in labels:
+        if not isinstance(label, str):
+            continue
+        trait = normalize(label)
+        if trait:
+            vocabulary.setdefault(trait, label.strip())
+    return vocabulary
+
+
+def exact_postings(places: Sequence[Place], n: int) -> Dict[str, Set[int]]:
+    """장소 이름/설명의 실제 문자 n-gram -> 장소 위치 집합 (해시 버킷이 아닌 정확한 n-gram)"""
+    postings: Dict[str, Set[int]] = {}
+    for pos, place in enumerate(places):
+        text = normalize(place.name) + "|" + normalize(place.description)
+        grams = set(text) if n == 1 else bigrams(text)
+        for gram in grams:
+            postings.setdefault(gram, set()).add(pos)
+    return postings
+
+
+def score_traits(places: Sequence[Place], labels: Sequence[str], top_n: int) -> List[Tuple[List[int], List[float]]]:
+    """
+    태그마다 전체 장소와의 TF-IDF 유사도를 계산해 상위 top_n개 선택
+
+    해시 벡터는 버킷 충돌로 태그와 무관한 장소에도 점수를 주므로,
+    태그의 실제 n-gram을 모두 포함하는 장소만 남기고 TF-IDF 점수로 순위를 매깁니다.
+    한 글자 태그("산", "섬" 등)는 유니그램, 나머지는 바이그램으로 비교합니다.
+
+    Args:
+        places: 대상 장소 목록
+        labels: 태그 목록
+        top_n: 태그별 최대 장소 수
+
+    Returns:
+        List[Tuple[List[int], List[float]]]: 태그별 (장소 위치 목록, 점수 목록), 점수 0인 장소 제외
+    """
+    results: List[Tuple[List[int], List[float]]] = [([], [])] * len(labels)
+    for n in (1, 2):
+        indices = [i for i, label in enumerate(labels) if ngram_order(label) == n]
+        if not indices:
+            continue
+        doc_tf = np.stack([place_vector(place, n) for place in places])
+        postings = exact_postings(places, n)
+        for start in range(0, len(indices), TRAIT_MATCH_BATCH):
+            batch = indices[start:start + TRAIT_MATCH_BATCH]
+            queries = np.stack([tf_vector(labels[i], n) for i in batch])
+            for i, row in zip(batch, tfidf_score_matrix(doc_tf, queries)):
+                trait = normalize(labels[i])
+                grams = set(trait) if n == 1 else bigrams(trait)
+                eligible = set.intersection(*(postings.get(gram, set()) for gram in grams)) if grams else set()
+                mask = np.zeros(len(places), dtype=bool)
+                mask[list(eligible)] = True
+                row = np.where(mask, row, 0)
+                top = top_k_indices(row, top_n)
+                top = top[row[top] > 0]
+                results[i] = (top.tolist(), row[top].tolist())
+    return results
+
+
+async def build_trait_matches(top_n: int = TRAIT_MATCH_TOP_N) -> Dict[str, float]:
+    """
+    태그 -> 장소 순위 표(trait_matches)를 다시 생성 (오프라인 배치)
+
+    추천 후보와 같은 조건(주소가 있는 관광지)의 장소만 대상으로 하고,
+    이번 실행에 없는 태그 문서는 삭제합니다.
+
+    Args:
+        top_n: 태그별로 저장할 장소 수
+
+    Returns:
+        Dict[str, float]: 태그 수, 장소 수, 소요 시간(초)
+    """
+    start = time.perf_counter()
+    places = await Place.find({"type": "관광지"}, Place.address > "").sort(+Place.id).to_list()
+    vocabulary = await collect_trait_vocabulary()
+    if not places:
+        raise ValueError("태그 매칭 표를 만들 장소 데이터가 없습니다.")
+
+    traits = list(vocabulary)
+    # 행렬 계산은 CPU 작업이므로 이벤트 루프 밖에서 실행
+    rows = await asyncio.to_thread(score_traits, places, [vocabulary[trait] for trait in traits], top_n)
+
+    built_at = datetime.now()
+    operations = [
+        UpdateOne(
+            {"trait": trait},
+            {"$set": {
+                "label": vocabulary[trait],
+                "place_ids": [places[pos].id for pos in positions],
+                "scores": scores,
+                "built_at": built_at,
+            }},
+            upsert=True,
+        )
+        for trait, (positions, scores) in zip(traits, rows)
+    ]
+    await TraitMatch.get_pymongo_collection().bulk_write(operations, ordered=False)
+    await TraitMatch.find(TraitMatch.built_at < built_at).delete()
+    return {"traits": len(traits), "places": len(places), "seconds": time.perf_counter() - start}
+
+
+class TraitMatchTable:
+    """
+    trait_matches 컬렉션의 메모리 사본
+
+    태그마다 미리 계산한 장소 순위를 합산해 후보를 돌려주므로
+    요청마다 지역 정규식 조회나 전체 장소 랭킹을 하지 않습니다.
+    """
+
+    def __init__(self):
+        self._matches: Dict[str, Tuple[List[PydanticObjectId], List[float]]] = {}
+        self.built_at: Optional[datetime] = None
+        self.loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    async def load(self):
+        """표 전체를 다시 읽어 교체"""
+        matches = {}
+        built_at = None
+        async for match in TraitMatch.find_all():
+            matches[match.trait] = (match.place_ids, match.scores)
+            built_at = max(built_at, match.built_at) if built_at else match.built_at
+        self._matches = matches
+        self.built_at = built_at
+        self.loaded = True
+
+    async def reload_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.load()
+            except Exception as e:
+                print(f"trait match table reload failed: {e}")
+
+    def lookup(self, traits: Iterable[str], limit: int) -> List[Tuple[PydanticObjectId, float]]:
+        """
+        태그별 장소 점수를 합산해 상위 limit개 반환
+
+        Args:
+            traits: 여행지 특징 태그 목록 (primary_traits)
+            limit: 최대 반환 수
+
+        Returns:
+            List[Tuple[PydanticObjectId, float]]: (장소 ID, 합산 점수) 점수 내림차순, 표에 있는 태그가 없으면 빈 목록
+        """
+        totals: Dict[PydanticObjectId, float] = {}
+        for trait in traits:
+            match = self._matches.get(normalize(trait))
+            if match is None:
+                continue
+            for place_id, score in zip(*match):
+                totals[place_id] = totals.get(place_id, 0.0) + score
+
+        if not totals:
+            self.misses += 1
+            return []
+        self.hits += 1
+        return sorted(totals.items(), key=lambda item: -item[1])[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        return {"traits": len(self._matches), "hits": self.hits, "misses": self.misses}
+
+
+trait_match_table = TraitMatchTable()
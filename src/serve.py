@@ -0,0 +1,71 @@
+"""
+운영 서버 실행 (멀티 워커)
+
+워커 프로세스마다 app을 새로 import하고 lifespan에서 DB 연결 풀, OpenAI HTTP 클라이언트,
+장소 인덱스, planner 작업 워커를 따로 초기화합니다 (프로세스 간 공유 상태 없음).
+
+따라서 다음 상태도 워커마다 따로입니다.
+    - /metrics: 요청을 받은 워커의 값만 반환합니다. 모든 시계열에 worker(PID) 라벨이 붙으므로
+      nginx 뒤에서 수집해도 카운터가 섞이지 않으며, 조회 시 worker 라벨을 합칩니다
+      (예: sum by (endpoint) (rate(odegano_request_duration_seconds_count[5m]))).
+      워커마다 빠짐없이 수집하려면 워커별 포트로 띄우거나 각 컨테이너를 직접 수집합니다.
+    - 중복 요청 합치기(single-flight), 응답 캐시: 같은 워커에 들어온 요청끼리만 합쳐지는 최선 노력 방식입니다.
+      워커 간 중복 계획 저장은 planners.recent_id unique 인덱스와 planner 작업(planner_jobs) 중복 확인이 막습니다.
+
+    python -m src.serve
+
+환경 변수:
+    WEB_CONCURRENCY: 워커 수 (기본값: 사용 가능한 CPU 수)
+    HOST, PORT: 바인드 주소 (기본값: 0.0.0.0:80)
+"""
+import math
+import os
+
+import uvicorn
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "80"))
+# 유휴 keep-alive 연결 유지 시간 (nginx upstream keepalive_timeout보다 길게)
+KEEP_ALIVE_SECONDS = int(os.getenv("KEEP_ALIVE_SECONDS", "75"))
+# 종료 시 진행 중인 요청을 기다리는 시간 (이후 lifespan 종료 처리)
+GRACEFUL_SHUTDOWN_SECONDS = int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+
+
+def available_cpus() -> int:
+    """컨테이너 CPU 제한(cgroup)과 CPU affinity를 반영한 사용 가능 CPU 수"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # cgroup v2: "<quota> <period>" 또는 "max <period>"
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def worker_count() -> int:
+    """WEB_CONCURRENCY가 있으면 그 값, 없으면 사용 가능한 CPU 수"""
+    return int(os.getenv("WEB_CONCURRENCY") or available_cpus())
+
+
+def main():
+    uvicorn.run(
+        "src.main:app",
+        host=HOST,
+        port=PORT,
+        workers=worker_count(),
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_keep_alive=KEEP_ALIVE_SECONDS,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+
+if __name__ == "__main__":
+    main()